@@ -0,0 +1,2 @@
+from ._series import WeightSeries
+from ._lttb import lttb
@@ -0,0 +1,48 @@
+import numpy as np
+
+
+def lttb(x: np.ndarray, y: np.ndarray, threshold: int) -> np.ndarray:
+    """
+    Largest-Triangle-Three-Buckets downsampling: picks `threshold` points of a series that keep its visual
+    shape, so long series can be charted with a fixed number of points.
+
+    The first and last points are always kept. The other points are split into `threshold - 2` buckets and,
+    in each one, the point that forms the largest triangle with the point kept in the previous bucket and the
+    mean of the next bucket is kept. The areas of a bucket are computed at once with NumPy; only the walk
+    over the buckets, where each choice depends on the previous one, is a Python loop.
+
+    Args:
+        x (np.ndarray): The x coordinates, sorted, as numbers.
+        y (np.ndarray): The y coordinates.
+        threshold (int): Number of points to keep.
+
+    Returns:
+        np.ndarray: The indices of the kept points, sorted. All indices when the series is not longer than
+            the threshold.
+
+    Raises:
+        ValueError: If the threshold is lower than 3 or the coordinates have different lengths.
+    """
+    if len(x) != len(y):
+        raise ValueError('x and y must have the same length')
+    if threshold < 3:
+        raise ValueError('The threshold must be at least 3')
+    size = len(x)
+    if size <= threshold:
+        return np.arange(size)
+    x, y = np.asarray(x, dtype=np.float64), np.asarray(y, dtype=np.float64)
+    edges = np.linspace(1, size - 1, threshold - 1).astype(np.int64)
+    kept = np.empty(threshold, dtype=np.int64)
+    kept[0], kept[-1] = 0, size - 1
+    previous = 0
+    for bucket in range(threshold - 2):
+        start, end = edges[bucket], edges[bucket + 1]
+        following = slice(end, edges[bucket + 2]) if bucket + 2 < len(edges) else slice(size - 1, size)
+        mean_x, mean_y = x[following].mean(), y[following].mean()
+        areas = np.abs(
+            (x[previous] - mean_x) * (y[start:end] - y[previous])
+            - (x[previous] - x[start:end]) * (mean_y - y[previous])
+        )
+        previous = start + int(np.argmax(areas))
+        kept[bucket + 1] = previous
+    return kept
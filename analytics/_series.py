@@ -0,0 +1,172 @@
+import numpy as np
+from datetime import date
+from ._lttb import lttb
+
+
+WEIGHINGS = """
+SELECT created, weight FROM weighing
+WHERE id_profile = %s AND weight IS NOT NULL{0}
+ORDER BY created;
+"""
+
+HEIGHT = 'SELECT height FROM profiles WHERE id = %s;'
+
+DAY = np.timedelta64(1, 'D')
+
+
+class WeightSeries:
+    """
+    Weight history of a profile held in NumPy arrays, with vectorized analytics for trend and chart views.
+
+    Windows are given in days rather than in samples, since users weigh themselves at irregular intervals.
+
+    Attributes:
+        times (np.ndarray): When each weighing was logged, as `datetime64[s]`, in ascending order.
+        weights (np.ndarray): The weights, in kilograms.
+        height (float | None): The height of the profile, in meters, used for the BMI.
+    """
+
+    def __init__(self, times, weights, height: float = None):
+        """
+        Initializes the series, sorting it by time.
+
+        Args:
+            times (Iterable): When each weighing was logged, as datetimes or ISO strings.
+            weights (Iterable): The weights, in kilograms.
+            height (float, optional): The height of the profile, in meters.
+
+        Raises:
+            ValueError: If times and weights have different lengths.
+        """
+        times = np.array(times, dtype='datetime64[s]').reshape(-1)
+        weights = np.array(weights, dtype=np.float64).reshape(-1)
+        if len(times) != len(weights):
+            raise ValueError('times and weights must have the same length')
+        order = np.argsort(times, kind='stable')
+        self.times = times[order]
+        self.weights = weights[order]
+        self.height = float(height) if height else None
+
+    @classmethod
+    def load(cls, connector, id_profile: int, since: date = None) -> 'WeightSeries':
+        """
+        Loads the weighings of a profile and its height from the database.
+
+        Args:
+            connector (Connector): The connector of the database.
+            id_profile (int): The profile.
+            since (date, optional): First day to be loaded. Defaults to the whole history.
+
+        Returns:
+            WeightSeries: The series, empty if the profile has no weighings.
+        """
+        if since is None:
+            query, data = WEIGHINGS.format(''), (id_profile,)
+        else:
+            query, data = WEIGHINGS.format(' AND created >= %s'), (id_profile, connector.adapt(since))
+        rows = connector.fetch(query, data) or []
+        height = connector.fetch(HEIGHT, (id_profile,))
+        return cls([row[0] for row in rows], [row[1] for row in rows], height[0][0] if height else None)
+
+    def __len__(self) -> int:
+        return len(self.weights)
+
+    @property
+    def days(self) -> np.ndarray:
+        """
+        Time of each weighing in days since the first one.
+        """
+        if not len(self):
+            return np.zeros(0)
+        return (self.times - self.times[0]) / DAY
+
+    def __window_starts(self, days: float) -> np.ndarray:
+        """
+        Index of the first weighing within `days` before each weighing.
+        """
+        elapsed = self.days
+        return np.searchsorted(elapsed, elapsed - days, side='left')
+
+    def bmi(self) -> np.ndarray:
+        """
+        Body mass index of each weighing, using the height of the profile.
+
+        Returns:
+            np.ndarray: The BMI of each weighing, NaN when the profile has no height.
+        """
+        if not self.height:
+            return np.full(len(self), np.nan)
+        return self.weights / self.height ** 2
+
+    def moving_average(self, days: float = 7) -> np.ndarray:
+        """
+        Trailing moving average: the mean of the weighings logged within `days` before each weighing,
+        inclusive, computed with cumulative sums.
+
+        Args:
+            days (float, optional): Length of the window. Defaults to 7.
+
+        Returns:
+            np.ndarray: The average at each weighing.
+        """
+        if not len(self):
+            return np.zeros(0)
+        totals = np.concatenate(([0.0], np.cumsum(self.weights)))
+        ends = np.arange(1, len(self) + 1)
+        starts = self.__window_starts(days)
+        return (totals[ends] - totals[starts]) / (ends - starts)
+
+    def rate_of_change(self, days: float = 7) -> np.ndarray:
+        """
+        Rate of change of the moving average, in kilograms per week, between each weighing and the first
+        weighing within `days` before it.
+
+        Args:
+            days (float, optional): Length of the window, also used for the moving average. Defaults to 7.
+
+        Returns:
+            np.ndarray: The rate at each weighing, NaN where the window holds no earlier weighing.
+        """
+        if not len(self):
+            return np.zeros(0)
+        average, elapsed = self.moving_average(days), self.days
+        starts = self.__window_starts(days)
+        span = elapsed - elapsed[starts]
+        with np.errstate(divide='ignore', invalid='ignore'):
+            rate = (average - average[starts]) / span * 7
+        return np.where(span > 0, rate, np.nan)
+
+    def outliers(self, threshold: float = 3.5, days: float = 7) -> np.ndarray:
+        """
+        Flags weighings far from the trend, such as typing mistakes, with the modified z-score of their
+        distance to the moving average, based on the median absolute deviation.
+
+        Args:
+            threshold (float, optional): Modified z-score above which a weighing is flagged. Defaults to 3.5.
+            days (float, optional): Length of the moving average window. Defaults to 7.
+
+        Returns:
+            np.ndarray: A mask that is True on the outliers.
+        """
+        if not len(self):
+            return np.zeros(0, dtype=bool)
+        residuals = self.weights - self.moving_average(days)
+        deviations = np.abs(residuals - np.median(residuals))
+        mad = np.median(deviations)
+        if mad == 0:
+            return deviations > 0
+        return 0.6745 * deviations / mad > threshold
+
+    def downsample(self, points: int = 500) -> 'WeightSeries':
+        """
+        Reduces the series to at most `points` weighings with LTTB, keeping the shape of the curve, so charts
+        render quickly even with years of data.
+
+        Args:
+            points (int, optional): Maximum number of weighings kept. Defaults to 500.
+
+        Returns:
+            WeightSeries: The reduced series.
+        """
+        kept = lttb(self.days, self.weights, points)
+        return WeightSeries(self.times[kept], self.weights[kept], self.height)
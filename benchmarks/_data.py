@@ -0,0 +1,76 @@
+import random
+from datetime import date, datetime, timedelta
+from pathlib import Path
+
+
+PASSWORD = 'secret123'
+
+MEMORY = 'file:benchmarks?mode=memory&cache=shared'
+
+INSERT_USERS = 'INSERT INTO users (username, email, password) VALUES (%s, %s, %s);'
+
+INSERT_PROFILES = """
+INSERT INTO profiles (id_user, name, birth, gender, weight, height)
+VALUES ((SELECT id FROM users WHERE username = %s), %s, %s, %s, %s, %s);
+"""
+
+INSERT_WEIGHING = 'INSERT INTO weighing (id_profile, weight, created) VALUES (%s, %s, %s);'
+
+NAMES = ('Ana', 'Bruno', 'Carla', 'Diego', 'Elisa', 'Fabio', 'Gabriela', 'Heitor', 'Iara', 'Joao')
+
+SURNAMES = ('Silva', 'Santos', 'Oliveira', 'Souza', 'Lima', 'Pereira', 'Costa', 'Rodrigues')
+
+
+def username(number: int) -> str:
+    return f'user{number}'
+
+
+def email(number: int) -> str:
+    return f'user{number}@example.com'
+
+
+def configure(database: str):
+    # points the shared connector to a SQLite file, or to a shared in-memory database for ':memory:',
+    # so every pooled connection sees the same tables
+    from database import dbDev
+    if database == ':memory:':
+        dbDev.configure('sqlite', database=MEMORY, uri=True, min_size=1, max_size=8, slow_query=None)
+    else:
+        Path(database).unlink(missing_ok=True)
+        dbDev.configure('sqlite', database=database, timeout=30, min_size=1, max_size=8, slow_query=None)
+    return dbDev
+
+
+def populate(connector, users: int, weighings: int, seed: int = 42) -> None:
+    # the schema comes from the migrations, the same DDL the application runs on, and every user shares one
+    # pbkdf2 hash so seeding does not spend minutes hashing
+    from database import Migrator
+    from hashing import hasher
+    Migrator(connector).migrate()
+    generator = random.Random(seed)
+    hashed = hasher.hash(PASSWORD)
+    start = datetime(2022, 1, 1)
+    with connector.transaction() as tx:
+        tx.save_many(INSERT_USERS, [(username(n), email(n), hashed) for n in range(users)])
+        tx.save_many(INSERT_PROFILES, [
+            (
+                username(n),
+                f'{generator.choice(NAMES)} {generator.choice(SURNAMES)}',
+                connector.adapt(date(1960, 1, 1) + timedelta(days=generator.randrange(15000))),
+                generator.choice('FM'),
+                round(generator.uniform(50, 120), 1),
+                round(generator.uniform(1.5, 2.0), 2),
+            )
+            for n in range(users)
+        ])
+        ids = [row[0] for row in tx.fetch('SELECT id FROM profiles ORDER BY id;')]
+        for id_profile in ids:
+            weight = generator.uniform(50, 120)
+            tx.save_many(INSERT_WEIGHING, [
+                (
+                    id_profile,
+                    round(weight + generator.gauss(0, 1), 1),
+                    (start + timedelta(days=day, minutes=generator.randrange(1440))).isoformat(' ', 'seconds'),
+                )
+                for day in sorted(generator.sample(range(1000), weighings))
+            ])
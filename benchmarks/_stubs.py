@@ -0,0 +1,60 @@
+from types import SimpleNamespace
+
+
+class Page:
+    # stands in for ft.Page: counts the updates instead of sending them to a client
+    def __init__(self, route: str = '/'):
+        self.route = route
+        self.updates = 0
+        self.overlay = []
+        self.controls = []
+        self.views = []
+        self.data = {}
+        self.window = SimpleNamespace()
+        self.session = SimpleNamespace(get=self.data.get, set=self.data.__setitem__)
+        self.on_route_change = None
+
+    def update(self, *controls) -> None:
+        self.updates += 1
+
+    @property
+    def errors(self) -> list[str]:
+        # texts of the snack bars shown on the page
+        return [''.join(span.text for span in snack.content.spans) for snack in self.overlay]
+
+
+class Field:
+    # stands in for ft.TextField and ft.Dropdown, which the validators only read through label and value
+    def __init__(self, label: str, value: str | None = None):
+        self.label = label
+        self.value = value
+
+    def __repr__(self) -> str:
+        return f'Field({self.label!r}, {self.value!r})'
+
+
+def login_fields(username: str, password: str) -> tuple[Field, Field]:
+    return Field('Username', username), Field('Password', password)
+
+
+def profile_fields(
+        username: str,
+        email: str,
+        password: str = 'secret123',
+        name: str = 'Maria Silva',
+        birth: str = '15/03/1990',
+        gender: str = 'F',
+        weight: str = '68,5',
+        height: str = '1,68'
+) -> tuple[Field, ...]:
+    return (
+        Field('Name', name),
+        Field('Birth Date', birth),
+        Field('Username', username),
+        Field('Email', email),
+        Field('Password', password),
+        Field('Confirm Password', password),
+        Field('Gender', gender),
+        Field('Weight', weight),
+        Field('Height', height),
+    )
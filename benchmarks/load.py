@@ -0,0 +1,222 @@
+import json
+import time
+import random
+import asyncio
+import tempfile
+import argparse
+import itertools
+import threading
+from pathlib import Path
+from collections import Counter
+from . import _data
+from ._stubs import Page, login_fields, profile_fields
+
+
+FLOWS = ('login', 'register')
+
+
+def _percentile(latencies: list[float], percent: float) -> float:
+    if not latencies:
+        return float('nan')
+    ordered = sorted(latencies)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * percent / 100))]
+
+
+class Recorder:
+    # collects the outcome of every flow run by the sessions of one concurrency level
+    def __init__(self):
+        self.latencies = {flow: [] for flow in FLOWS}
+        self.errors = Counter()
+        self.failures = Counter()
+        self.lock = threading.Lock()
+
+    def record(self, flow: str, latency: float, error: str | None) -> None:
+        with self.lock:
+            self.latencies[flow].append(latency)
+            if error is not None:
+                self.failures[flow] += 1
+                self.errors[error.splitlines()[0][:80]] += 1
+
+    def summary(self, sessions: int, elapsed: float) -> dict:
+        rows = {}
+        for flow, latencies in [*self.latencies.items(), ('all', sum(self.latencies.values(), []))]:
+            failures = self.failures[flow] if flow != 'all' else sum(self.failures.values())
+            rows[flow] = {
+                'requests': len(latencies),
+                'throughput': round(len(latencies) / elapsed, 2),
+                'error_rate': round(failures / len(latencies), 4) if latencies else 0.0,
+                **{f'p{p}_ms': round(_percentile(latencies, p) * 1000, 2) for p in (50, 95, 99)},
+            }
+        return {'sessions': sessions, 'elapsed': round(elapsed, 2), 'flows': rows, 'errors': dict(self.errors)}
+
+
+class Workload:
+    # picks the flow of each request and the data it sends, the same way for the sync and async modes
+    def __init__(self, users: int, mix: float, seed: int):
+        self.users = users
+        self.mix = mix
+        self.random = random.Random(seed)
+        self.new = itertools.count(users)
+        self.lock = threading.Lock()
+
+    def next(self) -> tuple[str, tuple]:
+        with self.lock:
+            if self.random.random() < self.mix:
+                return 'login', login_fields(_data.username(self.random.randrange(self.users)), _data.PASSWORD)
+            number = next(self.new)
+        return 'register', profile_fields(_data.username(number), _data.email(number))
+
+
+def _outcome(page: Page, result) -> str | None:
+    # the flows report failures with a snack bar and return None, as they do in the views
+    if result:
+        return None
+    return page.errors[-1] if page.errors else 'no result'
+
+
+async def _run_async(workload: Workload, sessions: int, duration: float, think: float) -> dict:
+    # one event loop serves every session, as the Flet server does with the async handlers of the views
+    from validators import validate_fields, validate_profile_async
+    from functions import make_login_async, save_profile_async
+
+    async def login(page: Page, fields: tuple):
+        return validate_fields(page, *fields) and await make_login_async(page, *fields)
+
+    async def register(page: Page, fields: tuple):
+        if profile := await validate_profile_async(page, *fields):
+            await save_profile_async(page, *profile)
+            return not page.errors
+        return None
+
+    flows = {'login': login, 'register': register}
+    recorder, deadline = Recorder(), time.perf_counter() + duration
+
+    async def session():
+        while time.perf_counter() < deadline:
+            flow, fields = workload.next()
+            page, error, started = Page(), None, time.perf_counter()
+            try:
+                error = _outcome(page, await flows[flow](page, fields))
+            except Exception as exception:
+                error = f'{type(exception).__name__}: {exception}'
+            recorder.record(flow, time.perf_counter() - started, error)
+            if think:
+                await asyncio.sleep(think)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(session() for _ in range(sessions)))
+    return recorder.summary(sessions, time.perf_counter() - started)
+
+
+def _run_threads(workload: Workload, sessions: int, duration: float, think: float) -> dict:
+    # one thread per session driving the synchronous functions
+    from validators import validate_fields, validate_profile
+    from functions import make_login, save_profile
+
+    def login(page: Page, fields: tuple):
+        return validate_fields(page, *fields) and make_login(page, *fields)
+
+    def register(page: Page, fields: tuple):
+        if profile := validate_profile(page, *fields):
+            save_profile(page, *profile)
+            return not page.errors
+        return None
+
+    flows = {'login': login, 'register': register}
+    recorder, deadline = Recorder(), time.perf_counter() + duration
+
+    def session():
+        while time.perf_counter() < deadline:
+            flow, fields = workload.next()
+            page, error, started = Page(), None, time.perf_counter()
+            try:
+                error = _outcome(page, flows[flow](page, fields))
+            except Exception as exception:
+                error = f'{type(exception).__name__}: {exception}'
+            recorder.record(flow, time.perf_counter() - started, error)
+            if think:
+                time.sleep(think)
+
+    threads = [threading.Thread(target=session, daemon=True) for _ in range(sessions)]
+    started = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return recorder.summary(sessions, time.perf_counter() - started)
+
+
+def run(
+        levels: list[int],
+        duration: float,
+        mode: str = 'async',
+        mix: float = 0.8,
+        think: float = 0.0,
+        database: str = None,
+        users: int = 1000,
+        seed: int = 42
+) -> list[dict]:
+    from hashing import hasher
+    from database import usersIndex
+    connector = _data.configure(database or str(Path(tempfile.gettempdir()) / 'benchmarks-load.db'))
+    workload = Workload(users, mix, seed)
+    results = []
+    try:
+        _data.populate(connector, users, 10)
+        usersIndex.load()
+        hasher.verify(_data.PASSWORD, hasher.hash(_data.PASSWORD))  # starts the hashing workers
+        for sessions in levels:
+            if mode == 'async':
+                result = asyncio.run(_run_async(workload, sessions, duration, think))
+            else:
+                result = _run_threads(workload, sessions, duration, think)
+            results.append(result)
+            _print_level(result)
+    finally:
+        hasher.shutdown()
+        connector.close()
+    return results
+
+
+def _print_level(result: dict) -> None:
+    for flow, row in result['flows'].items():
+        print(
+            f"{result['sessions']:>8} {flow:<9}{row['requests']:>9}{row['throughput']:>10.1f}"
+            f"{row['p50_ms']:>10.1f}{row['p95_ms']:>10.1f}{row['p99_ms']:>10.1f}{row['error_rate']:>9.1%}",
+            flush=True
+        )
+    for error, count in sorted(result['errors'].items(), key=lambda item: -item[1])[:3]:
+        print(f"{'':>18}{count} x {error}")
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Simulates concurrent sessions logging in and registering against a SQLite database.'
+    )
+    parser.add_argument('--sessions', type=int, nargs='+', default=[1, 2, 4, 8, 16, 32],
+                        help='Concurrency levels, run one after the other.')
+    parser.add_argument('--duration', type=float, default=10, help='Seconds each concurrency level runs.')
+    parser.add_argument('--mode', choices=('async', 'threads'), default='async',
+                        help='async runs the handlers of the views on one event loop; threads runs the '
+                             'synchronous functions in one thread per session.')
+    parser.add_argument('--mix', type=float, default=0.8, help='Share of the requests that are logins.')
+    parser.add_argument('--think', type=float, default=0.0, help='Seconds a session waits between requests.')
+    parser.add_argument('--database', help='SQLite file, recreated on every run. Defaults to a temporary file.')
+    parser.add_argument('--users', type=int, default=1000, help='Number of synthetic users that log in.')
+    parser.add_argument('--slo', type=float, help='p95 latency, in ms, the highest sustained level is reported for.')
+    parser.add_argument('--save', help='JSON file that receives the results.')
+    args = parser.parse_args()
+
+    print(f"{'sessions':>8} {'flow':<9}{'requests':>9}{'req/s':>10}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}"
+          f"{'errors':>9}")
+    results = run(args.sessions, args.duration, args.mode, args.mix, args.think, args.database, args.users)
+
+    if args.slo is not None:
+        sustained = [r['sessions'] for r in results if r['flows']['all']['p95_ms'] <= args.slo]
+        print(f"highest level with p95 <= {args.slo} ms: {max(sustained) if sustained else 'none'} session(s)")
+    if args.save:
+        Path(args.save).write_text(json.dumps({'mode': args.mode, 'mix': args.mix, 'levels': results}, indent=2))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,72 @@
+import sys
+import json
+import argparse
+import statistics
+import subprocess
+from pathlib import Path
+
+
+ROOT = Path(__file__).resolve().parent.parent
+
+MODULES = ('main', 'flet', 'views', 'components', 'validators', 'functions', 'database', 'hashing', 'profiling')
+
+# modules that are only needed once a query, a hash or a bulk import actually runs
+DEFERRED = ('sqlite3', 'psycopg2', 'mysql.connector', 'numpy')
+
+PROBE = 'import json, sys, main; print(json.dumps([name for name in {0!r} if name in sys.modules]))'
+
+
+def _import_times() -> tuple[dict[str, float], list[str]]:
+    process = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', PROBE.format(DEFERRED)],
+        cwd=ROOT, capture_output=True, text=True, check=True
+    )
+    times = {}
+    for line in process.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, name = line.removeprefix('import time:').split('|')
+        times.setdefault(name.strip(), int(cumulative) / 1000)
+    return {name: times.get(name, 0.0) for name in MODULES}, json.loads(process.stdout)
+
+
+def measure(runs: int) -> dict:
+    samples, eager = [], set()
+    for _ in range(runs):
+        times, loaded = _import_times()
+        samples.append(times)
+        eager.update(loaded)
+    return {
+        'runs': runs,
+        'median_ms': {name: round(statistics.median(sample[name] for sample in samples), 2) for name in MODULES},
+        'min_ms': {name: round(min(sample[name] for sample in samples), 2) for name in MODULES},
+        'eager': sorted(eager),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Measures the import time of main.py in fresh interpreters.')
+    parser.add_argument('--runs', type=int, default=10, help='Number of interpreters started.')
+    parser.add_argument('--save', help='JSON file that receives the results, to be used as a baseline.')
+    parser.add_argument('--baseline', help='JSON file with previous results to compare against.')
+    parser.add_argument('--tolerance', type=float, default=0.2, help='Accepted slowdown of main over the baseline.')
+    args = parser.parse_args()
+
+    result = measure(args.runs)
+    print(f"{'module':<12}{'median ms':>12}{'min ms':>12}")
+    for name in MODULES:
+        print(f"{name:<12}{result['median_ms'][name]:>12.2f}{result['min_ms'][name]:>12.2f}")
+    print(f"loaded at startup: {', '.join(result['eager']) or 'none of ' + ', '.join(DEFERRED)}")
+
+    if args.save:
+        Path(args.save).write_text(json.dumps(result, indent=2))
+    if args.baseline:
+        baseline = json.loads(Path(args.baseline).read_text())
+        before, after = baseline['median_ms']['main'], result['median_ms']['main']
+        print(f'main: {before:.2f} ms -> {after:.2f} ms ({(after - before) / before:+.1%})')
+        if after > before * (1 + args.tolerance) or set(result['eager']) - set(baseline['eager']):
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,214 @@
+import sys
+import json
+import time
+import asyncio
+import sqlite3
+import argparse
+import platform
+import itertools
+import statistics
+from pathlib import Path
+from . import _data
+from ._stubs import Page, Field, login_fields, profile_fields
+
+
+COLUMN_SIZE = 10_000
+
+
+def _cases(users: int) -> dict[str, tuple]:
+    # the application modules read the shared connector, so they are only imported once it is configured
+    import validators
+    from database import dbDev
+    from functions import make_login, make_login_async, save_profile, list_profiles
+    from views import LoginView, NewProfileView, ProfilesView
+
+    loop = asyncio.new_event_loop()
+    numbers = itertools.count()
+    new = itertools.count(users)
+
+    def existing() -> int:
+        return next(numbers) % users
+
+    def run(coroutine):
+        return lambda *args: loop.run_until_complete(coroutine(*args))
+
+    def fresh_profile() -> tuple[Field, ...]:
+        number = next(new)
+        return profile_fields(_data.username(number), _data.email(number))
+
+    login = """
+    SELECT u.id, p.name, p.birth, u.username, u.email, u.password
+    FROM users u JOIN profiles p ON u.id = p.id_user
+    WHERE username = %s or email = %s
+    """
+    history = 'SELECT created, weight FROM weighing WHERE id_profile = %s ORDER BY created;'
+    weighing = 'INSERT INTO weighing (id_profile, weight) VALUES (%s, %s);'
+
+    names = [f'Maria Silva {chr(97 + n % 26)}' for n in range(COLUMN_SIZE)]
+    dates = [f'{n % 28 + 1:02}/{n % 12 + 1:02}/{1950 + n % 60}' for n in range(COLUMN_SIZE)]
+    emails = [_data.email(n) for n in range(COLUMN_SIZE)]
+    genders = ['FM'[n % 2] for n in range(COLUMN_SIZE)]
+    weights = [f'{50 + n % 70},{n % 10}' for n in range(COLUMN_SIZE)]
+
+    # name: (function, arguments built before each call, calls per repetition)
+    return {
+        'connector.fetch.login': (
+            lambda n: dbDev.fetch(login, (n, n), cached=False), lambda: _data.username(existing()), 200),
+        'connector.fetch.history': (
+            lambda n: dbDev.fetch(history, (n,), cached=False), lambda: existing() + 1, 200),
+        'connector.save.weighing': (
+            lambda n: dbDev.save(weighing, (n, 70.5)), lambda: existing() + 1, 200),
+        'make_login': (
+            lambda fields: make_login(Page(), *fields),
+            lambda: login_fields(_data.username(existing()), _data.PASSWORD), 10),
+        'make_login.wrong_password': (
+            lambda fields: make_login(Page(), *fields),
+            lambda: login_fields(_data.username(existing()), 'wrong'), 10),
+        'make_login.unknown_user': (
+            lambda fields: make_login(Page(), *fields), lambda: login_fields('nobody', 'wrong'), 200),
+        'make_login_async': (
+            run(lambda fields: make_login_async(Page(), *fields)),
+            lambda: login_fields(_data.username(existing()), _data.PASSWORD), 10),
+        'list_profiles': (list_profiles, existing, 200),
+        'save_profile': (
+            lambda values: save_profile(Page(), *values),
+            lambda: [field.value for field in fresh_profile() if field.label != 'Confirm Password'], 50),
+        'validators.validate_fields': (
+            lambda fields: validators.validate_fields(Page(), *fields), fresh_profile, 1000),
+        'validators.validate_name': (
+            lambda field: validators.validate_name(Page(), field), lambda: Field('Name', 'Maria Silva'), 1000),
+        'validators.validate_date': (
+            lambda field: validators.validate_date(Page(), field), lambda: Field('Birth', '15/03/1990'), 1000),
+        'validators.validate_gender': (
+            lambda field: validators.validate_gender(Page(), field), lambda: Field('Gender', 'F'), 1000),
+        'validators.validate_biometric': (
+            lambda field: validators.validate_biometric(Page(), field, 'weight'),
+            lambda: Field('Weight', '68,5'), 1000),
+        'validators.validate_username': (
+            lambda field: validators.validate_username(Page(), field),
+            lambda: Field('Username', _data.username(existing())), 200),
+        'validators.validate_username_async': (
+            run(lambda field: validators.validate_username_async(Page(), field)),
+            lambda: Field('Username', _data.username(existing())), 200),
+        'validators.validate_email': (
+            lambda field: validators.validate_email(Page(), field),
+            lambda: Field('Email', _data.email(existing())), 200),
+        'validators.validate_email_async': (
+            run(lambda field: validators.validate_email_async(Page(), field)),
+            lambda: Field('Email', _data.email(existing())), 200),
+        'validators.validate_password': (
+            lambda fields: validators.validate_password(Page(), *fields),
+            lambda: (Field('Password', 'secret123'), Field('Confirm', 'secret123')), 10),
+        'validators.validate_password_async': (
+            run(lambda fields: validators.validate_password_async(Page(), *fields)),
+            lambda: (Field('Password', 'secret123'), Field('Confirm', 'secret123')), 10),
+        'validators.validate_profile': (
+            lambda fields: validators.validate_profile(Page(), *fields), fresh_profile, 10),
+        'validators.validate_profile.invalid': (
+            lambda fields: validators.validate_profile(Page(), *fields),
+            lambda: profile_fields(_data.username(existing()), 'not an email', password='123'), 200),
+        'validators.validate_profile_async': (
+            run(lambda fields: validators.validate_profile_async(Page(), *fields)), fresh_profile, 10),
+        'validators.validate_name_column': (validators.validate_name_column, lambda: names, 10),
+        'validators.validate_date_column': (validators.validate_date_column, lambda: dates, 10),
+        'validators.validate_email_column': (validators.validate_email_column, lambda: emails, 10),
+        'validators.validate_gender_column': (validators.validate_gender_column, lambda: genders, 10),
+        'validators.validate_biometric_column': (
+            lambda values: validators.validate_biometric_column(values, 'weight'), lambda: weights, 10),
+        'views.LoginView': (LoginView, Page, 200),
+        'views.NewProfileView': (NewProfileView, Page, 200),
+        'views.ProfilesView': (ProfilesView, Page, 200),
+    }
+
+
+def _time(function, arguments, number: int, repeat: int) -> list[float]:
+    # the arguments are built before each repetition, out of the measured time
+    function(arguments())
+    samples = []
+    for _ in range(repeat):
+        calls = [arguments() for _ in range(number)]
+        started = time.perf_counter()
+        for argument in calls:
+            function(argument)
+        samples.append((time.perf_counter() - started) / number * 1000)
+    return samples
+
+
+def measure(database: str, users: int, weighings: int, repeat: int, only: str = None) -> dict:
+    from hashing import hasher
+    from database import usersIndex
+    connector = _data.configure(database)
+    try:
+        _data.populate(connector, users, weighings)
+        usersIndex.load()
+        cases = {name: case for name, case in _cases(users).items() if not only or only in name}
+        results = {}
+        for name, (function, arguments, number) in cases.items():
+            samples = _time(function, arguments, number, repeat)
+            results[name] = {
+                'number': number,
+                'median_ms': round(statistics.median(samples), 4),
+                'min_ms': round(min(samples), 4),
+            }
+            print(f"{name:<42}{results[name]['median_ms']:>12.4f}{results[name]['min_ms']:>12.4f}", flush=True)
+    finally:
+        hasher.shutdown()
+        connector.close()
+    return {
+        'environment': {
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'sqlite': sqlite3.sqlite_version,
+            'pbkdf2_rounds': hasher.rounds,
+        },
+        'database': database,
+        'users': users,
+        'weighings': weighings,
+        'repeat': repeat,
+        'cases': results,
+    }
+
+
+def compare(baseline: dict, result: dict, tolerance: float) -> list[str]:
+    slower = []
+    print(f"\n{'case':<42}{'baseline ms':>12}{'current ms':>12}{'change':>10}")
+    for name, current in result['cases'].items():
+        if (before := baseline['cases'].get(name)) is None:
+            continue
+        change = (current['median_ms'] - before['median_ms']) / before['median_ms']
+        flag = change > tolerance
+        if flag:
+            slower.append(name)
+        print(f"{name:<42}{before['median_ms']:>12.4f}{current['median_ms']:>12.4f}{change:>+10.1%}"
+              f"{'  SLOWER' if flag else ''}")
+    for key in ('environment', 'database', 'users', 'weighings'):
+        if baseline.get(key) != result[key]:
+            print(f'warning: the baseline was measured with a different {key}')
+    return slower
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Measures the database, login, validators and views on SQLite.')
+    parser.add_argument('--database', default=':memory:', help="SQLite file, recreated on every run, or ':memory:'.")
+    parser.add_argument('--users', type=int, default=1000, help='Number of synthetic users and profiles.')
+    parser.add_argument('--weighings', type=int, default=50, help='Number of synthetic weighings per profile.')
+    parser.add_argument('--repeat', type=int, default=5, help='Repetitions of each case; the median is reported.')
+    parser.add_argument('--filter', help='Only runs the cases whose name contains this text.')
+    parser.add_argument('--save', help='JSON file that receives the results, to be used as a baseline.')
+    parser.add_argument('--baseline', help='JSON file with previous results to compare against.')
+    parser.add_argument('--tolerance', type=float, default=0.2, help='Accepted slowdown of a case over the baseline.')
+    args = parser.parse_args()
+
+    print(f"{'case':<42}{'median ms':>12}{'min ms':>12}")
+    result = measure(args.database, args.users, args.weighings, args.repeat, args.filter)
+
+    if args.save:
+        Path(args.save).write_text(json.dumps(result, indent=2))
+    if args.baseline:
+        if slower := compare(json.loads(Path(args.baseline).read_text()), result, args.tolerance):
+            print(f"{len(slower)} case(s) slower than the baseline: {', '.join(slower)}")
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
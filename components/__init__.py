@@ -26,8 +26,9 @@ from flet_core import (
     dropdown
 )
 
+from ._updates import batch_updates, refresh
 from ._window import app_window
 from ._page import app_page
-from ._heading import top_heading
+from ._heading import heading, top_heading
 from ._snack_bar import snack_bar
 from ._fields import text_field, dropdown_field
@@ -1,8 +1,13 @@
 from components import *
 
 
-def top_heading(page: Page, text: str):
+def heading(text: str) -> Column:
     foreground = Paint(color=colors.INDIGO, stroke_width=6, stroke_join=StrokeJoin.ROUND,style=PaintingStyle.STROKE)
     stack_1 = Text(spans=[TextSpan(text, TextStyle(size=32,weight=FontWeight.BOLD,foreground=foreground))])
     stack_2 = Text(spans=[TextSpan(text, TextStyle(size=32, weight=FontWeight.BOLD, color=colors.WHITE))])
-    page.add(Column(controls=[Stack([stack_1, stack_2]), Divider()], horizontal_alignment=CrossAxisAlignment.CENTER))
+    return Column(controls=[Stack([stack_1, stack_2]), Divider()], horizontal_alignment=CrossAxisAlignment.CENTER)
+
+
+def top_heading(page: Page, text: str):
+    page.controls.append(heading(text))
+    refresh(page)
@@ -5,4 +5,4 @@ def app_page(page: Page):
     page.horizontal_alignment = MainAxisAlignment.CENTER
     page.vertical_alignment = CrossAxisAlignment.START
     page.bgcolor = colors.BLUE_GREY_50
-    page.update()
+    refresh(page)
@@ -9,4 +9,4 @@ def snack_bar(page: Page, message: str, function: Callable) -> None:
     snack = SnackBar(snack_tex, bgcolor=colors.INDIGO, show_close_icon=True, close_icon_color=colors.WHITE, open=True)
     page.overlay.clear()
     page.overlay.append(snack)
-    page.update()
+    refresh(page)
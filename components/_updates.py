@@ -0,0 +1,30 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+from flet_core import Page
+
+
+# the pages whose updates are being deferred in the current task or thread
+_batches: ContextVar[tuple[list, ...]] = ContextVar('_batches', default=())
+
+
+def refresh(page: Page) -> None:
+    for batch in _batches.get():
+        if batch[0] is page:
+            batch[1] = True
+            return
+    page.update()
+
+
+@contextmanager
+def batch_updates(page: Page):
+    if any(batch[0] is page for batch in _batches.get()):
+        yield page
+        return
+    batch = [page, False]
+    token = _batches.set((*_batches.get(), batch))
+    try:
+        yield page
+    finally:
+        _batches.reset(token)
+        if batch[1]:
+            page.update()
@@ -7,4 +7,4 @@ def app_window(page: Page, width: int, height: int) -> None:
     page.window.resizable = False
     page.window.maximizable = False
     page.window.alignment = alignment.top_right
-    page.update()
+    refresh(page)
@@ -1,15 +1,37 @@
 import os
 from dotenv import load_dotenv
 from pathlib import Path
-from ._factory import Database
+from ._factory import Database, parse_replicas
+from ._lazy import LazyConnector
+from ._replicas import ReplicatedConnector
+from ._async import AsyncConnector
+from ._transaction import Transaction
+from ._metrics import QueryMetrics
+from ._migrations import Migrator
+from ._rollups import WeighingRollups
+from ._write_behind import WriteBehind
+from ._bloom import BloomFilter
+from ._uniqueness import UniquenessIndex
 
 
 load_dotenv(dotenv_path=Path(__file__).parent.parent / '.env')
 
 
-dbDev = Database(
+dbDev = LazyConnector(
     'mysql',
     database=os.getenv("DATABASE"),
     user=os.getenv("USER"),
     password=os.getenv("PASSWORD"),
+    cache_size=int(os.getenv("QUERY_CACHE_SIZE", 0)),
+    cache_ttl=float(os.getenv("QUERY_CACHE_TTL", 30)),
+    # an empty value or 0 turns the slow query log off
+    slow_query=float(os.getenv("SLOW_QUERY_SECONDS", 1) or 0) or None,
+    replicas=parse_replicas(os.getenv("DATABASE_REPLICAS")),
+    routing=os.getenv("DATABASE_ROUTING", 'round_robin'),
 )
+
+
+dbDevAsync = AsyncConnector(dbDev)
+
+
+usersIndex = UniquenessIndex(dbDev, 'users', ('username', 'email'))
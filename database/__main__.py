@@ -0,0 +1,49 @@
+import argparse
+from database import dbDev, Migrator, WeighingRollups
+
+
+def main():
+    parser = argparse.ArgumentParser(prog='python -m database', description='Manages the application database.')
+    parser.add_argument('--driver', choices=['sqlite', 'mysql', 'postgres'],
+                        help='Database driver. Defaults to the database configured in the .env file.')
+    parser.add_argument('--database', help='Database name, or file for SQLite.')
+    parser.add_argument('--user', help='Database user.')
+    parser.add_argument('--password', help='Database password.')
+    parser.add_argument('--host', help='Database host.')
+    commands = parser.add_subparsers(dest='command', required=True)
+    migrate = commands.add_parser('migrate', help='Applies the pending migrations.')
+    migrate.add_argument('--target', type=int, help='Last version to be applied.')
+    commands.add_parser('status', help='Shows the applied and pending migrations.')
+    rollups = commands.add_parser('rollups', help='Rebuilds the weighing rollups from the weighing log.')
+    rollups.add_argument('--profile', type=int, help='Only rebuilds the rollups of this profile.')
+    admin = commands.add_parser('admin', help='Grants or revokes access to the admin views.')
+    admin.add_argument('username', help='The user to be changed.')
+    admin.add_argument('--revoke', action='store_true', help='Revokes the access instead of granting it.')
+    args = parser.parse_args()
+
+    if args.driver:
+        params = {key: getattr(args, key) for key in ('database', 'user', 'password', 'host') if getattr(args, key)}
+        dbDev.configure(args.driver, **params)
+    migrator = Migrator(dbDev)
+
+    match args.command:
+        case 'migrate':
+            applied = migrator.migrate(args.target)
+            for version, name in applied:
+                print(f'applied {version:04d} {name}')
+            print(f'schema at version {migrator.current}' if applied else 'nothing to migrate')
+        case 'status':
+            applied = set(migrator.applied())
+            for version, name, _ in migrator.migrations():
+                print(f"{'applied' if version in applied else 'pending'} {version:04d} {name}")
+        case 'rollups':
+            print(f'{WeighingRollups(dbDev).rebuild(args.profile)} rollup rows written')
+        case 'admin':
+            if not dbDev.fetch('SELECT id FROM users WHERE username = %s;', (args.username,), primary=True):
+                parser.exit(1, f'user {args.username} does not exist\n')
+            dbDev.save('UPDATE users SET is_admin = %s WHERE username = %s;', (not args.revoke, args.username))
+            print(f"{'revoked' if args.revoke else 'granted'} admin access for {args.username}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,119 @@
+import asyncio
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from profiling import tracer
+from ._singleton import Connector
+
+
+class AsyncConnector:
+    """
+    Asyncio counterpart of a Connector, meant to be awaited from async Flet event handlers.
+
+    The drivers in use are blocking, so every operation runs the wrapped connector on a dedicated thread pool
+    and the event loop stays free to serve the UI while the database round trip is in progress.
+
+    Attributes:
+        connector (Connector): The synchronous connector that executes the queries.
+        max_workers (int | None): Number of worker threads. None uses the maximum size of the connector's pool.
+        executor (ThreadPoolExecutor): The threads on which the queries are executed.
+    """
+
+    def __init__(self, connector: Connector, max_workers: int = None):
+        """
+        Initializes the asynchronous connector. The worker threads are only started on the first query.
+
+        Args:
+            connector (Connector): The synchronous connector to be wrapped.
+            max_workers (int, optional): Number of worker threads. Defaults to the maximum size of the
+                connector's pool, since more threads would only wait for a free connection.
+        """
+        self.connector = connector
+        self.max_workers = max_workers
+        self.__executor = None
+        self.__lock = threading.Lock()
+
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        """
+        The worker threads, created on first use.
+        """
+        with self.__lock:
+            if self.__executor is None:
+                self.__executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers or self.connector.pool.max_size,
+                    thread_name_prefix='database'
+                )
+            return self.__executor
+
+    async def __run(self, function, *args):
+        """
+        Runs a blocking connector method on the executor and waits for its result.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, functools.partial(function, *args))
+
+    @tracer.trace('db')
+    async def create(self, query: str):
+        """
+        Creates a new table or executes a similar schema-altering query.
+
+        Args:
+            query (str): The SQL query to create a table or perform schema operations.
+        """
+        await self.__run(self.connector.create, query)
+
+    @tracer.trace('db')
+    async def save(self, query: str, data: tuple):
+        """
+        Inserts or updates data in the database.
+
+        Args:
+            query (str): The SQL query for inserting or updating.
+            data (tuple): The data to be inserted or updated.
+
+        Returns:
+            list[tuple] | None: The result of the query execution.
+        """
+        return await self.__run(self.connector.save, query, data)
+
+    @tracer.trace('db')
+    async def fetch(self, query: str, data: tuple = None, cached: bool = True, primary: bool = False):
+        """
+        Fetches data from the database, or from the result cache when it is enabled.
+
+        Args:
+            query (str): The SQL query for fetching data.
+            data (tuple, optional): Parameters for the query, if needed.
+            cached (bool, optional): Whether the result may come from and be stored in the cache.
+                Defaults to True.
+            primary (bool, optional): Whether the read must see the latest data, skipping the cache and the
+                read replicas. Defaults to False.
+
+        Returns:
+            list[tuple] | None: The fetched result, or None if no result was found.
+        """
+        return await self.__run(self.connector.fetch, query, data, cached, primary)
+
+    @tracer.trace('db')
+    async def run(self, function, *args):
+        """
+        Runs any blocking database work, such as a function that opens a transaction, on the worker threads.
+
+        Args:
+            function (Callable): The blocking function.
+            *args: Arguments for the function.
+
+        Returns:
+            Any: The value returned by the function.
+        """
+        return await self.__run(function, *args)
+
+    def close(self) -> None:
+        """
+        Stops the worker threads once the pending queries finish.
+        """
+        with self.__lock:
+            executor, self.__executor = self.__executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
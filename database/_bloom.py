@@ -0,0 +1,56 @@
+import math
+import hashlib
+
+
+class BloomFilter:
+    """
+    Probabilistic set membership: answers "definitely absent" or "maybe present" using a fixed bit array.
+
+    Attributes:
+        capacity (int): Number of items the filter was sized for.
+        error_rate (float): False positive rate expected when holding `capacity` items.
+        size (int): Number of bits in the array.
+        hashes (int): Number of bit positions set for each item.
+        count (int): Number of items added.
+    """
+
+    def __init__(self, capacity: int, error_rate: float = 0.01):
+        """
+        Sizes the bit array for the expected number of items and false positive rate.
+
+        Args:
+            capacity (int): Expected number of items.
+            error_rate (float, optional): Accepted false positive rate. Defaults to 0.01.
+        """
+        self.capacity = max(capacity, 1)
+        self.error_rate = error_rate
+        self.size = max(int(-self.capacity * math.log(error_rate) / math.log(2) ** 2), 8)
+        self.hashes = max(round(self.size / self.capacity * math.log(2)), 1)
+        self.count = 0
+        self.__bits = bytearray((self.size + 7) // 8)
+
+    def __positions(self, item: str):
+        """
+        Yields the bit positions of an item, derived from one blake2b digest by double hashing.
+        """
+        digest = hashlib.blake2b(item.encode(), digest_size=16).digest()
+        first, second = int.from_bytes(digest[:8], 'little'), int.from_bytes(digest[8:], 'little') | 1
+        for i in range(self.hashes):
+            yield (first + i * second) % self.size
+
+    def add(self, item: str) -> None:
+        """
+        Adds an item to the filter.
+
+        Args:
+            item (str): The item to be added.
+        """
+        for position in self.__positions(item):
+            self.__bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def __contains__(self, item: str) -> bool:
+        """
+        Checks whether an item may have been added. False is always correct; True may be a false positive.
+        """
+        return all(self.__bits[position >> 3] & (1 << (position & 7)) for position in self.__positions(item))
@@ -0,0 +1,182 @@
+import re
+import time
+import threading
+from collections import OrderedDict
+
+
+TABLES = re.compile(
+    r'\b(?:from|join|into|update|table(?:\s+if\s+(?:not\s+)?exists)?)\s+[`"]?(\w+)',
+    re.IGNORECASE
+)
+
+# tables written by the database itself when another table is written: the weighing triggers of profiles
+# (migration 0001), the rollup trigger of weighing (migration 0004) and the `on delete cascade` foreign keys
+DEPENDENCIES = {
+    'users': frozenset({'profiles'}),
+    'profiles': frozenset({'weighing', 'weighing_rollups'}),
+    'weighing': frozenset({'weighing_rollups'}),
+}
+
+
+def normalize(query: str) -> str:
+    """
+    Collapses the whitespace of a query, so the same statement written with different layout shares one entry.
+
+    Args:
+        query (str): The SQL query.
+
+    Returns:
+        str: The normalized query.
+    """
+    return ' '.join(query.split()).rstrip(';')
+
+
+def tables(query: str) -> frozenset[str]:
+    """
+    Lists the tables a query reads from or writes to.
+
+    Args:
+        query (str): The SQL query.
+
+    Returns:
+        frozenset[str]: The lower-cased table names. Empty when none could be recognized, e.g. for a CALL.
+    """
+    return frozenset(name.lower() for name in TABLES.findall(query))
+
+
+def affected(written: frozenset[str], dependencies: dict[str, frozenset[str]]) -> frozenset[str]:
+    """
+    Adds to the tables written by a query the ones written in turn by triggers and cascades.
+
+    Args:
+        written (frozenset[str]): The tables named in the query.
+        dependencies (dict[str, frozenset[str]]): The tables each table's writes reach.
+
+    Returns:
+        frozenset[str]: Every table whose content may have changed.
+    """
+    found, pending = set(written), list(written)
+    while pending:
+        for table in dependencies.get(pending.pop(), ()):
+            if table not in found:
+                found.add(table)
+                pending.append(table)
+    return frozenset(found)
+
+
+class QueryCache:
+    """
+    Bounded LRU cache of fetch results, with expiry and invalidation by table.
+
+    Entries are keyed by the normalized query and its parameters. A write to a table drops every entry that
+    read from it or from the tables its triggers and cascades write to, declared in `dependencies`; writes
+    whose tables cannot be recognized (such as stored procedure calls) clear the cache.
+
+    Attributes:
+        max_size (int): Maximum number of cached results.
+        ttl (float): Seconds a result stays valid.
+        hits (int): Number of lookups answered from the cache.
+        misses (int): Number of lookups that had to go to the database.
+        dependencies (dict[str, frozenset[str]]): The tables written by the database when each table is written.
+        invalidated (float): `time.monotonic()` of the last invalidation, or 0 if there was none.
+    """
+
+    def __init__(self, max_size: int = 1024, ttl: float = 30.0, dependencies: dict[str, frozenset[str]] = None):
+        """
+        Initializes an empty cache.
+
+        Args:
+            max_size (int, optional): Maximum number of cached results. Defaults to 1024.
+            ttl (float, optional): Seconds a result stays valid. Defaults to 30.
+            dependencies (dict[str, frozenset[str]], optional): The tables written by triggers and cascades when
+                each table is written. Defaults to `DEPENDENCIES`, the ones of the application schema.
+        """
+        self.max_size = max_size
+        self.ttl = ttl
+        self.dependencies = DEPENDENCIES if dependencies is None else dependencies
+        self.hits = 0
+        self.misses = 0
+        self.invalidated = 0.0
+        self.__entries: OrderedDict[tuple, tuple[float, frozenset, list]] = OrderedDict()
+        self.__generation = 0
+        self.__lock = threading.Lock()
+
+    @staticmethod
+    def key(query: str, data: tuple = None) -> tuple:
+        """
+        Builds the cache key of a query.
+
+        Args:
+            query (str): The SQL query.
+            data (tuple, optional): The query parameters.
+
+        Returns:
+            tuple: The key.
+        """
+        return normalize(query), tuple(data) if data else ()
+
+    @property
+    def generation(self) -> int:
+        """
+        Counter increased by every invalidation. Read it before running a query and pass it to `put`, so a
+        result fetched while a write was happening is not stored.
+        """
+        return self.__generation
+
+    def get(self, key: tuple) -> list | None:
+        """
+        Looks up a result.
+
+        Args:
+            key (tuple): The key built by `key`.
+
+        Returns:
+            list | None: A copy of the cached rows, or None if absent or expired.
+        """
+        with self.__lock:
+            entry = self.__entries.get(key)
+            if entry is None or entry[0] < time.monotonic():
+                if entry is not None:
+                    del self.__entries[key]
+                self.misses += 1
+                return None
+            self.__entries.move_to_end(key)
+            self.hits += 1
+            return list(entry[2])
+
+    def put(self, key: tuple, rows: list | None, generation: int, ttl: float = None) -> None:
+        """
+        Stores a result, evicting the least recently used entry when the cache is full.
+
+        Args:
+            key (tuple): The key built by `key`.
+            rows (list | None): The fetched rows.
+            generation (int): The `generation` read before the query was executed.
+            ttl (float, optional): Seconds this result stays valid, when shorter than the cache's `ttl`.
+        """
+        ttl = self.ttl if ttl is None else min(ttl, self.ttl)
+        with self.__lock:
+            if generation != self.__generation or rows is None:
+                return
+            self.__entries[key] = (time.monotonic() + ttl, tables(key[0]), list(rows))
+            self.__entries.move_to_end(key)
+            while len(self.__entries) > self.max_size:
+                self.__entries.popitem(last=False)
+
+    def invalidate(self, query: str = None) -> None:
+        """
+        Drops the entries that read from the tables written by a query.
+
+        Args:
+            query (str, optional): The write query. When omitted, or when no table is recognized in it,
+                the whole cache is cleared.
+        """
+        written = affected(tables(query), self.dependencies) if query else frozenset()
+        with self.__lock:
+            self.__generation += 1
+            self.invalidated = time.monotonic()
+            if not written:
+                self.__entries.clear()
+                return
+            for key in [key for key, entry in self.__entries.items() if entry[1] & written]:
+                del self.__entries[key]
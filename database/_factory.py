@@ -1,39 +1,90 @@
+import json
 from typing import Literal
 from ._objects import SQLiteConnector, MySQLConnector, PostgreSQLConnector
+from ._replicas import ReplicatedConnector
+
+
+CONNECTORS = {
+    'sqlite': SQLiteConnector,
+    'mysql': MySQLConnector,
+    'postgres': PostgreSQLConnector,
+}
+
+
+def parse_replicas(value: str | None) -> list[dict]:
+    """
+    Reads the read replicas of an environment variable: either a comma-separated list of hosts, which share
+    every other parameter with the primary, or a JSON list with the full parameters of each replica.
+
+    Args:
+        value (str | None): The value of the variable.
+
+    Returns:
+        list[dict]: The parameters of each replica, empty when none is configured.
+
+    Raises:
+        ValueError: If the JSON is not a list of objects.
+
+    Examples:
+        >> parse_replicas('replica1, replica2')
+        [{'host': 'replica1'}, {'host': 'replica2'}]
+        >> parse_replicas('[{"host": "replica1", "port": 3307}, {"database": "copy.db"}]')
+        [{'host': 'replica1', 'port': 3307}, {'database': 'copy.db'}]
+    """
+    value = (value or '').strip()
+    if not value.startswith('['):
+        return [{'host': host.strip()} for host in value.split(',') if host.strip()]
+    replicas = json.loads(value)
+    if not all(isinstance(replica, dict) for replica in replicas):
+        raise ValueError('DATABASE_REPLICAS must be a list of objects')
+    return replicas
 
 
 class Database:
     """
-    Provides a Singleton interface for selecting and using different database connectors.
+    Factory that selects and creates the database connector for a driver, optionally with read replicas.
 
-    Attributes:
-        __instance (Connector): The single instance of the chosen database connector.
+    Each call creates a new connector; the application shares one through the `LazyConnector` in `dbDev`.
     """
-    __instance = None
 
-    def __new__(cls, __driver: Literal['sqlite', 'mysql','postgres'], *args, **kwargs):
+    def __new__(
+            cls,
+            __driver: Literal['sqlite', 'mysql', 'postgres'],
+            *args,
+            replicas: list[dict] = None,
+            routing: Literal['round_robin', 'least_latency'] = 'round_robin',
+            **kwargs
+    ):
         """
         Selects the appropriate database connector based on the provided driver.
 
         Args:
             __driver (Literal['sqlite', 'mysql', 'postgres']): The database driver type.
             *args: Positional arguments for the database connector.
+            replicas (list[dict], optional): The connection parameters of each read replica, applied over the
+                parameters of the primary, so usually only the host (or the file, for SQLite) is given.
+                Defaults to None, which creates a single connector.
+            routing (Literal['round_robin', 'least_latency'], optional): How a replica is picked for each read.
+                Defaults to 'round_robin'.
             **kwargs: Keyword arguments for the database connector.
 
         Returns:
-            Connector: The selected database connector instance.
+            Connector | ReplicatedConnector: The selected database connector, or a router over the primary and
+                its replicas when replicas are given.
 
         Raises:
-            ValueError: If an unsupported database driver is provided.
+            ValueError: If an unsupported database driver or routing is provided, or a SQLite replica does not
+                name its database file.
+
+        Examples:
+            >> Database('mysql', database='app', host='primary', replicas=[{'host': 'replica1'}, {'host': 'replica2'}])
+            >> Database('sqlite', database='app.db', replicas=[{'database': 'copy.db'}], routing='least_latency')
         """
-        if cls.__instance is None:
-            match __driver:
-                case 'sqlite':
-                    cls.__instance = SQLiteConnector(**kwargs)
-                case 'mysql':
-                    cls.__instance = MySQLConnector(**kwargs)
-                case 'postgres':
-                    cls.__instance = PostgreSQLConnector(**kwargs)
-                case _:
-                    raise ValueError(f'Unsupported database driver: {__driver}')
-        return cls.__instance
+        if (connector := CONNECTORS.get(__driver)) is None:
+            raise ValueError(f'Unsupported database driver: {__driver}')
+        if not replicas:
+            return connector(**kwargs)
+        if __driver == 'sqlite' and any('database' not in replica for replica in replicas):
+            raise ValueError('SQLite replicas must name their database file')
+        primary = connector(**kwargs)
+        return ReplicatedConnector(primary, [connector(**{**kwargs, **replica}) for replica in replicas], routing)
@@ -0,0 +1,70 @@
+import threading
+from typing import Literal
+from ._factory import Database
+
+
+class LazyConnector:
+    """
+    Stand-in for a connector that is only created through the `Database` factory on first use, so importing
+    the modules that share it costs nothing until a query actually runs.
+
+    Every attribute not defined here is read from the real connector, so the stand-in is used exactly like
+    the connector it represents.
+
+    Examples:
+        >> dbDev = LazyConnector('mysql', database='app')
+        >> dbDev.configure('sqlite', database='app.db')  # before the first query
+        >> dbDev.fetch('SELECT 1')  # the connector is created here
+    """
+
+    def __init__(self, driver: Literal['sqlite', 'mysql', 'postgres'], **params):
+        """
+        Records the driver and the parameters of the connector, without creating it.
+
+        Args:
+            driver (Literal['sqlite', 'mysql', 'postgres']): The database driver type.
+            **params: Keyword arguments for the database connector.
+        """
+        self.__driver = driver
+        self.__params = params
+        self.__connector = None
+        self.__lock = threading.Lock()
+
+    @property
+    def initialized(self) -> bool:
+        """
+        Whether the real connector was already created.
+        """
+        return self.__connector is not None
+
+    def configure(self, driver: Literal['sqlite', 'mysql', 'postgres'], **params) -> None:
+        """
+        Replaces the driver and the parameters of the connector before its first use.
+
+        Args:
+            driver (Literal['sqlite', 'mysql', 'postgres']): The database driver type.
+            **params: Keyword arguments for the database connector.
+
+        Raises:
+            RuntimeError: If the connector was already created.
+        """
+        with self.__lock:
+            if self.__connector is not None:
+                raise RuntimeError('The connector is already in use and cannot be configured')
+            self.__driver, self.__params = driver, params
+
+    def get(self):
+        """
+        Returns the real connector, creating it on the first call.
+
+        Returns:
+            Connector: The connector.
+        """
+        if self.__connector is None:
+            with self.__lock:
+                if self.__connector is None:
+                    self.__connector = Database(self.__driver, **self.__params)
+        return self.__connector
+
+    def __getattr__(self, name: str):
+        return getattr(self.get(), name)
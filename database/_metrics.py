@@ -0,0 +1,194 @@
+import re
+import logging
+import threading
+from collections import deque
+from ._cache import normalize
+
+
+BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+LITERALS = re.compile(r"'(?:[^']|'')*'|\b\d+(?:\.\d+)?\b")
+
+logger = logging.getLogger('database.slow_queries')
+
+
+def statement(query: str) -> str:
+    """
+    Normalizes a query for grouping: collapses the whitespace and replaces inline literals by `?`, so the
+    same statement with different values is counted once.
+
+    Args:
+        query (str): The SQL query.
+
+    Returns:
+        str: The normalized statement.
+    """
+    return LITERALS.sub('?', normalize(query))
+
+
+class QueryStats:
+    """
+    Counters of one normalized statement.
+
+    Attributes:
+        count (int): Number of executions.
+        errors (int): Number of executions that failed.
+        rows (int): Number of rows fetched.
+        connect (float): Total seconds spent checking a connection out of the pool.
+        execute (float): Total seconds spent executing the statement.
+        fetch (float): Total seconds spent fetching the rows and committing.
+        buckets (list[int]): Number of executions that took up to each bound of `BUCKETS`.
+        recent (deque[float]): Durations of the latest executions, for the rolling percentiles.
+    """
+
+    def __init__(self, window: int):
+        self.count = 0
+        self.errors = 0
+        self.rows = 0
+        self.connect = 0.0
+        self.execute = 0.0
+        self.fetch = 0.0
+        self.buckets = [0] * len(BUCKETS)
+        self.recent = deque(maxlen=window)
+
+    @property
+    def total(self) -> float:
+        return self.connect + self.execute + self.fetch
+
+    def percentile(self, fraction: float) -> float:
+        """
+        Duration below which the given fraction of the latest executions finished.
+        """
+        if not self.recent:
+            return 0.0
+        ordered = sorted(self.recent)
+        return ordered[min(int(fraction * len(ordered)), len(ordered) - 1)]
+
+
+class QueryMetrics:
+    """
+    Per-statement timing collected by a Connector: time split into connect, execute and fetch phases, row
+    counts, a latency histogram and rolling percentiles, plus a log of the statements slower than a threshold.
+
+    Slow statements are logged with the `database.slow_queries` logger at WARNING level.
+
+    Attributes:
+        slow_query (float | None): Seconds above which an execution is logged. None disables the log.
+        window (int): Number of latest executions kept per statement for the rolling percentiles.
+    """
+
+    def __init__(self, slow_query: float | None = 1.0, window: int = 1024):
+        """
+        Initializes empty metrics.
+
+        Args:
+            slow_query (float | None, optional): Slow query threshold in seconds. Defaults to 1.
+            window (int, optional): Executions kept for the rolling percentiles. Defaults to 1024.
+        """
+        self.slow_query = slow_query
+        self.window = window
+        self.__stats: dict[str, QueryStats] = {}
+        self.__lock = threading.Lock()
+
+    def record(
+            self,
+            query: str,
+            connect: float = 0.0,
+            execute: float = 0.0,
+            fetch: float = 0.0,
+            rows: int = 0,
+            error: bool = False
+    ) -> None:
+        """
+        Records one execution.
+
+        Args:
+            query (str): The executed query.
+            connect (float, optional): Seconds spent checking a connection out of the pool.
+            execute (float, optional): Seconds spent executing the statement.
+            fetch (float, optional): Seconds spent fetching the rows and committing.
+            rows (int, optional): Number of rows fetched.
+            error (bool, optional): Whether the execution failed.
+        """
+        key, duration = statement(query), connect + execute + fetch
+        with self.__lock:
+            stats = self.__stats.get(key)
+            if stats is None:
+                stats = self.__stats[key] = QueryStats(self.window)
+            stats.count += 1
+            stats.errors += error
+            stats.rows += rows
+            stats.connect += connect
+            stats.execute += execute
+            stats.fetch += fetch
+            stats.recent.append(duration)
+            for index, bound in enumerate(BUCKETS):
+                if duration <= bound:
+                    stats.buckets[index] += 1
+        if self.slow_query is not None and duration >= self.slow_query:
+            logger.warning(
+                'slow query (%.3fs: connect %.3fs, execute %.3fs, fetch %.3fs, %d rows%s): %s',
+                duration, connect, execute, fetch, rows, ', failed' if error else '', key
+            )
+
+    def snapshot(self) -> dict[str, dict]:
+        """
+        Returns a copy of the metrics of every statement, slowest total time first.
+
+        Returns:
+            dict[str, dict]: For each normalized statement, its counters, phase totals, rolling p50/p95/p99
+                and the cumulative histogram keyed by bucket bound.
+        """
+        with self.__lock:
+            items = sorted(self.__stats.items(), key=lambda item: item[1].total, reverse=True)
+            return {
+                key: {
+                    'count': stats.count,
+                    'errors': stats.errors,
+                    'rows': stats.rows,
+                    'total': stats.total,
+                    'connect': stats.connect,
+                    'execute': stats.execute,
+                    'fetch': stats.fetch,
+                    'p50': stats.percentile(0.50),
+                    'p95': stats.percentile(0.95),
+                    'p99': stats.percentile(0.99),
+                    'histogram': dict(zip(BUCKETS, stats.buckets)),
+                }
+                for key, stats in items
+            }
+
+    def prometheus(self, prefix: str = 'database_query') -> str:
+        """
+        Dumps the metrics in the Prometheus text exposition format.
+
+        Args:
+            prefix (str, optional): Prefix of the metric names. Defaults to 'database_query'.
+
+        Returns:
+            str: The metrics, one sample per line.
+        """
+        snapshot = self.snapshot()
+        labels = {key: 'statement="{0}"'.format(key.replace('\\', '\\\\').replace('"', '\\"')) for key in snapshot}
+        lines = [f'# TYPE {prefix}_seconds histogram']
+        for key, stats in snapshot.items():
+            for bound, count in stats['histogram'].items():
+                lines.append(f'{prefix}_seconds_bucket{{{labels[key]},le="{bound}"}} {count}')
+            lines.append(f'{prefix}_seconds_bucket{{{labels[key]},le="+Inf"}} {stats["count"]}')
+            lines.append(f'{prefix}_seconds_sum{{{labels[key]}}} {stats["total"]}')
+            lines.append(f'{prefix}_seconds_count{{{labels[key]}}} {stats["count"]}')
+        lines.append(f'# TYPE {prefix}_phase_seconds_total counter')
+        for key, stats in snapshot.items():
+            for phase in ('connect', 'execute', 'fetch'):
+                lines.append(f'{prefix}_phase_seconds_total{{{labels[key]},phase="{phase}"}} {stats[phase]}')
+        for name, field in (('rows_total', 'rows'), ('errors_total', 'errors')):
+            lines.append(f'# TYPE {prefix}_{name} counter')
+            lines.extend(f'{prefix}_{name}{{{labels[key]}}} {stats[field]}' for key, stats in snapshot.items())
+        return '\n'.join(lines) + '\n'
+
+    def reset(self) -> None:
+        """
+        Discards every recorded execution.
+        """
+        with self.__lock:
+            self.__stats.clear()
@@ -0,0 +1,134 @@
+import re
+from pathlib import Path
+
+
+MIGRATIONS = Path(__file__).parent / 'migrations'
+
+FILENAME = re.compile(r'^(\d+)_(\w+)\.sql$')
+
+SEPARATOR = re.compile(r'^\s*--\s*statement-break\s*$', re.MULTILINE)
+
+SCHEMA_VERSION = """
+CREATE TABLE IF NOT EXISTS schema_version (
+    version int primary key,
+    name varchar(250) not null,
+    applied_at timestamp not null default current_timestamp
+)
+"""
+
+
+def statements(sql: str) -> list[str]:
+    """
+    Splits a migration file into its statements. Statements are separated by a `-- statement-break` line,
+    so bodies of triggers and functions can contain semicolons; chunks made only of comments are skipped.
+
+    Args:
+        sql (str): The content of the migration file.
+
+    Returns:
+        list[str]: The statements, in order.
+    """
+    chunks = (chunk.strip() for chunk in SEPARATOR.split(sql))
+    return [
+        chunk for chunk in chunks
+        if any(line.strip() and not line.strip().startswith('--') for line in chunk.splitlines())
+    ]
+
+
+class Migrator:
+    """
+    Applies the versioned SQL migrations of the connector's dialect, found in `migrations/<dialect>/` as
+    `<version>_<name>.sql` files, and records each applied version in the `schema_version` table.
+
+    Each migration runs in its own transaction. MySQL commits schema changes implicitly, so there a migration
+    that fails halfway must be fixed by hand before running again; PostgreSQL and SQLite roll it back.
+
+    Attributes:
+        connector (Connector): The connector of the database to be migrated.
+        directory (Path): The folder holding one subfolder of migrations per dialect.
+    """
+
+    def __init__(self, connector, directory: Path = MIGRATIONS):
+        """
+        Initializes the migrator.
+
+        Args:
+            connector (Connector): The connector of the database to be migrated.
+            directory (Path, optional): The folder of the migrations. Defaults to `database/migrations`.
+        """
+        self.connector = connector
+        self.directory = Path(directory)
+
+    def migrations(self) -> list[tuple[int, str, Path]]:
+        """
+        Lists the migrations available for the connector's dialect.
+
+        Returns:
+            list[tuple[int, str, Path]]: The version, name and file of each migration, by version.
+
+        Raises:
+            ValueError: If the dialect has no migrations folder or two files share a version.
+        """
+        folder = self.directory / self.connector.dialect
+        if not folder.is_dir():
+            raise ValueError(f'No migrations for the {self.connector.dialect} dialect')
+        migrations = {}
+        for path in folder.iterdir():
+            if match := FILENAME.match(path.name):
+                version = int(match.group(1))
+                if version in migrations:
+                    raise ValueError(f'Duplicated migration version {version}: {path.name}')
+                migrations[version] = (version, match.group(2), path)
+        return [migrations[version] for version in sorted(migrations)]
+
+    def applied(self) -> list[int]:
+        """
+        Lists the versions already applied, creating the `schema_version` table if needed.
+
+        Returns:
+            list[int]: The applied versions, in order.
+        """
+        self.connector.create(SCHEMA_VERSION)
+        rows = self.connector.fetch('SELECT version FROM schema_version ORDER BY version;', primary=True)
+        return [row[0] for row in rows or []]
+
+    @property
+    def current(self) -> int:
+        """
+        The latest applied version, 0 for a database without migrations.
+        """
+        return max(self.applied(), default=0)
+
+    def pending(self) -> list[tuple[int, str, Path]]:
+        """
+        Lists the migrations not applied yet.
+
+        Returns:
+            list[tuple[int, str, Path]]: The version, name and file of each pending migration, by version.
+        """
+        applied = set(self.applied())
+        return [migration for migration in self.migrations() if migration[0] not in applied]
+
+    def migrate(self, target: int = None) -> list[tuple[int, str]]:
+        """
+        Applies the pending migrations, in order.
+
+        Args:
+            target (int, optional): Last version to be applied. Defaults to the latest available.
+
+        Returns:
+            list[tuple[int, str]]: The version and name of each applied migration.
+
+        Raises:
+            Exception: If a statement fails. The migrations applied before it stay recorded.
+        """
+        done = []
+        for version, name, path in self.pending():
+            if target is not None and version > target:
+                break
+            with self.connector.transaction() as tx:
+                for statement in statements(path.read_text(encoding='utf-8')):
+                    tx.create(statement)
+                tx.save('INSERT INTO schema_version (version, name) VALUES (%s, %s);', (version, name))
+            done.append((version, name))
+        return done
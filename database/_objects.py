@@ -1,3 +1,5 @@
+import uuid
+from datetime import date, datetime
 from ._singleton import *
 
 
@@ -5,6 +7,9 @@ class SQLiteConnector(Connector):
     """
     Concrete implementation of the Connector class for SQLite database connections.
     """
+    dialect = 'sqlite'
+    # SQLITE_MAX_VARIABLE_NUMBER before SQLite 3.32, still the limit of many system builds
+    max_parameters = 999
 
     def __init__(self, **kwargs):
         """
@@ -12,20 +17,65 @@ class SQLiteConnector(Connector):
         """
         super().__init__(**kwargs)
 
-    def connect(self) -> sqlite3.connect:
+    def connect(self) -> 'sqlite3.Connection':
         """
-        Establishes a connection to the SQLite database.
+        Establishes a connection to the SQLite database. The driver is imported on the first connection.
+
+        Pooled connections may be reused by different threads, so the same-thread check is disabled
+        unless it is set explicitly in the connection parameters.
+
+        Returns:
+            sqlite3.Connection: The SQLite connection object.
+        """
+        import sqlite3
+        return sqlite3.connect(**{'check_same_thread': False, **self.params})
+
+    def prepare(self, query: str) -> str:
+        """
+        Replaces the `%s` placeholders used across the application with the `?` style expected by sqlite3.
+
+        Args:
+            query (str): The SQL query.
 
         Returns:
-            sqlite3.connect: The SQLite connection object.
+            str: The query using `?` placeholders.
         """
-        return sqlite3.connect(**self.params)
+        return query.replace('%s', '?')
+
+    def adapt(self, value):
+        """
+        Passes dates as ISO strings, the format of SQLite's date functions and of the rollup trigger, instead of
+        relying on the default adapters of sqlite3, deprecated since Python 3.12.
+
+        Args:
+            value: The parameter.
+
+        Returns:
+            The parameter, with dates and datetimes as ISO strings.
+        """
+        if isinstance(value, datetime):
+            return value.isoformat(' ')
+        if isinstance(value, date):
+            return value.isoformat()
+        return value
+
+    def begin(self, connection) -> None:
+        """
+        Opens the transaction explicitly: sqlite3 only opens one before data-changing statements, so schema
+        changes in a unit of work would otherwise be committed one by one.
+
+        Args:
+            connection (sqlite3.Connection): The connection of the unit of work.
+        """
+        if not connection.in_transaction:
+            connection.execute('BEGIN')
 
 
 class MySQLConnector(Connector):
     """
     Concrete implementation of the Connector class for MySQL database connections.
     """
+    dialect = 'mysql'
 
     def __init__(self, **kwargs):
         """
@@ -33,20 +83,54 @@ class MySQLConnector(Connector):
         """
         super().__init__(**kwargs)
 
-    def connect(self) -> mysql.connector.connect:
+    def connect(self) -> 'mysql.connector.MySQLConnection':
         """
-        Establishes a connection to the MySQL database.
+        Establishes a connection to the MySQL database. The driver is imported on the first connection.
 
         Returns:
-            mysql.connector.connect: The MySQL connection object.
+            mysql.connector.MySQLConnection: The MySQL connection object.
         """
+        import mysql.connector
         return mysql.connector.connect(**self.params)
 
+    def ping(self, connection) -> bool:
+        """
+        Checks a pooled MySQL connection with the driver's own ping.
+
+        Args:
+            connection (Connection): The connection to be checked.
+
+        Returns:
+            bool: True if the server answered the ping.
+        """
+        return connection.is_connected()
+
+    def stream_cursor(self, connection, batch_size: int):
+        """
+        Opens an unbuffered cursor, so the rows stay on the server until they are read.
+
+        Args:
+            connection (Connection): The connection on which the query runs.
+            batch_size (int): Number of rows read at a time.
+
+        Returns:
+            MySQLCursor: The unbuffered cursor.
+        """
+        return connection.cursor(buffered=False)
+
+    def reusable_after_partial_read(self) -> bool:
+        """
+        An unbuffered MySQL result must be read to the end before the connection runs another query, so a
+        connection whose stream was closed early is discarded instead of reading the remaining rows.
+        """
+        return False
+
 
 class PostgreSQLConnector(Connector):
     """
     Concrete implementation of the Connector class for PostgreSQL database connections.
     """
+    dialect = 'postgres'
 
     def __init__(self, **kwargs):
         """
@@ -54,11 +138,27 @@ class PostgreSQLConnector(Connector):
         """
         super().__init__(**kwargs)
 
-    def connect(self) -> psycopg2.connect:
+    def connect(self) -> 'psycopg2.extensions.connection':
         """
-        Establishes a connection to the PostgreSQL database.
+        Establishes a connection to the PostgreSQL database. The driver is imported on the first connection.
+
+        Returns:
+            psycopg2.extensions.connection: The PostgreSQL connection object.
+        """
+        import psycopg2
+        return psycopg2.connect(**self.params)
+
+    def stream_cursor(self, connection, batch_size: int):
+        """
+        Opens a named (server-side) cursor, so the rows are transferred `batch_size` at a time.
+
+        Args:
+            connection (Connection): The connection on which the query runs.
+            batch_size (int): Number of rows read at a time.
 
         Returns:
-            psycopg2.connect: The PostgreSQL connection object.
+            cursor: The named cursor.
         """
-        return psycopg2.connect(**self.params)
\ No newline at end of file
+        cursor = connection.cursor(name=f'iter_fetch_{uuid.uuid4().hex}')
+        cursor.itersize = batch_size
+        return cursor
\ No newline at end of file
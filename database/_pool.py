@@ -0,0 +1,184 @@
+import time
+import threading
+from typing import Any, Callable
+
+
+class PoolTimeoutError(Exception):
+    """
+    Raised when no connection becomes available in the pool within the checkout timeout.
+    """
+
+
+class ConnectionPool:
+    """
+    Bounded pool of reusable database connections.
+
+    Connections are created through the `factory` callable, kept idle between uses and handed out again
+    on the next checkout, so queries no longer pay for a full handshake each time.
+
+    Attributes:
+        factory (Callable): Callable that opens a new connection.
+        ping (Callable): Callable that receives a connection and returns whether it is still usable.
+        min_size (int): Number of idle connections kept open even after `idle_timeout` expires.
+        max_size (int): Maximum number of connections open at the same time.
+        idle_timeout (float): Seconds an idle connection may wait in the pool before it is closed.
+        timeout (float): Seconds a checkout waits for a free connection before giving up.
+    """
+
+    def __init__(
+            self,
+            factory: Callable[[], Any],
+            ping: Callable[[Any], bool],
+            min_size: int = 1,
+            max_size: int = 5,
+            idle_timeout: float = 300.0,
+            timeout: float = 30.0
+    ):
+        """
+        Initializes the pool. No connection is opened until the first checkout.
+
+        Args:
+            factory (Callable): Callable that opens a new connection.
+            ping (Callable): Health check applied to idle connections on checkout.
+            min_size (int, optional): Minimum number of idle connections to keep. Defaults to 1.
+            max_size (int, optional): Maximum number of open connections. Defaults to 5.
+            idle_timeout (float, optional): Idle seconds before a connection is closed. Defaults to 300.
+            timeout (float, optional): Seconds to wait for a free connection. Defaults to 30.
+
+        Raises:
+            ValueError: If the sizes are not consistent.
+        """
+        if max_size < 1 or min_size < 0 or min_size > max_size:
+            raise ValueError(f'Invalid pool size: min_size={min_size}, max_size={max_size}')
+        self.factory = factory
+        self.ping = ping
+        self.min_size = min_size
+        self.max_size = max_size
+        self.idle_timeout = idle_timeout
+        self.timeout = timeout
+        self.__idle: list[tuple[Any, float]] = []
+        self.__size = 0
+        self.__condition = threading.Condition()
+
+    @property
+    def size(self) -> int:
+        """
+        Number of connections currently open, idle or checked out.
+        """
+        return self.__size
+
+    def __prune(self) -> list:
+        """
+        Removes connections that stayed idle longer than `idle_timeout`, keeping at least `min_size` of them.
+        Must be called with the pool lock held.
+
+        Returns:
+            list: The expired connections, which the caller must close outside the lock.
+        """
+        expired, now = [], time.monotonic()
+        while len(self.__idle) > self.min_size and now - self.__idle[0][1] > self.idle_timeout:
+            expired.append(self.__idle.pop(0)[0])
+            self.__size -= 1
+        return expired
+
+    def acquire(self):
+        """
+        Checks a connection out of the pool.
+
+        An idle connection is reused when it passes the health check; a broken one is discarded and replaced by
+        a fresh connection. When every connection is in use and the pool is full, waits up to `timeout` seconds.
+
+        Returns:
+            Connection: An open database connection.
+
+        Raises:
+            PoolTimeoutError: If no connection is released within `timeout` seconds.
+        """
+        deadline = time.monotonic() + self.timeout
+        while True:
+            with self.__condition:
+                expired = self.__prune()
+                while not self.__idle and self.__size >= self.max_size:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        raise PoolTimeoutError(f'No connection available after {self.timeout} seconds')
+                    self.__condition.wait(remaining)
+                if self.__idle:
+                    connection = self.__idle.pop()[0]
+                else:
+                    connection = None
+                    self.__size += 1
+            for old in expired:
+                self.__close(old)
+            if connection is None:
+                return self.__open()
+            if self.__is_alive(connection):
+                return connection
+            self.__close(connection)
+            with self.__condition:
+                self.__size -= 1
+                self.__condition.notify()
+
+    def release(self, connection, discard: bool = False) -> None:
+        """
+        Returns a connection to the pool.
+
+        Args:
+            connection (Connection): The connection obtained from `acquire`.
+            discard (bool, optional): Closes the connection instead of keeping it, e.g. after a failure
+                that left it in an unknown state. Defaults to False.
+        """
+        if discard:
+            self.__close(connection)
+            with self.__condition:
+                self.__size -= 1
+                self.__condition.notify()
+            return
+        with self.__condition:
+            self.__idle.append((connection, time.monotonic()))
+            expired = self.__prune()
+            self.__condition.notify()
+        for old in expired:
+            self.__close(old)
+
+    def close(self) -> None:
+        """
+        Closes every idle connection. The pool stays usable and opens new connections on demand.
+        """
+        with self.__condition:
+            idle, self.__idle = self.__idle, []
+            self.__size -= len(idle)
+            self.__condition.notify_all()
+        for connection, _ in idle:
+            self.__close(connection)
+
+    def __open(self):
+        """
+        Opens a new connection, freeing its slot in the pool if the driver fails.
+        """
+        try:
+            return self.factory()
+        except Exception:
+            with self.__condition:
+                self.__size -= 1
+                self.__condition.notify()
+            raise
+
+    def __is_alive(self, connection) -> bool:
+        """
+        Applies the health check, treating any error raised by it as a broken connection.
+        """
+        try:
+            return bool(self.ping(connection))
+        except Exception:
+            return False
+
+    @staticmethod
+    def __close(connection) -> None:
+        """
+        Closes a connection, ignoring errors from connections that are already broken.
+        """
+        try:
+            connection.close()
+        except Exception:
+            pass
@@ -0,0 +1,215 @@
+import time
+import logging
+import threading
+from typing import Literal
+from ._singleton import Connector
+
+
+logger = logging.getLogger('database.replicas')
+
+
+class ReplicatedConnector:
+    """
+    Routes the queries of a primary database and its read replicas: `fetch` and `iter_fetch` go to a replica,
+    while writes, schema changes and transactions go to the primary. Reads that must see the latest data, such
+    as uniqueness checks, are sent to the primary with `primary=True`.
+
+    Replicas are picked in turns (`round_robin`) or by the lowest recent latency (`least_latency`), an
+    exponential moving average of their fetch times weighted by the fetches in flight. Every `probe_every`
+    reads a replica is picked in turns anyway, so a replica that was slow once is measured again. A replica
+    that fails is left out for `retry_after` seconds and the read is retried on the primary.
+
+    Reads are cached by the router in the primary's cache, so a write on the primary drops them, and cache hits
+    neither reach a replica nor count towards its latency. As a replica may not have applied a write yet, its
+    reads are not cached for `max_lag` seconds after any invalidation, and are cached for at most `max_lag`
+    seconds, so a read from a replica lagging even more is not served from the cache for the whole `ttl`. Reads
+    answered by the primary are cached for the full `ttl`. The replicas share the primary's metrics.
+    Any other attribute is read from the primary, so the router is used exactly like a single connector.
+
+    Attributes:
+        primary (Connector): The connector of the primary database.
+        replicas (list[Connector]): The connectors of the read replicas.
+        routing (Literal['round_robin', 'least_latency']): How a replica is picked for each read.
+        retry_after (float): Seconds a failed replica is left out of the rotation.
+        probe_every (int): With `least_latency`, one in this many reads is routed in turns.
+        max_lag (float): Seconds after an invalidation during which replica reads are not cached, and the
+            longest a replica read stays cached.
+    """
+
+    def __init__(
+            self,
+            primary: Connector,
+            replicas: list[Connector],
+            routing: Literal['round_robin', 'least_latency'] = 'round_robin',
+            retry_after: float = 30.0,
+            probe_every: int = 50,
+            max_lag: float = 1.0
+    ):
+        """
+        Initializes the router.
+
+        Args:
+            primary (Connector): The connector of the primary database.
+            replicas (list[Connector]): The connectors of the read replicas.
+            routing (Literal['round_robin', 'least_latency'], optional): How a replica is picked for each read.
+                Defaults to 'round_robin'.
+            retry_after (float, optional): Seconds a failed replica is left out. Defaults to 30.
+            probe_every (int, optional): One in this many reads is routed in turns with `least_latency`.
+                Defaults to 50.
+            max_lag (float, optional): The replication delay tolerated: seconds after an invalidation during which
+                replica reads are not cached, and the longest a replica read stays cached. Defaults to 1.
+
+        Raises:
+            ValueError: If the routing is not supported or no replica is given.
+        """
+        if routing not in ('round_robin', 'least_latency'):
+            raise ValueError(f'Unsupported routing: {routing}')
+        if not replicas:
+            raise ValueError('At least one replica is required')
+        self.primary = primary
+        self.replicas = replicas
+        self.routing = routing
+        self.retry_after = retry_after
+        self.probe_every = probe_every
+        self.max_lag = max_lag
+        for replica in replicas:
+            replica.cache, replica.metrics = None, primary.metrics
+        self.__lock = threading.Lock()
+        self.__turn = 0
+        self.__latency = [0.0] * len(replicas)
+        self.__in_flight = [0] * len(replicas)
+        self.__down_until = [0.0] * len(replicas)
+
+    def __getattr__(self, name: str):
+        return getattr(self.primary, name)
+
+    def __pick(self) -> int | None:
+        """
+        Chooses the replica of the next read, or None when every replica is out of the rotation.
+        """
+        now = time.monotonic()
+        with self.__lock:
+            available = [index for index, until in enumerate(self.__down_until) if until <= now]
+            if not available:
+                return None
+            self.__turn += 1
+            if self.routing == 'round_robin' or self.__turn % self.probe_every == 0:
+                index = available[self.__turn % len(available)]
+            else:
+                index = min(available, key=lambda i: self.__latency[i] * (self.__in_flight[i] + 1))
+            self.__in_flight[index] += 1
+            return index
+
+    def __done(self, index: int, elapsed: float = None, failed: bool = False) -> None:
+        """
+        Records the outcome of a read on a replica: its duration, when it is a plain fetch, or its failure.
+        """
+        with self.__lock:
+            self.__in_flight[index] -= 1
+            if failed:
+                self.__down_until[index] = time.monotonic() + self.retry_after
+            elif elapsed is not None:
+                latency = self.__latency[index]
+                self.__latency[index] = elapsed if latency == 0.0 else 0.8 * latency + 0.2 * elapsed
+
+    def stats(self) -> list[dict]:
+        """
+        Routing state of each replica.
+
+        Returns:
+            list[dict]: The average latency in milliseconds, reads in flight and availability of each replica.
+        """
+        now = time.monotonic()
+        with self.__lock:
+            return [
+                {
+                    'latency_ms': round(self.__latency[index] * 1000, 3),
+                    'in_flight': self.__in_flight[index],
+                    'available': self.__down_until[index] <= now,
+                }
+                for index in range(len(self.replicas))
+            ]
+
+    def fetch(self, query: str, data: tuple = None, cached: bool = True, primary: bool = False):
+        """
+        Fetches data from the cache, or else from a replica, or from the primary when `primary` is set or no
+        replica is available. The connectors trace and time the query, so the router does not.
+
+        Args:
+            query (str): The SQL query for fetching data.
+            data (tuple, optional): Parameters for the query, if needed.
+            cached (bool, optional): Whether the result may come from and be stored in the cache.
+                Defaults to True.
+            primary (bool, optional): Whether the read must see the latest data: it skips the cache and goes to
+                the primary. Defaults to False.
+
+        Returns:
+            list[tuple] | None: The fetched result, or None if no result was found.
+        """
+        if primary:
+            return self.primary.fetch(query, data, cached, primary)
+        cache = self.primary.cache if cached else None
+        if cache is not None:
+            key = cache.key(query, data)
+            if (response := cache.get(key)) is not None:
+                return response
+            generation = cache.generation
+        if (index := self.__pick()) is None:
+            response = self.primary.fetch(query, data, cached=False)
+        else:
+            started = time.perf_counter()
+            try:
+                response = self.replicas[index].fetch(query, data, cached=False)
+                self.__done(index, time.perf_counter() - started)
+            except Exception as error:
+                self.__done(index, failed=True)
+                logger.warning('Replica %d failed, reading from the primary: %s', index, error)
+                response, index = self.primary.fetch(query, data, cached=False), None
+        if cache is None:
+            return response
+        if index is None:
+            cache.put(key, response, generation)
+        elif time.monotonic() - cache.invalidated >= self.max_lag:
+            # a replica read soon after a write may predate it, so it is not cached then, and never for longer
+            # than the tolerated lag
+            cache.put(key, response, generation, self.max_lag)
+        return response
+
+    def iter_fetch(self, query: str, data: tuple = None, batch_size: int = 1000, primary: bool = False):
+        """
+        Fetches data as a stream from a replica, or from the primary when `primary` is set or no replica is
+        available. A replica that fails in the middle of the stream is not replaced, since rows were already
+        yielded.
+
+        Args:
+            query (str): The SQL query for fetching data.
+            data (tuple, optional): Parameters for the query, if needed.
+            batch_size (int, optional): Number of rows read from the driver at a time. Defaults to 1000.
+            primary (bool, optional): Whether the rows must come from the primary. Defaults to False.
+
+        Yields:
+            tuple: Each row of the result.
+
+        Raises:
+            Exception: If any database error occurs.
+        """
+        if primary or (index := self.__pick()) is None:
+            yield from self.primary.iter_fetch(query, data, batch_size)
+            return
+        # the time the caller spends between rows is part of a stream, so it does not count as latency
+        failed = False
+        try:
+            yield from self.replicas[index].iter_fetch(query, data, batch_size)
+        except Exception:
+            failed = True
+            raise
+        finally:
+            self.__done(index, failed=failed)
+
+    def close(self) -> None:
+        """
+        Closes the idle connections of the primary and of every replica.
+        """
+        self.primary.close()
+        for replica in self.replicas:
+            replica.close()
@@ -0,0 +1,144 @@
+from datetime import date, datetime, timedelta
+from typing import Literal
+
+
+GRANULARITIES = ('day', 'week', 'month')
+
+INSERT = """
+INSERT INTO weighing_rollups (
+    id_profile, granularity, period_start, min_weight, max_weight, sum_weight, samples, last_weight, last_at
+) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s);
+"""
+
+HISTORY = """
+SELECT period_start, min_weight, max_weight, sum_weight / samples, last_weight, samples
+FROM weighing_rollups
+WHERE id_profile = %s AND granularity = %s{0}
+ORDER BY period_start;
+"""
+
+
+def period_start(created: datetime | date | str, granularity: Literal['day', 'week', 'month']) -> date:
+    """
+    First day of the period that contains a weighing, with weeks starting on Monday as in the rollup triggers.
+
+    Args:
+        created (datetime | date | str): When the weighing was logged. SQLite returns it as an ISO string.
+        granularity (Literal['day', 'week', 'month']): The length of the period.
+
+    Returns:
+        date: The first day of the period.
+    """
+    day = datetime.fromisoformat(created) if isinstance(created, str) else created
+    day = day.date() if isinstance(day, datetime) else day
+    match granularity:
+        case 'day':
+            return day
+        case 'week':
+            return day - timedelta(days=day.weekday())
+        case 'month':
+            return day.replace(day=1)
+    raise ValueError(f'Invalid granularity: {granularity}')
+
+
+class WeighingRollups:
+    """
+    Reads and rebuilds the `weighing_rollups` table, which holds the minimum, maximum, mean, last weight and
+    number of weighings of each profile per day, week and month.
+
+    The table is maintained incrementally by a trigger on `weighing` (migration 0004), so a history reads one
+    row per period instead of the whole log. Weighings changed or deleted afterwards are not reflected until
+    `rebuild` runs.
+
+    Attributes:
+        connector (Connector): The connector of the database.
+    """
+
+    def __init__(self, connector):
+        """
+        Initializes the rollups reader.
+
+        Args:
+            connector (Connector): The connector of the database.
+        """
+        self.connector = connector
+
+    def history(
+            self,
+            id_profile: int,
+            granularity: Literal['day', 'week', 'month'] = 'week',
+            since: date = None
+    ) -> list[tuple]:
+        """
+        Reads the weight history of a profile, one row per period.
+
+        Args:
+            id_profile (int): The profile.
+            granularity (Literal['day', 'week', 'month'], optional): The length of the periods. Defaults to 'week'.
+            since (date, optional): First period to be read. Defaults to the whole history.
+
+        Returns:
+            list[tuple]: The start, minimum, maximum, mean and last weight and the number of weighings of each
+                period, oldest first.
+
+        Raises:
+            ValueError: If the granularity is not supported.
+        """
+        if granularity not in GRANULARITIES:
+            raise ValueError(f'Invalid granularity: {granularity}')
+        if since is None:
+            query, data = HISTORY.format(''), (id_profile, granularity)
+        else:
+            since = self.connector.adapt(since)
+            query, data = HISTORY.format(' AND period_start >= %s'), (id_profile, granularity, since)
+        return self.connector.fetch(query, data) or []
+
+    @staticmethod
+    def __aggregate(id_profile: int, weighings: list[tuple]) -> list[tuple]:
+        """
+        Builds the rollup rows of a profile from its weighings, sorted by date.
+        """
+        periods = {}
+        for weight, created in weighings:
+            for granularity in GRANULARITIES:
+                key = (granularity, period_start(created, granularity))
+                if (row := periods.get(key)) is None:
+                    periods[key] = [weight, weight, weight, 1, weight, created]
+                else:
+                    row[0], row[1] = min(row[0], weight), max(row[1], weight)
+                    row[2] += weight
+                    row[3] += 1
+                    row[4], row[5] = weight, created
+        return [(id_profile, *key, *row) for key, row in periods.items()]
+
+    def rebuild(self, id_profile: int = None) -> int:
+        """
+        Recomputes the rollups from the weighing log, in one transaction, profile by profile.
+
+        Args:
+            id_profile (int, optional): The only profile to be rebuilt. Defaults to every profile.
+
+        Returns:
+            int: The number of rollup rows written.
+        """
+        written = 0
+        with self.connector.transaction() as tx:
+            if id_profile is None:
+                tx.save('DELETE FROM weighing_rollups;')
+                profiles = [row[0] for row in tx.fetch('SELECT DISTINCT id_profile FROM weighing;') or []]
+            else:
+                tx.save('DELETE FROM weighing_rollups WHERE id_profile = %s;', (id_profile,))
+                profiles = [id_profile]
+            # weighings logged in the same second are read in insertion order, so the last one inserted is the
+            # last weight of its period, as in the trigger
+            order = 'rowid' if self.connector.dialect == 'sqlite' else 'id'
+            for profile in profiles:
+                weighings = tx.fetch(
+                    'SELECT weight, created FROM weighing '
+                    f'WHERE id_profile = %s AND weight IS NOT NULL ORDER BY created, {order};',
+                    (profile,)
+                )
+                rows = self.__aggregate(profile, weighings or [])
+                tx.save_many(INSERT, [tuple(self.connector.adapt(value) for value in row) for row in rows])
+                written += len(rows)
+        return written
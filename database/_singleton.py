@@ -1,42 +1,60 @@
-import sqlite3
-import psycopg2
-import mysql.connector
+import time
 from abc import abstractmethod
+from contextlib import contextmanager
+from profiling import tracer
+from ._pool import ConnectionPool
+from ._cache import QueryCache
+from ._metrics import QueryMetrics
+from ._transaction import Transaction
 
 
 class Connector:
     """
-    Abstract base class that provides a Singleton pattern for database connections.
-    Defines basic operations for interacting with databases.
+    Abstract base class for database connections. Defines basic operations for interacting with databases.
+
+    The instance keeps no per-query state: every call checks its own connection out of the pool and works
+    with a local cursor, so several sessions can run queries on the same connector at the same time.
 
     Attributes:
         params (dict): Connection parameters passed during initialization.
-        __cursor (Cursor): The database cursor for executing queries.
-        __connection (Connection): The active database connection.
-        __response (list): The response from fetch operations.
+        pool (ConnectionPool): The pool of reusable connections opened through `connect`.
+        cache (QueryCache | None): The optional cache of fetch results.
+        metrics (QueryMetrics): Timing and row counts of the executed statements.
+        dialect (str): The SQL dialect of the database, used to pick dialect-specific SQL such as migrations.
+        max_parameters (int): The most parameters one statement may bind, for callers that build `IN (...)`
+            lists.
     """
-    __instance = None
-
-    def __new__(cls, *args, **kwargs):
-        """
-        Ensures only one instance of the Connector class is created (Singleton pattern).
-        """
-        if cls.__instance is None:
-            cls.__instance = super(Connector, cls).__new__(cls)
-        return cls.__instance
-
+    dialect: str = None
+    max_parameters: int = 32767
 
-    def __init__(self, **kwargs):
+    def __init__(
+            self,
+            min_size: int = 1,
+            max_size: int = 5,
+            idle_timeout: float = 300.0,
+            cache_size: int = 0,
+            cache_ttl: float = 30.0,
+            slow_query: float | None = 1.0,
+            **kwargs
+    ):
         """
         Initializes the connector with the given connection parameters.
 
         Args:
+            min_size (int, optional): Minimum number of idle connections kept in the pool. Defaults to 1.
+            max_size (int, optional): Maximum number of connections opened by the pool. Defaults to 5.
+            idle_timeout (float, optional): Seconds before an idle pooled connection is closed. Defaults to 300.
+            cache_size (int, optional): Maximum number of cached fetch results. Defaults to 0, which disables
+                the cache.
+            cache_ttl (float, optional): Seconds a cached fetch result stays valid. Defaults to 30.
+            slow_query (float | None, optional): Seconds above which a statement is logged as slow.
+                Defaults to 1; None disables the slow query log.
             kwargs: Keyword arguments representing database connection parameters.
         """
         self.params = kwargs
-        self.__cursor = None
-        self.__connection = None
-        self.__response = None
+        self.pool = ConnectionPool(self.connect, self.ping, min_size, max_size, idle_timeout)
+        self.cache = QueryCache(cache_size, cache_ttl) if cache_size else None
+        self.metrics = QueryMetrics(slow_query)
 
     @abstractmethod
     def connect(self):
@@ -45,6 +63,87 @@ class Connector:
         """
         ...
 
+    def ping(self, connection) -> bool:
+        """
+        Checks whether a pooled connection is still usable before it is handed out again.
+        Subclasses may override it with a cheaper driver-specific check.
+
+        Args:
+            connection (Connection): The connection to be checked.
+
+        Returns:
+            bool: True if the connection answered the check.
+        """
+        cursor = connection.cursor()
+        try:
+            cursor.execute('SELECT 1')
+            cursor.fetchall()
+        finally:
+            cursor.close()
+        return True
+
+    def prepare(self, query: str) -> str:
+        """
+        Adapts a query written with the `%s` placeholder style to the driver in use.
+
+        Args:
+            query (str): The SQL query.
+
+        Returns:
+            str: The query ready to be executed by the driver.
+        """
+        return query
+
+    def adapt(self, value):
+        """
+        Converts a query parameter the driver does not bind natively. The drivers in use bind every type the
+        application passes, so by default the value is returned as is.
+
+        Args:
+            value: The parameter.
+
+        Returns:
+            The parameter ready to be bound.
+        """
+        return value
+
+    def begin(self, connection) -> None:
+        """
+        Starts the transaction of a unit of work. The drivers in use open it implicitly, so by default nothing
+        is done; subclasses whose driver does not cover schema changes override it.
+
+        Args:
+            connection (Connection): The connection of the unit of work.
+        """
+        ...
+
+    def stream_cursor(self, connection, batch_size: int):
+        """
+        Opens the cursor used by `iter_fetch`. Subclasses override it with a cursor that keeps the result on
+        the server, so rows are transferred as they are read.
+
+        Args:
+            connection (Connection): The connection on which the query runs.
+            batch_size (int): Number of rows read at a time.
+
+        Returns:
+            Cursor: The cursor.
+        """
+        return connection.cursor()
+
+    def reusable_after_partial_read(self) -> bool:
+        """
+        Whether a connection can go back to the pool when a stream is closed before reading every row.
+        Drivers that leave unread rows pending on the connection must return False.
+        """
+        return True
+
+    def close(self) -> None:
+        """
+        Closes the idle connections kept by the pool.
+        """
+        self.pool.close()
+
     def __execute(self, query: str, data: tuple = None, fetch: bool = False, commit: bool = False) -> list[tuple] | None:
         """
         Executes a SQL query on the database and handles fetch or commit operations.
@@ -52,7 +151,8 @@ class Connector:
         Args:
             query (str): The SQL query to be executed.
             data (tuple, optional): Data to be passed into the query, if any.
-            fetch (bool, optional): Whether to fetch the result of the query. Defaults to False.
+            fetch (bool, optional): Whether to fetch the result of the query, when the statement produces one.
+                Defaults to False.
             commit (bool, optional): Whether to commit the transaction. Defaults to False.
 
         Returns:
@@ -61,25 +161,45 @@ class Connector:
         Raises:
             Exception: If any database error occurs.
         """
+        response, cursor = None, None
+        started = time.perf_counter()
+        connection = self.pool.acquire()
+        connected, executed = time.perf_counter(), None
+        broken = error = False
         try:
-            self.__connection = self.connect()
-            self.__cursor = self.__connection.cursor()
-            self.__cursor.execute(query, data) if data else self.__cursor.execute(query)
-        except (psycopg2.Error, mysql.connector.Error, sqlite3.Error, Exception) as error:
-            raise Exception(error)
-        else:
-            if fetch:
-                self.__response = self.__cursor.fetchall()
+            cursor = connection.cursor()
+            cursor.execute(self.prepare(query), data) if data else cursor.execute(self.prepare(query))
+            executed = time.perf_counter()
+            if fetch and cursor.description is not None:
+                response = cursor.fetchall()
             if commit:
-                self.__connection.commit()
-            return self.__response
+                connection.commit()
+            else:
+                # ends the read transaction so the pooled connection does not keep a stale snapshot
+                connection.rollback()
+            return response
+        except Exception as exception:
+            error = True
+            try:
+                connection.rollback()
+            except Exception:
+                broken = True
+            raise Exception(exception) from exception
         finally:
+            finished = time.perf_counter()
+            executed = executed or finished
+            self.metrics.record(
+                query, connected - started, executed - connected, finished - executed,
+                len(response) if response else 0, error
+            )
             try:
-                self.__cursor.close()
-                self.__connection.close()
-            except (psycopg2.Error, mysql.connector.Error, sqlite3.Error, Exception) as error:
-                raise Exception(error)
+                if cursor is not None:
+                    cursor.close()
+            except Exception:
+                broken = True
+            self.pool.release(connection, discard=broken)
 
+    @tracer.trace('db')
     def create(self, query: str):
         """
         Creates a new table or executes a similar schema-altering query.
@@ -88,10 +208,13 @@ class Connector:
             query (str): The SQL query to create a table or perform schema operations.
         """
         self.__execute(query, commit=True)
+        if self.cache is not None:
+            self.cache.invalidate(query)
 
+    @tracer.trace('db')
     def save(self, query: str, data: tuple):
         """
-        Inserts or updates data in the database.
+        Inserts or updates data in the database, dropping the cached results of the tables it writes to.
 
         Args:
             query (str): The SQL query for inserting or updating.
@@ -100,17 +223,151 @@ class Connector:
         Returns:
             list[tuple] | None: The result of the query execution.
         """
-        return self.__execute(query, data, commit=True, fetch=True)
+        response = self.__execute(query, data, commit=True, fetch=True)
+        if self.cache is not None:
+            self.cache.invalidate(query)
+        return response
+
+    @contextmanager
+    def __session(self):
+        """
+        Checks a connection out of the pool for several statements, committing when the block ends and
+        rolling back if it raises.
+        """
+        connection, broken = self.pool.acquire(), False
+        try:
+            self.begin(connection)
+            yield connection
+            connection.commit()
+        except BaseException:
+            try:
+                connection.rollback()
+            except Exception:
+                broken = True
+            raise
+        finally:
+            self.pool.release(connection, discard=broken)
+
+    @contextmanager
+    def connection(self):
+        """
+        Checks a raw connection out of the pool for several statements that must be committed together.
+        The work is committed when the block ends and rolled back if it raises. Prefer `transaction`, which
+        also adapts the queries and keeps the result cache consistent table by table.
+
+        Statements run on the yielded connection must be passed through `prepare`.
+
+        Yields:
+            Connection: The database connection.
+        """
+        try:
+            with self.__session() as connection:
+                yield connection
+        finally:
+            if self.cache is not None:
+                self.cache.invalidate()
+
+    @contextmanager
+    def transaction(self):
+        """
+        Opens a unit of work: the statements executed on the yielded transaction share one connection and
+        are committed once when the block ends, or rolled back together if it raises.
+
+        Yields:
+            Transaction: The transaction, with `fetch`, `save`, `save_many`, `create` and `savepoint`.
+
+        Examples:
+            >> with db.transaction() as tx:
+            >>     tx.save('INSERT INTO users (username, email, password) VALUES (%s, %s, %s);', user)
+            >>     tx.save('INSERT INTO profiles (id_user, name) VALUES (%s, %s);', profile)
+        """
+        transaction = None
+        try:
+            with self.__session() as connection:
+                transaction = Transaction(self, connection)
+                yield transaction
+        finally:
+            if self.cache is not None and transaction is not None:
+                for query in transaction.writes:
+                    self.cache.invalidate(query)
+
+    def iter_fetch(self, query: str, data: tuple = None, batch_size: int = 1000, primary: bool = False):
+        """
+        Fetches data from the database as a stream, reading `batch_size` rows at a time so large results are
+        processed with constant memory. The connection stays checked out until the iteration ends or the
+        generator is closed.
+
+        Args:
+            query (str): The SQL query for fetching data.
+            data (tuple, optional): Parameters for the query, if needed.
+            batch_size (int, optional): Number of rows read from the driver at a time. Defaults to 1000.
+            primary (bool, optional): Whether the rows must come from the primary database. A single connector
+                is the primary, so it is only meaningful with read replicas. Defaults to False.
+
+        Yields:
+            tuple: Each row of the result.
+
+        Raises:
+            Exception: If any database error occurs.
+        """
+        cursor, finished, broken, error = None, False, False, False
+        started = time.perf_counter()
+        connection = self.pool.acquire()
+        connected, executed = time.perf_counter(), None
+        # the time the caller spends between batches is not counted as fetch time
+        fetching, count = 0.0, 0
+        try:
+            cursor = self.stream_cursor(connection, batch_size)
+            cursor.execute(self.prepare(query), data) if data else cursor.execute(self.prepare(query))
+            executed = time.perf_counter()
+            while True:
+                batch = time.perf_counter()
+                rows = cursor.fetchmany(batch_size)
+                fetching += time.perf_counter() - batch
+                if not rows:
+                    break
+                count += len(rows)
+                yield from rows
+            finished = True
+        except Exception as exception:
+            broken = error = True
+            raise Exception(exception) from exception
+        finally:
+            self.metrics.record(
+                query, connected - started, (executed or time.perf_counter()) - connected, fetching, count, error
+            )
+            if not finished and not self.reusable_after_partial_read():
+                broken = True
+            try:
+                if cursor is not None:
+                    cursor.close()
+                connection.rollback()
+            except Exception:
+                broken = True
+            self.pool.release(connection, discard=broken)
 
-    def fetch(self, query: str, data: tuple = None):
+    @tracer.trace('db')
+    def fetch(self, query: str, data: tuple = None, cached: bool = True, primary: bool = False):
         """
-        Fetches data from the database.
+        Fetches data from the database, or from the result cache when it is enabled.
 
         Args:
             query (str): The SQL query for fetching data.
             data (tuple, optional): Parameters for the query, if needed.
+            cached (bool, optional): Whether the result may come from and be stored in the cache.
+                Defaults to True.
+            primary (bool, optional): Whether the read must see the latest data, as uniqueness checks do: it
+                skips the cache and, with read replicas, goes to the primary database. Defaults to False.
 
         Returns:
             list[tuple] | None: The fetched result, or None if no result was found.
         """
-        return self.__execute(query, data, fetch=True)
\ No newline at end of file
+        if self.cache is None or not cached or primary:
+            return self.__execute(query, data, fetch=True)
+        key = self.cache.key(query, data)
+        if (response := self.cache.get(key)) is not None:
+            return response
+        generation = self.cache.generation
+        response = self.__execute(query, data, fetch=True)
+        self.cache.put(key, response, generation)
+        return response
\ No newline at end of file
@@ -0,0 +1,135 @@
+import time
+from contextlib import contextmanager
+
+
+class Transaction:
+    """
+    Unit of work opened by `Connector.transaction`: every statement runs on the same connection and is
+    committed once, when the `with` block ends, or rolled back together if it raises.
+
+    Attributes:
+        connector (Connector): The connector that opened the transaction.
+        connection (Connection): The connection held for the whole transaction.
+        writes (list[str]): The write queries executed, used to invalidate the result cache after the commit.
+    """
+
+    def __init__(self, connector, connection):
+        """
+        Initializes the transaction on a connection checked out of the connector's pool.
+
+        Args:
+            connector (Connector): The connector that opened the transaction.
+            connection (Connection): The connection held for the whole transaction.
+        """
+        self.connector = connector
+        self.connection = connection
+        self.writes = []
+        self.__savepoints = 0
+
+    def __execute(self, query: str, data=None, many: bool = False, fetch: bool = False) -> list[tuple] | None:
+        """
+        Executes a statement on the transaction's connection, without committing.
+
+        Raises:
+            Exception: If any database error occurs.
+        """
+        cursor, response, error = None, None, False
+        started, executed = time.perf_counter(), None
+        try:
+            cursor = self.connection.cursor()
+            prepared = self.connector.prepare(query)
+            if many:
+                cursor.executemany(prepared, data)
+            else:
+                cursor.execute(prepared, data) if data else cursor.execute(prepared)
+            executed = time.perf_counter()
+            if fetch and cursor.description is not None:
+                response = cursor.fetchall()
+            return response
+        except Exception as exception:
+            error = True
+            raise Exception(exception) from exception
+        finally:
+            finished = time.perf_counter()
+            executed = executed or finished
+            # the connection was checked out when the transaction opened, so there is no connect phase here
+            self.connector.metrics.record(
+                query, 0.0, executed - started, finished - executed, len(response) if response else 0, error
+            )
+            if cursor is not None:
+                cursor.close()
+
+    def create(self, query: str) -> None:
+        """
+        Executes a schema-altering query inside the transaction. Note that MySQL commits DDL implicitly.
+
+        Args:
+            query (str): The SQL query.
+        """
+        self.writes.append(query)
+        self.__execute(query)
+
+    def save(self, query: str, data: tuple = None) -> list[tuple] | None:
+        """
+        Inserts or updates data inside the transaction.
+
+        Args:
+            query (str): The SQL query for inserting or updating.
+            data (tuple, optional): The data to be inserted or updated.
+
+        Returns:
+            list[tuple] | None: The rows returned by the statement, if any.
+        """
+        self.writes.append(query)
+        return self.__execute(query, data, fetch=True)
+
+    def save_many(self, query: str, rows: list[tuple]) -> None:
+        """
+        Executes an insert or update once for each row, with the driver's `executemany`.
+
+        Args:
+            query (str): The SQL query for inserting or updating.
+            rows (list[tuple]): The data of each execution.
+        """
+        if rows:
+            self.writes.append(query)
+            self.__execute(query, rows, many=True)
+
+    def fetch(self, query: str, data: tuple = None) -> list[tuple] | None:
+        """
+        Fetches data inside the transaction, seeing its uncommitted writes. The result cache is not used.
+
+        Args:
+            query (str): The SQL query for fetching data.
+            data (tuple, optional): Parameters for the query, if needed.
+
+        Returns:
+            list[tuple] | None: The fetched result.
+        """
+        return self.__execute(query, data, fetch=True)
+
+    @contextmanager
+    def savepoint(self):
+        """
+        Opens a savepoint: if the block raises, only the statements executed inside it are undone and the
+        transaction can go on.
+
+        Examples:
+            >> with db.transaction() as tx:
+            >>     tx.save(query, data)
+            >>     try:
+            >>         with tx.savepoint():
+            >>             tx.save(optional_query, optional_data)
+            >>     except Exception:
+            >>         ...
+        """
+        self.__savepoints += 1
+        name = f'savepoint_{self.__savepoints}'
+        self.__execute(f'SAVEPOINT {name}')
+        try:
+            yield self
+        except BaseException:
+            self.__execute(f'ROLLBACK TO SAVEPOINT {name}')
+            raise
+        else:
+            self.__execute(f'RELEASE SAVEPOINT {name}')
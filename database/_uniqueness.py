@@ -0,0 +1,131 @@
+import time
+import threading
+from ._bloom import BloomFilter
+from ._singleton import Connector
+
+
+class UniquenessIndex:
+    """
+    In-memory index of the values already stored in unique columns, used to skip database lookups.
+
+    Each column is kept in a Bloom filter: a value the filter has never seen is certainly not in the table,
+    so most uniqueness checks for new values are answered without a query. A positive answer may be a false
+    positive and must be confirmed against the database. Values are compared case-insensitively, matching the
+    default MySQL collation.
+
+    The index is loaded in the background on first use and rebuilt every `refresh_interval` seconds, which also
+    picks up rows written by other processes. Until it is loaded, every value is reported as possibly present.
+
+    Attributes:
+        connector (Connector): The connector used to load the values.
+        table (str): The indexed table.
+        columns (tuple[str, ...]): The indexed unique columns.
+        error_rate (float): Target false positive rate of the filters.
+        refresh_interval (float): Seconds after which the index is rebuilt from the database.
+    """
+
+    def __init__(
+            self,
+            connector: Connector,
+            table: str,
+            columns: tuple[str, ...],
+            error_rate: float = 0.01,
+            refresh_interval: float = 600.0
+    ):
+        """
+        Initializes the index. Nothing is loaded until the first lookup.
+
+        Args:
+            connector (Connector): The connector used to load the values.
+            table (str): The indexed table.
+            columns (tuple[str, ...]): The indexed unique columns.
+            error_rate (float, optional): Target false positive rate. Defaults to 0.01.
+            refresh_interval (float, optional): Seconds between rebuilds. Defaults to 600.
+        """
+        self.connector = connector
+        self.table = table
+        self.columns = columns
+        self.error_rate = error_rate
+        self.refresh_interval = refresh_interval
+        self.__filters: dict[str, BloomFilter] | None = None
+        self.__loaded_at = 0.0
+        self.__loading = False
+        self.__recent: list[dict] | None = None
+        self.__lock = threading.Lock()
+
+    @staticmethod
+    def __normalize(value: str) -> str:
+        return str(value).casefold()
+
+    def load(self) -> None:
+        """
+        Builds the filters from the values currently stored in the table, sized with room to grow.
+        Rows added while the values are being fetched are carried over to the new filters.
+
+        Raises:
+            Exception: If the values cannot be fetched.
+        """
+        with self.__lock:
+            self.__recent = []
+        count = self.connector.fetch(f'SELECT COUNT(*) FROM {self.table};', primary=True)[0][0]
+        filters = {column: BloomFilter(max(count * 2, 1024), self.error_rate) for column in self.columns}
+        for row in self.connector.iter_fetch(f'SELECT {", ".join(self.columns)} FROM {self.table};', primary=True):
+            for column, value in zip(self.columns, row):
+                filters[column].add(self.__normalize(value))
+        with self.__lock:
+            for values in self.__recent or []:
+                for column, value in values.items():
+                    filters[column].add(self.__normalize(value))
+            self.__filters, self.__recent = filters, None
+            self.__loaded_at = time.monotonic()
+
+    def __background_load(self) -> None:
+        try:
+            self.load()
+        except Exception:
+            pass
+        finally:
+            with self.__lock:
+                self.__loading = False
+
+    def __current(self) -> dict[str, BloomFilter] | None:
+        """
+        Returns the filters in use, starting a background (re)load when they are missing, stale or full.
+        """
+        with self.__lock:
+            filters = self.__filters
+            stale = filters is None or time.monotonic() - self.__loaded_at > self.refresh_interval or any(
+                f.count > f.capacity for f in filters.values()
+            )
+            if stale and not self.__loading:
+                self.__loading = True
+                threading.Thread(target=self.__background_load, daemon=True).start()
+        return filters
+
+    def might_contain(self, column: str, value: str) -> bool:
+        """
+        Checks whether a value may already be stored in a column.
+
+        Args:
+            column (str): The indexed column.
+            value (str): The value to be checked.
+
+        Returns:
+            bool: False if the value is certainly not stored; True if it may be, or if the index is not loaded yet.
+        """
+        filters = self.__current()
+        return filters is None or self.__normalize(value) in filters[column]
+
+    def add(self, **values: str) -> None:
+        """
+        Records the values of a row just written to the table, keeping the index current between rebuilds.
+
+        Args:
+            **values (str): The value of each indexed column, by column name.
+        """
+        with self.__lock:
+            if self.__recent is not None:
+                self.__recent.append(values)
+            if self.__filters is not None:
+                for column, value in values.items():
+                    self.__filters[column].add(self.__normalize(value))
@@ -0,0 +1,385 @@
+import os
+import json
+import atexit
+import time
+import queue
+import logging
+import threading
+from pathlib import Path
+from concurrent.futures import Future
+
+
+logger = logging.getLogger('database.write_behind')
+
+_STOP = object()
+
+
+def _row(data) -> tuple | None:
+    return tuple(data) if data is not None else None
+
+
+class _Entry:
+    """
+    A write accepted by the queue: statements committed together and the future of their result. Writes replayed
+    from the journal do not take room in the queue.
+    """
+    __slots__ = ('seq', 'statements', 'future', 'replayed')
+
+    def __init__(self, seq: int, statements: list[tuple[str, tuple | None]], replayed: bool = False):
+        self.seq = seq
+        self.statements = statements
+        self.future = Future()
+        self.replayed = replayed
+
+
+class WriteBehind:
+    """
+    Optional write-behind layer over a connector: writes are accepted into a bounded in-process queue and
+    committed by a background worker in batched transactions, so callers do not wait on the database and bursts
+    of writes share one commit.
+
+    Every accepted write is first appended to a local journal (JSON lines); after each committed batch the
+    sequence number of its last write is stored in a checkpoint file. When the layer starts again after a crash,
+    the journal entries past the checkpoint are queued again ahead of any new write, so writes are applied at
+    least once. The journal is truncated whenever the queue is drained. Without a journal the queue lives only
+    in memory.
+
+    If a batch fails, its writes are retried one by one, each in a savepoint of a single transaction, so one bad
+    write does not take the others down. Writes that still fail have the error set on their future and are
+    appended to `<journal>.failed`. If the transaction itself cannot run, as when the database is down, the
+    whole batch is retried with exponential backoff.
+
+    Each write returns a `concurrent.futures.Future`, resolved once it is committed, for callers that need to
+    read their own writes (`asyncio.wrap_future` turns it into an awaitable). The worker starts on first use and
+    the queue is drained when the interpreter exits.
+
+    Attributes:
+        connector (Connector): The connector the writes are committed through.
+        journal (Path | None): The journal file, or None to keep the queue only in memory.
+        batch_size (int): Maximum number of writes committed in one transaction.
+        linger (float): Seconds the worker waits for more writes before committing a batch that is not full.
+        retries (int): Attempts made when the transaction of a batch cannot run.
+        sync (bool): Whether the journal is fsynced after each write, which also survives power losses.
+        written (int): Writes committed so far.
+        failed (int): Writes that failed even when retried alone.
+        batches (int): Transactions committed so far.
+    """
+
+    def __init__(
+            self,
+            connector,
+            journal: str | Path = None,
+            max_queue: int = 10_000,
+            batch_size: int = 500,
+            linger: float = 0.05,
+            retries: int = 5,
+            sync: bool = False
+    ):
+        """
+        Initializes the layer. Nothing is opened or started until the first write.
+
+        Args:
+            connector (Connector): The connector the writes are committed through.
+            journal (str | Path, optional): The journal file. Defaults to None, which disables crash safety.
+            max_queue (int, optional): Maximum number of pending writes; writers block while it is full.
+                Defaults to 10000.
+            batch_size (int, optional): Maximum number of writes committed in one transaction. Defaults to 500.
+            linger (float, optional): Seconds to wait for more writes before committing. Defaults to 0.05.
+            retries (int, optional): Attempts made when the database cannot be reached. Defaults to 5.
+            sync (bool, optional): Whether the journal is fsynced after each write. Defaults to False.
+        """
+        self.connector = connector
+        self.journal = Path(journal) if journal else None
+        self.batch_size = batch_size
+        self.linger = linger
+        self.retries = retries
+        self.sync = sync
+        self.written = 0
+        self.failed = 0
+        self.batches = 0
+        self.__queue = queue.Queue()
+        self.__room = threading.Semaphore(max_queue)
+        self.__lock = threading.Lock()
+        self.__idle = threading.Condition(self.__lock)
+        self.__pending = 0
+        self.__seq = 0
+        self.__file = None
+        self.__worker: threading.Thread | None = None
+        self.__closed = False
+
+    @property
+    def pending(self) -> int:
+        """
+        Number of writes accepted and not committed yet.
+        """
+        return self.__pending
+
+    def __path(self, suffix: str) -> Path:
+        return self.journal.with_name(self.journal.name + suffix)
+
+    def __start(self) -> None:
+        """
+        Queues the writes left in the journal and starts the worker, on the first write. The replayed writes are
+        committed by the worker, so the caller never waits on the database.
+        """
+        if self.journal is not None:
+            self.journal.parent.mkdir(parents=True, exist_ok=True)
+            entries = self.__recover()
+            for entry in entries:
+                self.__queue.put(entry)
+            self.__pending += len(entries)
+            # the journal keeps the replayed writes until they are checkpointed, and is emptied when none is left
+            self.__file = open(self.journal, 'a' if entries else 'w', encoding='utf-8')
+        self.__worker = threading.Thread(target=self.__run, name='write-behind', daemon=True)
+        self.__worker.start()
+        atexit.register(self.close)
+
+    def __recover(self) -> list[_Entry]:
+        """
+        Reads the journal entries past the checkpoint, left by a process that stopped before flushing them.
+        """
+        checkpoint = self.__path('.checkpoint')
+        done = int(checkpoint.read_text()) if checkpoint.exists() else 0
+        entries = []
+        if self.journal.exists():
+            with open(self.journal, encoding='utf-8') as file:
+                for line in file:
+                    try:
+                        record = json.loads(line)
+                    except ValueError:
+                        # the last line may have been cut by the crash before it was acknowledged
+                        continue
+                    if record['seq'] > done:
+                        statements = [(query, _row(data)) for query, data in record['statements']]
+                        entries.append(_Entry(record['seq'], statements, replayed=True))
+        self.__seq = max([done, *(entry.seq for entry in entries)])
+        if entries:
+            logger.warning('Replaying %d writes from %s', len(entries), self.journal)
+        return entries
+
+    def submit(self, statements: list[tuple[str, tuple | None]], timeout: float = None) -> Future:
+        """
+        Queues statements to be committed together, in order, in the transaction of a later batch.
+
+        Args:
+            statements (list[tuple[str, tuple | None]]): The query and data of each statement.
+            timeout (float, optional): Seconds to wait for room in the queue. Defaults to waiting forever.
+
+        Returns:
+            Future: Resolved with None once the statements are committed, or with the error if they fail.
+
+        Raises:
+            queue.Full: If the queue stays full for `timeout` seconds.
+            RuntimeError: If the layer was closed.
+        """
+        if self.__closed:
+            raise RuntimeError('The write-behind queue is closed')
+        # waiting for room happens before taking the lock, so a full queue never holds up the worker's checkpoints
+        if not self.__room.acquire(timeout=timeout):
+            raise queue.Full
+        with self.__lock:
+            if self.__closed:
+                self.__room.release()
+                raise RuntimeError('The write-behind queue is closed')
+            if self.__worker is None:
+                self.__start()
+            entry = _Entry(self.__seq + 1, [(query, _row(data)) for query, data in statements])
+            # the worker takes the lock to checkpoint, so an entry is always journaled before it is checkpointed
+            self.__seq = entry.seq
+            self.__pending += 1
+            if self.__file is not None:
+                self.__file.write(json.dumps({'seq': entry.seq, 'statements': entry.statements}, default=str) + '\n')
+                self.__file.flush()
+                if self.sync:
+                    os.fsync(self.__file.fileno())
+            self.__queue.put(entry)
+        return entry.future
+
+    def save(self, query: str, data: tuple = None, timeout: float = None) -> Future:
+        """
+        Queues an insert or update.
+
+        Args:
+            query (str): The SQL query for inserting or updating.
+            data (tuple, optional): The data to be inserted or updated.
+            timeout (float, optional): Seconds to wait for room in the queue. Defaults to waiting forever.
+
+        Returns:
+            Future: Resolved with None once the write is committed, or with the error if it fails.
+
+        Examples:
+            >> writes.save('INSERT INTO weighing (id_profile, weight) VALUES (%s, %s);', (1, 70.5))
+            >> writes.save(query, data).result()  # waits for the commit, to read the write back
+        """
+        return self.submit([(query, data)], timeout)
+
+    def save_many(self, query: str, rows: list[tuple], timeout: float = None) -> Future:
+        """
+        Queues an insert or update for each row, committed together.
+
+        Args:
+            query (str): The SQL query for inserting or updating.
+            rows (list[tuple]): The data of each execution.
+            timeout (float, optional): Seconds to wait for room in the queue. Defaults to waiting forever.
+
+        Returns:
+            Future: Resolved with None once every row is committed, or with the error if any fails.
+        """
+        return self.submit([(query, row) for row in rows], timeout)
+
+    def __run(self) -> None:
+        """
+        Worker loop: takes the writes in batches of up to `batch_size`, waiting `linger` seconds for a batch to
+        fill, and commits each batch.
+        """
+        stop = False
+        while not stop:
+            entry = self.__queue.get()
+            if entry is _STOP:
+                break
+            batch, deadline = [entry], time.monotonic() + self.linger
+            while len(batch) < self.batch_size:
+                try:
+                    entry = self.__queue.get(timeout=max(0.0, deadline - time.monotonic()))
+                except queue.Empty:
+                    break
+                if entry is _STOP:
+                    stop = True
+                    break
+                batch.append(entry)
+            self.__flush(batch)
+            with self.__lock:
+                self.__pending -= len(batch)
+                if self.__file is not None:
+                    self.__checkpoint(batch[-1].seq)
+                self.__idle.notify_all()
+            for entry in batch:
+                if not entry.replayed:
+                    self.__room.release()
+
+    def __write(self, batch: list[_Entry]) -> None:
+        """
+        Commits a batch in one transaction, running consecutive statements of the same query with `save_many`.
+        """
+        with self.connector.transaction() as tx:
+            query, rows = None, []
+            for entry in batch:
+                for statement, data in entry.statements:
+                    # the pending rows go first, so statements run in the order they were queued
+                    if rows and (data is None or statement != query):
+                        tx.save_many(query, rows)
+                        rows = []
+                    if data is None:
+                        tx.save(statement)
+                        query = None
+                    else:
+                        query = statement
+                        rows.append(data)
+            if rows:
+                tx.save_many(query, rows)
+
+    def __write_each(self, batch: list[_Entry]) -> dict[int, Exception]:
+        """
+        Commits a batch in one transaction with a savepoint per write, collecting the writes that fail.
+        """
+        errors = {}
+        with self.connector.transaction() as tx:
+            for entry in batch:
+                try:
+                    with tx.savepoint():
+                        for statement, data in entry.statements:
+                            tx.save(statement, data)
+                except Exception as error:
+                    errors[entry.seq] = error
+        return errors
+
+    def __flush(self, batch: list[_Entry]) -> None:
+        """
+        Commits a batch and resolves the futures of its writes.
+        """
+        errors, attempt = None, 0
+        while errors is None:
+            try:
+                self.__write(batch)
+                errors = {}
+            except Exception as error:
+                logger.warning('Batch of %d writes failed, retrying them one by one: %s', len(batch), error)
+                try:
+                    errors = self.__write_each(batch)
+                except Exception as error:
+                    attempt += 1
+                    if attempt > self.retries:
+                        logger.error('Giving up on a batch of %d writes: %s', len(batch), error)
+                        errors = {entry.seq: error for entry in batch}
+                    else:
+                        time.sleep(min(0.1 * 2 ** attempt, 10.0))
+        self.batches += 1
+        self.written += len(batch) - len(errors)
+        self.failed += len(errors)
+        if errors:
+            self.__dead_letter(batch, errors)
+        for entry in batch:
+            if entry.future.done():
+                continue
+            if entry.seq in errors:
+                entry.future.set_exception(errors[entry.seq])
+            else:
+                entry.future.set_result(None)
+
+    def __dead_letter(self, batch: list[_Entry], errors: dict[int, Exception]) -> None:
+        """
+        Keeps the writes that could not be committed, so they can be inspected and applied by hand.
+        """
+        for entry in batch:
+            if entry.seq in errors:
+                logger.error('Write %d failed: %s', entry.seq, errors[entry.seq])
+        if self.journal is not None:
+            with open(self.__path('.failed'), 'a', encoding='utf-8') as file:
+                for entry in batch:
+                    if entry.seq in errors:
+                        record = {'seq': entry.seq, 'statements': entry.statements, 'error': str(errors[entry.seq])}
+                        file.write(json.dumps(record, default=str) + '\n')
+
+    def __checkpoint(self, seq: int) -> None:
+        """
+        Records the last committed write and truncates the journal once every write in it is committed.
+        Called with the lock held, so no write is journaled meanwhile.
+        """
+        checkpoint = self.__path('.checkpoint')
+        temporary = self.__path('.checkpoint.tmp')
+        temporary.write_text(str(seq))
+        os.replace(temporary, checkpoint)
+        if self.__pending == 0 and seq == self.__seq:
+            self.__file.truncate(0)
+            self.__file.seek(0)
+
+    def flush(self, timeout: float = None) -> bool:
+        """
+        Waits until every write accepted so far is committed or failed.
+
+        Args:
+            timeout (float, optional): Maximum seconds to wait. Defaults to waiting forever.
+
+        Returns:
+            bool: True if the queue was drained, False if the timeout expired first.
+        """
+        with self.__idle:
+            return self.__idle.wait_for(lambda: self.__pending == 0, timeout)
+
+    def close(self, timeout: float = None) -> None:
+        """
+        Stops accepting writes, commits the queued ones and stops the worker.
+
+        Args:
+            timeout (float, optional): Maximum seconds to wait for the queue to drain. Defaults to waiting forever.
+        """
+        with self.__lock:
+            if self.__closed:
+                return
+            self.__closed = True
+            worker = self.__worker
+        if worker is not None:
+            self.__queue.put(_STOP)
+            worker.join(timeout)
+        if self.__file is not None:
+            self.__file.close()
@@ -0,0 +1,51 @@
+-- Tables created by database/scripts/DDL.sql are kept as they are; the following migrations fix them.
+create table if not exists users (
+    id int primary key auto_increment,
+    username varchar(25) not null unique,
+    email varchar(250) not null unique,
+    password varchar(90) not null
+);
+-- statement-break
+create table if not exists profiles (
+    id int primary key auto_increment,
+    id_user int not null,
+    name varchar(250) not null,
+    birth date not null,
+    gender char(1) check ( gender = 'M' or gender = 'F' ),
+    weight decimal(5, 2),
+    height decimal(3, 2),
+    constraint profiles_ibfk_1 foreign key (id_user)
+        references users(id)
+        on delete cascade
+        on update cascade
+);
+-- statement-break
+create table if not exists weighing (
+    id_profile int not null,
+    weight decimal(5, 2),
+    created datetime not null default current_timestamp,
+    foreign key (id_profile)
+        references profiles(id)
+        on delete cascade
+        on update cascade
+);
+-- statement-break
+drop trigger if exists insert_weighing;
+-- statement-break
+create trigger insert_weighing
+    after insert on profiles
+    for each row
+    begin
+        insert into weighing (id_profile, weight)
+            values (new.id, new.weight);
+    end;
+-- statement-break
+drop trigger if exists set_weighing;
+-- statement-break
+create trigger set_weighing
+    after update on profiles
+    for each row
+    begin
+        insert into weighing (id_profile, weight)
+            values (new.id, new.weight);
+    end;
@@ -0,0 +1,8 @@
+-- profiles.id_user referenced profiles(id) in the original DDL; it must reference users(id).
+alter table profiles drop foreign key profiles_ibfk_1;
+-- statement-break
+alter table profiles
+    add constraint profiles_id_user_fk foreign key (id_user)
+        references users(id)
+        on delete cascade
+        on update cascade;
@@ -0,0 +1,3 @@
+-- The login join reads profiles by id_user; InnoDB already indexes the foreign key column.
+-- Weighing history is read by profile, ordered by date.
+create index weighing_id_profile_created on weighing (id_profile, created);
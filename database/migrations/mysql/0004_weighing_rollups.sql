@@ -0,0 +1,89 @@
+-- Aggregates of the weighing log per profile and day, week (starting on Monday) and month, kept up to date by a
+-- trigger on every insert. Rows changed or deleted afterwards require `python -m database rollups`.
+create table if not exists weighing_rollups (
+    id_profile int not null,
+    granularity varchar(5) not null check ( granularity in ('day', 'week', 'month') ),
+    period_start date not null,
+    min_weight decimal(5, 2) not null,
+    max_weight decimal(5, 2) not null,
+    sum_weight decimal(12, 2) not null,
+    samples int not null,
+    last_weight decimal(5, 2) not null,
+    last_at datetime not null,
+    primary key (id_profile, granularity, period_start),
+    foreign key (id_profile)
+        references profiles(id)
+        on delete cascade
+        on update cascade
+);
+-- statement-break
+drop trigger if exists rollup_weighing;
+-- statement-break
+-- MySQL applies the assignments from left to right, so last_weight is set before last_at changes.
+create trigger rollup_weighing
+    after insert on weighing
+    for each row
+    begin
+        if new.weight is not null then
+            insert into weighing_rollups (
+                id_profile, granularity, period_start, min_weight, max_weight, sum_weight, samples, last_weight,
+                last_at
+            ) values
+                (new.id_profile, 'day', date(new.created),
+                    new.weight, new.weight, new.weight, 1, new.weight, new.created),
+                (new.id_profile, 'week', date(new.created) - interval weekday(new.created) day,
+                    new.weight, new.weight, new.weight, 1, new.weight, new.created),
+                (new.id_profile, 'month', date(new.created) - interval (dayofmonth(new.created) - 1) day,
+                    new.weight, new.weight, new.weight, 1, new.weight, new.created)
+            on duplicate key update
+                min_weight = least(min_weight, values(min_weight)),
+                max_weight = greatest(max_weight, values(max_weight)),
+                sum_weight = sum_weight + values(sum_weight),
+                samples = samples + values(samples),
+                last_weight = if(values(last_at) >= last_at, values(last_weight), last_weight),
+                last_at = greatest(last_at, values(last_at));
+        end if;
+    end;
+-- statement-break
+-- The weighing log had no key, so rows logged in the same second could not be told apart. The id numbers the
+-- existing rows in the order InnoDB stored them, which is the order they were inserted. MySQL has no
+-- `add column if not exists`, so the column is only added when it is missing.
+set @add_weighing_id = (
+    select if(count(*) = 0, 'alter table weighing add column id bigint not null auto_increment unique', 'do 0')
+    from information_schema.columns
+    where table_schema = database() and table_name = 'weighing' and column_name = 'id'
+);
+-- statement-break
+prepare add_weighing_id from @add_weighing_id;
+-- statement-break
+execute add_weighing_id;
+-- statement-break
+deallocate prepare add_weighing_id;
+-- statement-break
+-- The rollups are recomputed from the whole log, so running the migration again does not count a weighing twice.
+delete from weighing_rollups;
+-- statement-break
+-- Backfills the rollups of the rows logged before this migration. The last weight of a period is the row with
+-- the latest `created`, and among rows logged in the same second the one inserted last (highest id), as the
+-- trigger keeps it.
+insert into weighing_rollups (
+    id_profile, granularity, period_start, min_weight, max_weight, sum_weight, samples, last_weight, last_at
+)
+select id_profile, granularity, period_start, min(weight), max(weight), sum(weight), count(*),
+    max(case when latest = 1 then weight end), max(created)
+from (
+    select periods.*, row_number() over (
+        partition by id_profile, granularity, period_start order by created desc, id desc
+    ) as latest
+    from (
+        select id_profile, 'day' as granularity, date(created) as period_start, weight, created, id
+            from weighing where weight is not null
+        union all
+        select id_profile, 'week', date(created) - interval weekday(created) day, weight, created, id
+            from weighing where weight is not null
+        union all
+        select id_profile, 'month', date(created) - interval (dayofmonth(created) - 1) day, weight, created, id
+            from weighing where weight is not null
+    ) as periods
+) as ranked
+group by id_profile, granularity, period_start;
@@ -0,0 +1,41 @@
+create table if not exists users (
+    id serial primary key,
+    username varchar(25) not null unique,
+    email varchar(250) not null unique,
+    password varchar(90) not null
+);
+-- statement-break
+create table if not exists profiles (
+    id serial primary key,
+    id_user int not null references users(id) on delete cascade on update cascade,
+    name varchar(250) not null,
+    birth date not null,
+    gender char(1) check ( gender = 'M' or gender = 'F' ),
+    weight decimal(5, 2),
+    height decimal(3, 2)
+);
+-- statement-break
+create table if not exists weighing (
+    id_profile int not null references profiles(id) on delete cascade on update cascade,
+    weight decimal(5, 2),
+    created timestamp not null default current_timestamp
+);
+-- statement-break
+create or replace function record_weighing() returns trigger as $$
+begin
+    insert into weighing (id_profile, weight) values (new.id, new.weight);
+    return new;
+end;
+$$ language plpgsql;
+-- statement-break
+drop trigger if exists insert_weighing on profiles;
+-- statement-break
+create trigger insert_weighing
+    after insert on profiles
+    for each row execute function record_weighing();
+-- statement-break
+drop trigger if exists set_weighing on profiles;
+-- statement-break
+create trigger set_weighing
+    after update on profiles
+    for each row execute function record_weighing();
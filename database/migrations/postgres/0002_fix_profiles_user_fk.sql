@@ -0,0 +1,2 @@
+-- The MySQL schema had profiles.id_user referencing profiles(id); this schema was created with the right
+-- reference to users(id), so there is nothing to change.
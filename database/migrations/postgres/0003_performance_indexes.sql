@@ -0,0 +1,5 @@
+-- PostgreSQL does not index foreign key columns: the login join reads profiles by id_user.
+create index if not exists profiles_id_user on profiles (id_user);
+-- statement-break
+-- Weighing history is read by profile, ordered by date.
+create index if not exists weighing_id_profile_created on weighing (id_profile, created);
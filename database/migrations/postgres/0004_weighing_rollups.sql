@@ -0,0 +1,61 @@
+-- Aggregates of the weighing log per profile and day, week (starting on Monday) and month, kept up to date by a
+-- trigger on every insert. Rows changed or deleted afterwards require `python -m database rollups`.
+create table if not exists weighing_rollups (
+    id_profile int not null references profiles(id) on delete cascade on update cascade,
+    granularity varchar(5) not null check ( granularity in ('day', 'week', 'month') ),
+    period_start date not null,
+    min_weight decimal(5, 2) not null,
+    max_weight decimal(5, 2) not null,
+    sum_weight decimal(12, 2) not null,
+    samples int not null,
+    last_weight decimal(5, 2) not null,
+    last_at timestamp not null,
+    primary key (id_profile, granularity, period_start)
+);
+-- statement-break
+create or replace function rollup_weighing() returns trigger as $$
+begin
+    insert into weighing_rollups as r (
+        id_profile, granularity, period_start, min_weight, max_weight, sum_weight, samples, last_weight, last_at
+    ) values
+        (new.id_profile, 'day', date_trunc('day', new.created)::date,
+            new.weight, new.weight, new.weight, 1, new.weight, new.created),
+        (new.id_profile, 'week', date_trunc('week', new.created)::date,
+            new.weight, new.weight, new.weight, 1, new.weight, new.created),
+        (new.id_profile, 'month', date_trunc('month', new.created)::date,
+            new.weight, new.weight, new.weight, 1, new.weight, new.created)
+    on conflict (id_profile, granularity, period_start) do update set
+        min_weight = least(r.min_weight, excluded.min_weight),
+        max_weight = greatest(r.max_weight, excluded.max_weight),
+        sum_weight = r.sum_weight + excluded.sum_weight,
+        samples = r.samples + excluded.samples,
+        last_weight = case when excluded.last_at >= r.last_at then excluded.last_weight else r.last_weight end,
+        last_at = greatest(r.last_at, excluded.last_at);
+    return new;
+end;
+$$ language plpgsql;
+-- statement-break
+drop trigger if exists rollup_weighing on weighing;
+-- statement-break
+create trigger rollup_weighing
+    after insert on weighing
+    for each row when (new.weight is not null) execute function rollup_weighing();
+-- statement-break
+-- The weighing log had no key, so rows logged in the same second could not be told apart. The id numbers the
+-- existing rows in the order they are stored, which is the order they were inserted unless the table was rewritten.
+alter table weighing add column if not exists id bigserial;
+-- statement-break
+-- The rollups are recomputed from the whole log, so running the migration again does not count a weighing twice.
+delete from weighing_rollups;
+-- statement-break
+-- Backfills the rollups of the rows logged before this migration. The last weight of a period is the row with
+-- the latest `created`, and among rows logged in the same second the one inserted last (highest id), as the
+-- trigger keeps it.
+insert into weighing_rollups (
+    id_profile, granularity, period_start, min_weight, max_weight, sum_weight, samples, last_weight, last_at
+)
+select id_profile, g.granularity, date_trunc(g.granularity, created)::date, min(weight), max(weight), sum(weight),
+    count(*), (array_agg(weight order by created desc, id desc))[1], max(created)
+from weighing cross join (values ('day'), ('week'), ('month')) as g(granularity)
+where weight is not null
+group by id_profile, g.granularity, date_trunc(g.granularity, created)::date;
@@ -0,0 +1,3 @@
+-- Administrators are flagged in the database and granted with `python -m database admin <username>`, so a
+-- registration alone never grants access to the admin views.
+alter table users add column is_admin boolean not null default false;
@@ -0,0 +1,38 @@
+create table if not exists users (
+    id integer primary key,
+    username varchar(25) not null unique,
+    email varchar(250) not null unique,
+    password varchar(90) not null
+);
+-- statement-break
+create table if not exists profiles (
+    id integer primary key,
+    id_user int not null references users(id) on delete cascade on update cascade,
+    name varchar(250) not null,
+    birth date not null,
+    gender char(1) check ( gender = 'M' or gender = 'F' ),
+    weight decimal(5, 2),
+    height decimal(3, 2)
+);
+-- statement-break
+create table if not exists weighing (
+    id_profile int not null references profiles(id) on delete cascade on update cascade,
+    weight decimal(5, 2),
+    created datetime not null default current_timestamp
+);
+-- statement-break
+create trigger if not exists insert_weighing
+    after insert on profiles
+    for each row
+    begin
+        insert into weighing (id_profile, weight)
+            values (new.id, new.weight);
+    end;
+-- statement-break
+create trigger if not exists set_weighing
+    after update on profiles
+    for each row
+    begin
+        insert into weighing (id_profile, weight)
+            values (new.id, new.weight);
+    end;
@@ -0,0 +1,64 @@
+-- Aggregates of the weighing log per profile and day, week (starting on Monday) and month, kept up to date by a
+-- trigger on every insert. Rows changed or deleted afterwards require `python -m database rollups`.
+create table if not exists weighing_rollups (
+    id_profile int not null references profiles(id) on delete cascade on update cascade,
+    granularity varchar(5) not null check ( granularity in ('day', 'week', 'month') ),
+    period_start date not null,
+    min_weight decimal(5, 2) not null,
+    max_weight decimal(5, 2) not null,
+    sum_weight decimal(12, 2) not null,
+    samples int not null,
+    last_weight decimal(5, 2) not null,
+    last_at datetime not null,
+    primary key (id_profile, granularity, period_start)
+);
+-- statement-break
+create trigger if not exists rollup_weighing
+    after insert on weighing
+    for each row when new.weight is not null
+    begin
+        insert into weighing_rollups (
+            id_profile, granularity, period_start, min_weight, max_weight, sum_weight, samples, last_weight, last_at
+        ) values
+            (new.id_profile, 'day', date(new.created),
+                new.weight, new.weight, new.weight, 1, new.weight, new.created),
+            (new.id_profile, 'week', date(new.created, 'weekday 0', '-6 days'),
+                new.weight, new.weight, new.weight, 1, new.weight, new.created),
+            (new.id_profile, 'month', date(new.created, 'start of month'),
+                new.weight, new.weight, new.weight, 1, new.weight, new.created)
+        on conflict (id_profile, granularity, period_start) do update set
+            min_weight = min(min_weight, excluded.min_weight),
+            max_weight = max(max_weight, excluded.max_weight),
+            sum_weight = sum_weight + excluded.sum_weight,
+            samples = samples + excluded.samples,
+            last_weight = case when excluded.last_at >= last_at then excluded.last_weight else last_weight end,
+            last_at = max(last_at, excluded.last_at);
+    end;
+-- statement-break
+-- The rollups are recomputed from the whole log, so running the migration again does not count a weighing twice.
+delete from weighing_rollups;
+-- statement-break
+-- Backfills the rollups of the rows logged before this migration. The last weight of a period is the row with
+-- the latest `created`, and among rows logged in the same second the one inserted last (highest rowid), as the
+-- trigger keeps it.
+insert into weighing_rollups (
+    id_profile, granularity, period_start, min_weight, max_weight, sum_weight, samples, last_weight, last_at
+)
+select id_profile, granularity, period_start, min(weight), max(weight), sum(weight), count(*),
+    max(case when latest = 1 then weight end), max(created)
+from (
+    select *, row_number() over (
+        partition by id_profile, granularity, period_start order by created desc, seq desc
+    ) as latest
+    from (
+        select id_profile, 'day' as granularity, date(created) as period_start, weight, created, rowid as seq
+            from weighing where weight is not null
+        union all
+        select id_profile, 'week', date(created, 'weekday 0', '-6 days'), weight, created, rowid
+            from weighing where weight is not null
+        union all
+        select id_profile, 'month', date(created, 'start of month'), weight, created, rowid
+            from weighing where weight is not null
+    )
+)
+group by id_profile, granularity, period_start;
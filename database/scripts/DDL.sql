@@ -1,3 +1,6 @@
+-- Scratch file. The schema is managed by the migrations in database/migrations:
+--     python -m database migrate
+
 create table if not exists users (
     id int primary key auto_increment,
     username varchar(25) not null unique,
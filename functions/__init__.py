@@ -1,3 +1,13 @@
 from ._clear_fields import clear_fields
-from ._save_profile import save_profile
-from ._make_login import make_login
+from ._save_profile import save_profile, save_profile_async
+from ._make_login import make_login, make_login_async
+from ._list_profiles import list_profiles, list_profiles_async
+
+
+def __getattr__(name: str):
+    # the bulk import needs NumPy, which is only imported the first time it is used
+    if name == 'import_profiles':
+        from ._import_profiles import import_profiles
+        return import_profiles
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
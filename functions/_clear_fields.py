@@ -1,7 +1,7 @@
-from components import Page, TextField
+from components import Page, TextField, refresh
 
 
 def clear_fields(page: Page, *args: TextField) -> None:
     for field in args:
         field.value = None
-    page.update()
+    refresh(page)
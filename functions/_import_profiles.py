@@ -0,0 +1,171 @@
+import csv
+import json
+import numpy as np
+from pathlib import Path
+from typing import Callable, Iterator
+from hashing import hasher
+from database import dbDev, usersIndex
+from validators import (
+    validate_name_column,
+    validate_date_column,
+    validate_email_column,
+    validate_gender_column,
+    validate_biometric_column
+)
+from ._save_profile import INSERT_USERS, INSERT_PROFILES
+
+
+COLUMNS = ('name', 'birth', 'username', 'email', 'password', 'gender', 'weight', 'height')
+
+REGISTERED = 'SELECT username, email FROM users WHERE {0} IN ({1});'
+
+
+def _read_records(path: Path) -> Iterator[dict]:
+    with path.open(encoding='utf-8', newline='') as file:
+        if path.suffix.lower() in ('.jsonl', '.ndjson'):
+            for line in file:
+                if line.strip():
+                    yield json.loads(line)
+        else:
+            yield from csv.DictReader(file)
+
+
+def _validate_chunk(records: list[dict], date_format: str) -> tuple[list[list], list[list[str]]]:
+    columns = {column: [record.get(column) for record in records] for column in COLUMNS}
+    usernames = np.array(['' if value is None else str(value) for value in columns['username']], dtype=str)
+    passwords = np.array(['' if value is None else str(value) for value in columns['password']], dtype=str)
+    names, bad_names = validate_name_column(columns['name'])
+    births, bad_births = validate_date_column(columns['birth'], date_format)
+    emails, bad_emails = validate_email_column(columns['email'])
+    genders, bad_genders = validate_gender_column(columns['gender'])
+    weights, bad_weights = validate_biometric_column(columns['weight'], 'weight')
+    heights, bad_heights = validate_biometric_column(columns['height'], 'height')
+    empty = {
+        column: np.array([value is None or str(value) == '' for value in columns[column]], dtype=bool)
+        for column in COLUMNS
+    }
+    checks = [
+        ('name', bad_names, 'Value entered in the name field is not valid'),
+        ('birth', bad_births, 'Invalid date string'),
+        ('email', bad_emails, 'Value is not valid for a email'),
+        ('password', np.char.str_len(passwords) < 6, 'Password must be at least 6 characters'),
+        ('gender', bad_genders, 'Invalid gender'),
+        ('weight', bad_weights, 'Value must be a number between 0 and 350'),
+        ('height', bad_heights, 'Value must be a number between 0 and 3'),
+    ]
+    errors = [[] for _ in records]
+    failed = np.logical_or.reduce([*empty.values(), *[mask for _, mask, _ in checks]])
+    for row in np.flatnonzero(failed):
+        errors[row] = [f'{column}: cannot be null' for column in COLUMNS if empty[column][row]]
+        errors[row] += [
+            f'{column}: {message}' for column, mask, message in checks if mask[row] and not empty[column][row]
+        ]
+    values = [list(row) for row in zip(
+        names.tolist(), births.astype(object).tolist(), usernames.tolist(), emails.tolist(), passwords.tolist(),
+        genders.tolist(), weights.tolist(), heights.tolist()
+    )]
+    return values, errors
+
+
+def _registered(rows: list[list]) -> list[tuple]:
+    # usernames and emails are looked up apart, in parts small enough for the parameter limit of the driver
+    size, taken = dbDev.max_parameters, set()
+    for column, values in (('username', [row[2] for row in rows]), ('email', [row[3] for row in rows])):
+        for start in range(0, len(values), size):
+            part = values[start:start + size]
+            query = REGISTERED.format(column, ', '.join(['%s'] * len(part)))
+            taken.update(dbDev.fetch(query, tuple(part), primary=True) or [])
+    return list(taken)
+
+
+def _insert(rows: list[list]) -> None:
+    with dbDev.transaction() as tx:
+        tx.save_many(INSERT_USERS, [(row[2], row[3], row[4]) for row in rows])
+        tx.save_many(INSERT_PROFILES, [(row[2], row[0], dbDev.adapt(row[1]), row[5], row[6], row[7]) for row in rows])
+
+
+def import_profiles(
+        path: str | Path,
+        chunk_size: int = 1000,
+        rejected_path: str | Path = None,
+        date_format: str = 'UK',
+        progress: Callable[[dict], None] = None
+) -> dict:
+    path = Path(path)
+    rejected_path = Path(rejected_path) if rejected_path else path.with_name(f'{path.stem}.rejected.csv')
+    report = {'read': 0, 'imported': 0, 'rejected': 0}
+    seen_usernames, seen_emails = set(), set()
+
+    with rejected_path.open('w', encoding='utf-8', newline='') as rejected_file:
+        rejected = csv.DictWriter(rejected_file, fieldnames=[*COLUMNS, 'errors'], extrasaction='ignore')
+        rejected.writeheader()
+
+        def reject(record: dict, errors: list[str]) -> None:
+            # the plain text password is not copied to the rejected file
+            row = {column: record.get(column) for column in COLUMNS if column != 'password'}
+            rejected.writerow({**row, 'errors': '; '.join(errors)})
+            report['rejected'] += 1
+
+        def flush(chunk: list[tuple[dict, list]]) -> None:
+            if chunk:
+                insert(chunk)
+            if progress:
+                progress(dict(report))
+
+        def insert(chunk: list[tuple[dict, list]]) -> None:
+            taken = _registered([values for _, values in chunk])
+            taken_usernames = {row[0].casefold() for row in taken}
+            taken_emails = {row[1].casefold() for row in taken}
+            valid = []
+            for record, values in chunk:
+                errors = []
+                if values[2].casefold() in taken_usernames:
+                    errors.append('username: Username already exists')
+                if values[3].casefold() in taken_emails:
+                    errors.append('email: Email already registered!')
+                reject(record, errors) if errors else valid.append((record, values))
+            if not valid:
+                return
+            for (_, values), hashed in zip(valid, hasher.hash_many([values[4] for _, values in valid])):
+                values[4] = hashed
+            try:
+                _insert([values for _, values in valid])
+                inserted = valid
+            except Exception:
+                # isolates the rows the database refused, keeping the rest of the chunk
+                inserted = []
+                for record, values in valid:
+                    try:
+                        _insert([values])
+                        inserted.append((record, values))
+                    except Exception as error:
+                        reject(record, [f'database: {error}'])
+            for _, values in inserted:
+                usersIndex.add(username=values[2], email=values[3])
+            report['imported'] += len(inserted)
+
+        def process(records: list[dict]) -> None:
+            valid = []
+            for record, values, errors in zip(records, *_validate_chunk(records, date_format)):
+                if not errors:
+                    username, email = values[2].casefold(), values[3].casefold()
+                    if username in seen_usernames:
+                        errors.append('username: duplicated in the file')
+                    if email in seen_emails:
+                        errors.append('email: duplicated in the file')
+                    seen_usernames.add(username)
+                    seen_emails.add(email)
+                reject(record, errors) if errors else valid.append((record, values))
+            flush(valid)
+
+        chunk = []
+        for record in _read_records(path):
+            report['read'] += 1
+            chunk.append(record)
+            if len(chunk) >= chunk_size:
+                process(chunk)
+                chunk = []
+        process(chunk)
+
+    report['rejected_path'] = str(rejected_path)
+    return report
@@ -0,0 +1,22 @@
+from database import dbDev, dbDevAsync
+
+
+PAGE_SIZE = 50
+
+# seek pagination on the primary key: each page starts right after the last id of the previous one, so reading
+# page n costs the same as reading the first, while OFFSET would scan every row before it
+QUERY = """
+SELECT p.id, p.name, u.username, u.email, p.birth, p.gender, p.weight, p.height
+FROM profiles p JOIN users u ON u.id = p.id_user
+WHERE p.id > %s
+ORDER BY p.id
+LIMIT %s;
+"""
+
+
+def list_profiles(after: int = 0, limit: int = PAGE_SIZE) -> list[tuple]:
+    return dbDev.fetch(QUERY, (after, limit)) or []
+
+
+async def list_profiles_async(after: int = 0, limit: int = PAGE_SIZE) -> list[tuple]:
+    return await dbDevAsync.fetch(QUERY, (after, limit)) or []
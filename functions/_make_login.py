@@ -1,23 +1,71 @@
-from passlib.hash import pbkdf2_sha256 as pbkdf2
-from database import dbDev
+import asyncio
+import logging
+from hashing import hasher
+from database import dbDev, dbDevAsync
 from components import snack_bar, TextField, Page
 
 
+QUERY = """
+SELECT u.id, p.name, p.birth, u.username, u.email, u.is_admin, u.password 
+FROM users u JOIN profiles p ON u.id = p.id_user
+WHERE username = %s or email = %s
+"""
+
+REHASH = 'UPDATE users SET password = %s WHERE id = %s;'
+
+_rehashing = set()
+
+logger = logging.getLogger('functions.login')
+
+
+def _get_user(users: list[tuple] | None) -> tuple:
+    if not users:
+        raise ValueError("User does not exist!")
+    return users[0]
+
+
+def _rehash(user: tuple, password: str) -> None:
+    dbDev.save(REHASH, (hasher.hash(password), user[0]))
+
+
+async def _rehash_async(user: tuple, password: str) -> None:
+    await dbDevAsync.save(REHASH, (await hasher.hash_async(password), user[0]))
+
+
+def _rehashed(future) -> None:
+    # the login already succeeded, so a failed upgrade is only logged; it is tried again on the next login
+    if not future.cancelled() and (error := future.exception()) is not None:
+        logger.warning('Could not upgrade the password hash: %s', error)
+
 
 def make_login(page: Page, _username: TextField, _password: TextField):
 
     try:
-        query = """
-        SELECT u.id, p.name, p.birth, u.username, u.email, u.password 
-        FROM users u JOIN profiles p ON u.id = p.id_user
-        WHERE username = %s or email = %s
-        """
-        user = dbDev.fetch(query, (_username.value, _username.value))[0]
-        if not user:
-            raise ValueError("User does not exist!")
-        if not pbkdf2.verify(_password.value, user[5]):
+        user = _get_user(dbDev.fetch(QUERY, (_username.value, _username.value)))
+        if not hasher.verify(_password.value, user[6]):
             raise ValueError("Invalid password!")
     except ValueError as error:
         snack_bar(page, f'{error}.', make_login)
     else:
-        return user[:5]
\ No newline at end of file
+        if hasher.needs_update(user[6]):
+            # the upgrade runs on a database thread so it does not add a second hash to the login time
+            dbDevAsync.executor.submit(_rehash, user, _password.value).add_done_callback(_rehashed)
+        return user[:6]
+
+
+async def make_login_async(page: Page, _username: TextField, _password: TextField):
+
+    try:
+        user = _get_user(await dbDevAsync.fetch(QUERY, (_username.value, _username.value)))
+        if not await hasher.verify_async(_password.value, user[6]):
+            raise ValueError("Invalid password!")
+    except ValueError as error:
+        snack_bar(page, f'{error}.', make_login_async)
+    else:
+        if hasher.needs_update(user[6]):
+            # the upgrade runs in the background so it does not add a second hash to the login time
+            task = asyncio.create_task(_rehash_async(user, _password.value))
+            _rehashing.add(task)
+            task.add_done_callback(_rehashing.discard)
+            task.add_done_callback(_rehashed)
+        return user[:6]
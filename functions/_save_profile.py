@@ -1,10 +1,34 @@
-from database import dbDev
+from database import dbDev, dbDevAsync, usersIndex
 from components import snack_bar, Page
 
 
+INSERT_USERS = 'INSERT INTO users (username, email, password) VALUES (%s, %s, %s);'
+
+INSERT_PROFILES = """
+INSERT INTO profiles (id_user, name, birth, gender, weight, height)
+VALUES ((SELECT id FROM users WHERE username = %s), %s, %s, %s, %s, %s);
+"""
+
+
+def _create_profile(name, birth, username, email, password, gender, weight, height, /) -> None:
+    with dbDev.transaction() as tx:
+        tx.save(INSERT_USERS, (username, email, password))
+        tx.save(INSERT_PROFILES, (username, name, dbDev.adapt(birth), gender, weight, height))
+
+
 def save_profile(page: Page, name, birth, username, email, password, gender, weight, height, /) -> None:
     try:
-        query = 'CALL create_profile(%s, %s, %s, %s, %s, %s, %s, %s);'
-        dbDev.save(query, (name, birth, username, email, password, gender, weight, height))
+        _create_profile(name, birth, username, email, password, gender, weight, height)
     except Exception as error:
         snack_bar(page, f'{error}.', save_profile)
+    else:
+        usersIndex.add(username=username, email=email)
+
+
+async def save_profile_async(page: Page, name, birth, username, email, password, gender, weight, height, /) -> None:
+    try:
+        await dbDevAsync.run(_create_profile, name, birth, username, email, password, gender, weight, height)
+    except Exception as error:
+        snack_bar(page, f'{error}.', save_profile_async)
+    else:
+        usersIndex.add(username=username, email=email)
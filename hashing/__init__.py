@@ -0,0 +1,11 @@
+import os
+from ._service import HashingService
+from ._calibrate import calibrate
+
+
+hasher = HashingService(
+    max_workers=int(os.getenv('HASH_WORKERS', 0)) or None,
+    rounds=int(os.getenv('HASH_ROUNDS', 0)) or None,
+    budget=float(os.getenv('HASH_BUDGET', 0)) or None,
+    calibration_file=os.getenv('HASH_CALIBRATION_FILE') or None,
+)
@@ -0,0 +1,34 @@
+import time
+from passlib.hash import pbkdf2_sha256 as pbkdf2
+
+
+def calibrate(budget: float, minimum: int = pbkdf2.default_rounds, probe: int = 10000, samples: int = 3) -> int:
+    """
+    Measures how long pbkdf2_sha256 takes on this host and picks the number of rounds that fits the budget.
+
+    The cost of pbkdf2 grows linearly with the number of rounds, so the rounds are extrapolated from the
+    fastest of a few probe hashes. The result is never lower than `minimum`, so a slow host does not end
+    up with weaker hashes than the passlib default.
+
+    Args:
+        budget (float): Target time, in seconds, for a single hash or verification.
+        minimum (int, optional): Lowest number of rounds accepted. Defaults to the passlib default.
+        probe (int, optional): Number of rounds used in the measurements. Defaults to 10000.
+        samples (int, optional): Number of measurements taken. Defaults to 3.
+
+    Returns:
+        int: The number of rounds, rounded down to a multiple of 1000.
+
+    Raises:
+        ValueError: If the budget is not positive.
+    """
+    if budget <= 0:
+        raise ValueError(f'Invalid hashing budget: {budget}')
+    handler = pbkdf2.using(rounds=probe)
+    elapsed = float('inf')
+    for _ in range(samples):
+        start = time.perf_counter()
+        handler.hash('calibration')
+        elapsed = min(elapsed, time.perf_counter() - start)
+    rounds = int(probe * budget / elapsed) // 1000 * 1000
+    return min(max(rounds, minimum), pbkdf2.max_rounds)
@@ -0,0 +1,224 @@
+import os
+import asyncio
+import threading
+from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from passlib.hash import pbkdf2_sha256 as pbkdf2
+from profiling import tracer
+from ._calibrate import calibrate
+from ._workers import hash_password, verify_password
+
+
+class HashingService:
+    """
+    Runs the pbkdf2 password hashing and verification on a pool of worker processes.
+
+    pbkdf2 is deliberately CPU-expensive; running it on separate processes keeps it off the thread that
+    handles the UI event and lets simultaneous logins use every core instead of queueing on the GIL.
+
+    The cost of new hashes is either fixed with `rounds` or calibrated on first use so that a single hash
+    takes about `budget` seconds on this host. A calibrated value is stored in `calibration_file`, when given,
+    and read back on the next start, so the cost does not drift with each measurement or differ between the
+    processes of a deployment.
+
+    Attributes:
+        max_workers (int | None): Number of worker processes. None uses the number of processors.
+        budget (float | None): Target time, in seconds, of a single hash when the rounds are calibrated.
+        calibration_file (Path | None): File that keeps the calibrated rounds across starts.
+        rehash_below (float): Fraction of the current rounds below which a stored hash is upgraded.
+    """
+
+    def __init__(
+            self,
+            max_workers: int = None,
+            rounds: int = None,
+            budget: float = None,
+            calibration_file: str | Path = None,
+            rehash_below: float = 0.8
+    ):
+        """
+        Initializes the service. The worker processes are only started on the first hash or verification.
+
+        Args:
+            max_workers (int, optional): Number of worker processes. Defaults to the number of processors.
+            rounds (int, optional): Fixed number of pbkdf2 rounds for new hashes.
+            budget (float, optional): Latency budget used to calibrate the rounds when they are not fixed.
+                Without rounds or budget, the passlib default is used.
+            calibration_file (str | Path, optional): File that keeps the calibrated rounds across starts.
+                Defaults to None, which calibrates on every start.
+            rehash_below (float, optional): A stored hash is upgraded only when its rounds are below this
+                fraction of the current rounds, so small differences between calibrations do not rehash every
+                user. Defaults to 0.8.
+        """
+        self.max_workers = max_workers
+        self.budget = budget
+        self.calibration_file = Path(calibration_file) if calibration_file else None
+        self.rehash_below = rehash_below
+        self.__rounds = rounds
+        self.__executor = None
+        self.__lock = threading.Lock()
+        self.__calibration = threading.Lock()
+
+    @property
+    def rounds(self) -> int:
+        """
+        Number of pbkdf2 rounds used for new hashes, calibrated against the budget on first access, or read from
+        the calibration file when an earlier start stored it.
+        """
+        with self.__calibration:
+            if self.__rounds is None:
+                self.__rounds = self.__calibrated() if self.budget else pbkdf2.default_rounds
+            return self.__rounds
+
+    def __calibrated(self) -> int:
+        """
+        Reads the stored calibration or, without one, measures the rounds and stores them.
+        """
+        if self.calibration_file is not None:
+            try:
+                return int(self.calibration_file.read_text())
+            except (OSError, ValueError):
+                pass
+        rounds = calibrate(self.budget)
+        if self.calibration_file is not None:
+            try:
+                temporary = self.calibration_file.with_name(self.calibration_file.name + '.tmp')
+                temporary.write_text(str(rounds))
+                os.replace(temporary, self.calibration_file)
+            except OSError:
+                # the next start calibrates again
+                pass
+        return rounds
+
+    def needs_update(self, hashed: str) -> bool:
+        """
+        Checks whether a stored hash was created with clearly fewer rounds than the current setting, below
+        `rehash_below` of it, and should be replaced after the next successful verification.
+
+        Args:
+            hashed (str): The stored hash.
+
+        Returns:
+            bool: True if the hash is clearly weaker than the current setting or is not a pbkdf2_sha256 hash.
+        """
+        try:
+            return pbkdf2.from_string(hashed).rounds < self.rounds * self.rehash_below
+        except ValueError:
+            return True
+
+    def __get_executor(self) -> ProcessPoolExecutor:
+        """
+        Returns the process pool, starting it on first use.
+        """
+        with self.__lock:
+            if self.__executor is None:
+                self.__executor = ProcessPoolExecutor(max_workers=self.max_workers)
+            return self.__executor
+
+    def __reset(self, executor: ProcessPoolExecutor) -> None:
+        """
+        Drops a process pool that broke because a worker died, so the next call starts a new one.
+        """
+        with self.__lock:
+            if self.__executor is executor:
+                self.__executor = None
+        executor.shutdown(wait=False)
+
+    def __submit(self, function, *args):
+        """
+        Submits a call to the process pool, retrying once on a new pool if the current one is broken.
+        A pool that breaks while running the call is dropped, so the following calls start a new one.
+        """
+        executor = self.__get_executor()
+        try:
+            future = executor.submit(function, *args)
+        except BrokenProcessPool:
+            self.__reset(executor)
+            executor = self.__get_executor()
+            future = executor.submit(function, *args)
+
+        def _on_done(done):
+            if not done.cancelled() and isinstance(done.exception(), BrokenProcessPool):
+                self.__reset(executor)
+
+        future.add_done_callback(_on_done)
+        return future
+
+    @tracer.trace('hashing')
+    def hash(self, password: str) -> str:
+        """
+        Hashes a password on a worker process, blocking the calling thread until the hash is ready.
+
+        Args:
+            password (str): The plain text password.
+
+        Returns:
+            str: The pbkdf2_sha256 hash of the password.
+        """
+        return self.__submit(hash_password, password, self.rounds).result()
+
+    @tracer.trace('hashing')
+    def verify(self, password: str, hashed: str) -> bool:
+        """
+        Verifies a password on a worker process, blocking the calling thread until the result is ready.
+
+        Args:
+            password (str): The plain text password.
+            hashed (str): The stored hash.
+
+        Returns:
+            bool: True if the password matches the hash.
+        """
+        return self.__submit(verify_password, password, hashed).result()
+
+    @tracer.trace('hashing')
+    def hash_many(self, passwords: list[str]) -> list[str]:
+        """
+        Hashes a batch of passwords, spreading them over every worker process.
+
+        Args:
+            passwords (list[str]): The plain text passwords.
+
+        Returns:
+            list[str]: The hashes, in the same order as the passwords.
+        """
+        rounds = self.rounds
+        futures = [self.__submit(hash_password, password, rounds) for password in passwords]
+        return [future.result() for future in futures]
+
+    @tracer.trace('hashing')
+    async def hash_async(self, password: str) -> str:
+        """
+        Hashes a password on a worker process without blocking the event loop.
+
+        Args:
+            password (str): The plain text password.
+
+        Returns:
+            str: The pbkdf2_sha256 hash of the password.
+        """
+        return await asyncio.wrap_future(self.__submit(hash_password, password, self.rounds))
+
+    @tracer.trace('hashing')
+    async def verify_async(self, password: str, hashed: str) -> bool:
+        """
+        Verifies a password on a worker process without blocking the event loop.
+
+        Args:
+            password (str): The plain text password.
+            hashed (str): The stored hash.
+
+        Returns:
+            bool: True if the password matches the hash.
+        """
+        return await asyncio.wrap_future(self.__submit(verify_password, password, hashed))
+
+    def shutdown(self) -> None:
+        """
+        Stops the worker processes. A later call starts a new pool.
+        """
+        with self.__lock:
+            executor, self.__executor = self.__executor, None
+        if executor is not None:
+            executor.shutdown()
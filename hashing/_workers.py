@@ -0,0 +1,29 @@
+from passlib.hash import pbkdf2_sha256 as pbkdf2
+
+
+def hash_password(password: str, rounds: int = None) -> str:
+    """
+    Hashes a password with pbkdf2_sha256. Runs inside the worker processes of the hashing service.
+
+    Args:
+        password (str): The plain text password.
+        rounds (int, optional): Number of pbkdf2 rounds. Defaults to the passlib default.
+
+    Returns:
+        str: The pbkdf2_sha256 hash of the password.
+    """
+    return pbkdf2.using(rounds=rounds).hash(password) if rounds else pbkdf2.hash(password)
+
+
+def verify_password(password: str, hashed: str) -> bool:
+    """
+    Verifies a password against a pbkdf2_sha256 hash. Runs inside the worker processes of the hashing service.
+
+    Args:
+        password (str): The plain text password.
+        hashed (str): The stored hash.
+
+    Returns:
+        bool: True if the password matches the hash.
+    """
+    return pbkdf2.verify(password, hashed)
@@ -0,0 +1,22 @@
+import argparse
+from functions import import_profiles
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Imports users and profiles from a CSV or JSONL file.')
+    parser.add_argument('path', help='CSV or JSONL file with name, birth, username, email, password, gender, '
+                                     'weight and height columns.')
+    parser.add_argument('--chunk-size', type=int, default=1000, help='Rows inserted per transaction.')
+    parser.add_argument('--rejected', help='CSV file that receives the rejected rows and their errors.')
+    parser.add_argument('--date-format', choices=['UK', 'US', 'ISO'], default='UK', help='Format of the birth dates.')
+    args = parser.parse_args()
+
+    def progress(report: dict) -> None:
+        print(f"\rread {report['read']} | imported {report['imported']} | rejected {report['rejected']}", end='')
+
+    report = import_profiles(args.path, args.chunk_size, args.rejected, args.date_format, progress)
+    print(f"\nRejected rows written to {report['rejected_path']}")
+
+
+if __name__ == '__main__':
+    main()
@@ -1,10 +1,13 @@
 import flet as ft
-from views import view_new_profile
+from views import navigate, route_change
+from profiling import tracer
 
 
 def main(page: ft.Page):
-    view_new_profile(page)
+    tracer.trace_page(page)
+    page.on_route_change = route_change
+    navigate(page, '/register')
 
 
 if __name__ == '__main__':
-    ft.app(target=main)
\ No newline at end of file
+    ft.app(target=main)
@@ -0,0 +1,8 @@
+import os
+from ._tracer import Tracer
+
+
+tracer = Tracer(
+    path=os.getenv('PROFILE_TRACE') or None,
+    slow=float(os.getenv('PROFILE_SLOW_SECONDS', 0.25)),
+)
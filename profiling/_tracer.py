@@ -0,0 +1,238 @@
+import io
+import json
+import time
+import atexit
+import pstats
+import asyncio
+import cProfile
+import inspect
+import functools
+import threading
+from pathlib import Path
+from typing import Callable
+from contextlib import contextmanager
+
+
+class Tracer:
+    """
+    Opt-in profiler of the UI event handlers. Records the wall time of each stage of a handler (validation,
+    hashing, database, render) as Chrome trace events, viewable in chrome://tracing or ui.perfetto.dev.
+
+    Handlers decorated with `handler` also run under cProfile; the profile is kept only when the invocation
+    is slower than `slow` seconds, saved next to the trace as a `.prof` file (readable by `pstats`, snakeviz
+    or flameprof) and summarized in the arguments of the handler's trace event.
+
+    When no path is given, the tracer is disabled and its decorators return the functions unchanged.
+
+    Attributes:
+        path (Path | None): The trace file. None disables the tracer.
+        slow (float): Seconds above which a handler invocation keeps its cProfile profile.
+    """
+
+    def __init__(self, path: str | Path = None, slow: float = 0.25):
+        """
+        Initializes the tracer. The trace file is only created when the first event is recorded.
+
+        Args:
+            path (str | Path, optional): The trace file. Defaults to None, which disables the tracer.
+            slow (float, optional): Slow invocation threshold, in seconds. Defaults to 0.25.
+        """
+        self.path = Path(path) if path else None
+        self.slow = slow
+        self.__file = None
+        self.__profiles = 0
+        self.__origin = time.perf_counter()
+        self.__lock = threading.Lock()
+        self.__profiling = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.path is not None
+
+    @staticmethod
+    def __track() -> int:
+        """
+        Identifies the lane of an event: the asyncio task when there is one, so concurrent handlers on the
+        event loop do not overlap in the viewer, otherwise the thread.
+        """
+        try:
+            task = asyncio.current_task()
+        except RuntimeError:
+            task = None
+        return id(task) if task is not None else threading.get_ident()
+
+    def __emit(self, event: dict) -> None:
+        """
+        Appends an event to the trace file, in the JSON array format, which the viewers read even before the
+        closing bracket is written.
+        """
+        line = json.dumps({'pid': 1, 'tid': self.__track(), **event}, default=str)
+        with self.__lock:
+            if self.__file is None:
+                self.__file = self.path.open('w', encoding='utf-8')
+                self.__file.write(f'[\n{line}')
+                atexit.register(self.close)
+            else:
+                self.__file.write(f',\n{line}')
+            self.__file.flush()
+
+    def __complete(self, name: str, category: str, start: float, end: float, args: dict) -> None:
+        self.__emit({
+            'name': name,
+            'cat': category,
+            'ph': 'X',
+            'ts': (start - self.__origin) * 1e6,
+            'dur': (end - start) * 1e6,
+            'args': args,
+        })
+
+    @contextmanager
+    def stage(self, name: str, category: str = 'stage', **args):
+        """
+        Records the wall time of a block.
+
+        Args:
+            name (str): The name of the event.
+            category (str, optional): The stage, such as 'validation', 'hashing', 'db' or 'render'.
+            **args: Values shown with the event in the viewer.
+
+        Examples:
+            >> with tracer.stage('load profile', 'db'):
+            >>     dbDev.fetch(query, data)
+        """
+        if not self.enabled:
+            yield
+            return
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.__complete(name, category, start, time.perf_counter(), args)
+
+    def trace(self, category: str, name: str = None) -> Callable[[Callable], Callable]:
+        """
+        Decorator that records every call of a function, or coroutine function, as a stage.
+
+        Args:
+            category (str): The stage, such as 'validation', 'hashing', 'db' or 'render'.
+            name (str, optional): The name of the events. Defaults to the qualified name of the function.
+
+        Returns:
+            Callable: The decorator.
+        """
+        def decorator(function: Callable) -> Callable:
+            if not self.enabled:
+                return function
+            label = name or function.__qualname__
+
+            if inspect.iscoroutinefunction(function):
+                @functools.wraps(function)
+                async def _async_wrapper(*args, **kwargs):
+                    with self.stage(label, category):
+                        return await function(*args, **kwargs)
+                return _async_wrapper
+
+            @functools.wraps(function)
+            def _wrapper(*args, **kwargs):
+                with self.stage(label, category):
+                    return function(*args, **kwargs)
+            return _wrapper
+        return decorator
+
+    def __start_profile(self) -> cProfile.Profile | None:
+        """
+        Starts a cProfile profile, unless another invocation is already being profiled: cProfile cannot
+        follow two handlers interleaved on the event loop apart.
+        """
+        if not self.__profiling.acquire(blocking=False):
+            return None
+        profile = cProfile.Profile()
+        profile.enable()
+        return profile
+
+    def __stop_profile(self, profile: cProfile.Profile | None, name: str, duration: float) -> dict:
+        """
+        Stops a profile and, for a slow invocation, saves it and returns its summary for the trace event.
+        """
+        if profile is None:
+            return {}
+        profile.disable()
+        self.__profiling.release()
+        if duration < self.slow:
+            return {}
+        with self.__lock:
+            self.__profiles += 1
+            path = self.path.with_name(f'{self.path.stem}.{name}.{self.__profiles}.prof')
+        profile.dump_stats(path)
+        summary = io.StringIO()
+        pstats.Stats(profile, stream=summary).sort_stats('cumulative').print_stats(15)
+        return {'profile': str(path), 'top': summary.getvalue().strip().splitlines()[-16:]}
+
+    def handler(self, name: str = None) -> Callable[[Callable], Callable]:
+        """
+        Decorator for UI event handlers: records each invocation as a 'handler' event, profiled with cProfile,
+        and keeps the profile of the slow ones.
+
+        Args:
+            name (str, optional): The name of the events. Defaults to the name of the handler.
+
+        Returns:
+            Callable: The decorator.
+
+        Examples:
+            >> @tracer.handler('login')
+            >> async def login(event):
+            >>     ...
+        """
+        def decorator(function: Callable) -> Callable:
+            if not self.enabled:
+                return function
+            label = name or function.__name__
+
+            if inspect.iscoroutinefunction(function):
+                @functools.wraps(function)
+                async def _async_wrapper(*args, **kwargs):
+                    start, profile = time.perf_counter(), self.__start_profile()
+                    try:
+                        return await function(*args, **kwargs)
+                    finally:
+                        end = time.perf_counter()
+                        summary = self.__stop_profile(profile, label, end - start)
+                        self.__complete(label, 'handler', start, end, summary)
+                return _async_wrapper
+
+            @functools.wraps(function)
+            def _wrapper(*args, **kwargs):
+                start, profile = time.perf_counter(), self.__start_profile()
+                try:
+                    return function(*args, **kwargs)
+                finally:
+                    end = time.perf_counter()
+                    summary = self.__stop_profile(profile, label, end - start)
+                    self.__complete(label, 'handler', start, end, summary)
+            return _wrapper
+        return decorator
+
+    def trace_page(self, page):
+        """
+        Records every `page.update()` round trip of a page as a 'render' stage.
+
+        Args:
+            page (Page): The Flet page.
+
+        Returns:
+            Page: The same page.
+        """
+        if self.enabled:
+            page.update = self.trace('render', 'page.update')(page.update)
+        return page
+
+    def close(self) -> None:
+        """
+        Closes the trace file, completing its JSON array.
+        """
+        with self.__lock:
+            if self.__file is not None:
+                self.__file.write('\n]\n')
+                self.__file.close()
+                self.__file = None
@@ -0,0 +1,25 @@
+import pytest
+from database import Database, Migrator
+
+
+@pytest.fixture
+def connector(tmp_path):
+    # a SQLite file per test, so pooled connections share the data and nothing leaks between tests
+    db = Database('sqlite', database=str(tmp_path / 'test.db'), slow_query=None)
+    yield db
+    db.close()
+
+
+@pytest.fixture
+def migrated(connector):
+    Migrator(connector).migrate()
+    return connector
+
+
+@pytest.fixture
+def cached(tmp_path):
+    db = Database('sqlite', database=str(tmp_path / 'cached.db'), cache_size=64, cache_ttl=60, slow_query=None)
+    db.create('CREATE TABLE users (id integer primary key, username text);')
+    db.create('CREATE TABLE weighing (id_profile int, weight real);')
+    yield db
+    db.close()
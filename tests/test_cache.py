@@ -0,0 +1,94 @@
+from database import Database, Migrator
+from database._cache import QueryCache, DEPENDENCIES, affected, tables
+
+
+def test_repeated_fetch_is_served_from_the_cache(cached):
+    cached.save('INSERT INTO users (username) VALUES (%s);', ('ana',))
+    query = 'SELECT username FROM users;'
+    assert cached.fetch(query) == [('ana',)]
+    assert cached.fetch(query) == [('ana',)]
+    assert cached.cache.hits == 1
+
+
+def test_write_drops_the_reads_of_its_table(cached):
+    query = 'SELECT username FROM users;'
+    assert cached.fetch(query) == []
+    cached.save('INSERT INTO users (username) VALUES (%s);', ('ana',))
+    assert cached.fetch(query) == [('ana',)]
+
+
+def test_write_keeps_the_reads_of_other_tables(cached):
+    query = 'SELECT username FROM users;'
+    cached.fetch(query)
+    cached.save('INSERT INTO weighing (id_profile, weight) VALUES (%s, %s);', (1, 70.5))
+    cached.fetch(query)
+    assert cached.cache.hits == 1
+
+
+def test_transaction_invalidates_after_commit(cached):
+    query = 'SELECT count(*) FROM users;'
+    assert cached.fetch(query) == [(0,)]
+    with cached.transaction() as tx:
+        tx.save_many('INSERT INTO users (username) VALUES (%s);', [('ana',), ('bia',)])
+    assert cached.fetch(query) == [(2,)]
+
+
+def test_uncached_and_primary_reads_skip_the_cache(cached):
+    query = 'SELECT username FROM users;'
+    cached.fetch(query, cached=False)
+    cached.fetch(query, primary=True)
+    assert cached.cache.hits == cached.cache.misses == 0
+
+
+def test_result_read_during_a_write_is_not_stored():
+    cache = QueryCache(8, 60)
+    key = cache.key('SELECT * FROM users')
+    generation = cache.generation
+    cache.invalidate('UPDATE users SET username = 1')
+    cache.put(key, [(1,)], generation)
+    assert cache.get(key) is None
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache = QueryCache(2, 60)
+    keys = [cache.key(f'SELECT {n} FROM users') for n in range(3)]
+    for key in keys:
+        cache.put(key, [(1,)], cache.generation)
+    assert cache.get(keys[0]) is None
+    assert cache.get(keys[2]) == [(1,)]
+
+
+def test_unrecognized_write_clears_everything():
+    cache = QueryCache(8, 60)
+    key = cache.key('SELECT * FROM users')
+    cache.put(key, [(1,)], cache.generation)
+    cache.invalidate('CALL refresh()')
+    assert cache.get(key) is None
+
+
+def test_tables_are_read_from_the_query():
+    assert tables('SELECT * FROM users u JOIN profiles p ON p.id_user = u.id') == {'users', 'profiles'}
+    assert tables('INSERT INTO weighing (id_profile) VALUES (1)') == {'weighing'}
+
+
+def test_trigger_writes_drop_the_reads_of_their_tables(tmp_path):
+    db = Database('sqlite', database=str(tmp_path / 'app.db'), cache_size=64, cache_ttl=60, slow_query=None)
+    Migrator(db).migrate()
+    db.save('INSERT INTO users (username, email, password) VALUES (%s, %s, %s);', ('ana', 'a@b.co', 'x'))
+    weighings = 'SELECT weight FROM weighing WHERE id_profile = 1;'
+    rollups = "SELECT samples FROM weighing_rollups WHERE id_profile = 1 AND granularity = 'month';"
+    assert db.fetch(weighings) == [] and db.fetch(rollups) == []
+    # the profile trigger logs a weighing, whose trigger writes the rollups
+    db.save(
+        'INSERT INTO profiles (id_user, name, birth, gender, weight, height) VALUES (%s, %s, %s, %s, %s, %s);',
+        (1, 'Ana', '1990-01-01', 'F', 60, 1.6)
+    )
+    assert db.fetch(weighings) == [(60,)]
+    assert db.fetch(rollups) == [(1,)]
+    db.close()
+
+
+def test_dependencies_are_followed_transitively():
+    assert affected(frozenset({'users'}), DEPENDENCIES) == {'users', 'profiles', 'weighing', 'weighing_rollups'}
+    assert affected(frozenset({'weighing'}), DEPENDENCIES) == {'weighing', 'weighing_rollups'}
+    assert affected(frozenset({'other'}), DEPENDENCIES) == {'other'}
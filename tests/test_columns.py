@@ -0,0 +1,79 @@
+import numpy as np
+import pytest
+import validators
+from validators._email import _match_email
+from benchmarks._stubs import Field
+
+
+def single(validator, value, *args) -> bool:
+    # whether the single-field validator rejects the value, called without its snack bar decorator
+    try:
+        validator.__wrapped__(None, Field('Field', value), *args)
+    except Exception:
+        return True
+    return False
+
+
+NAMES = ['Maria Silva', 'Joao', 'Ana2', '', 'José da Silva', 'R2-D2', ' ']
+
+DATES = ['15/03/1990', '1990-03-15', '31/02/2020', '29/02/2020', '29/02/2021', '15031990', '1/3/1990',
+         '00/01/2000', '15/13/1990', 'abc', '', '1990/03/15']
+
+EMAILS = ['ana@example.com', 'a.b+c@mail.co', 'no-at.example.com', 'two@@example.com', 'ana@example', 'ANA@x.com',
+          'ana@ex-ample.com.br', '']
+
+GENDERS = ['F', 'M', 'X', 'f', 'FM']
+
+WEIGHTS = ['70', '70,5', '70.55', '-1', '350', '350,01', 'abc', '', '1e2']
+
+HEIGHTS = ['1,75', '0', '3', '3.01', '2,999']
+
+
+def test_name_column_matches_validate_name():
+    _, invalid = validators.validate_name_column(NAMES)
+    assert invalid.tolist() == [single(validators.validate_name, value) for value in NAMES]
+
+
+@pytest.mark.parametrize('_format', ['UK', 'US', 'ISO'])
+def test_date_column_matches_validate_date(_format):
+    dates, invalid = validators.validate_date_column(DATES, _format)
+    assert invalid.tolist() == [single(validators.validate_date, value, _format) for value in DATES]
+    for value, date, rejected in zip(DATES, dates, invalid):
+        if not rejected:
+            expected = validators.validate_date.__wrapped__(None, Field('Birth', value), _format)
+            assert date == np.datetime64(expected)
+
+
+def test_email_column_matches_the_email_format():
+    def rejected(value):
+        try:
+            _match_email(value)
+        except Exception:
+            return True
+        return False
+    _, invalid = validators.validate_email_column(EMAILS)
+    assert invalid.tolist() == [rejected(value) for value in EMAILS]
+
+
+def test_gender_column_matches_validate_gender():
+    _, invalid = validators.validate_gender_column(GENDERS)
+    assert invalid.tolist() == [single(validators.validate_gender, value) for value in GENDERS]
+
+
+def test_gender_column_rejects_empty_values():
+    # the form cannot submit an empty dropdown, so the column rejects what the single validator never sees
+    assert validators.validate_gender_column(['', None])[1].tolist() == [True, True]
+
+
+@pytest.mark.parametrize('_biometric, values', [('weight', WEIGHTS), ('height', HEIGHTS)])
+def test_biometric_column_matches_validate_biometric(_biometric, values):
+    numbers, invalid = validators.validate_biometric_column(values, _biometric)
+    assert invalid.tolist() == [single(validators.validate_biometric, value, _biometric) for value in values]
+    for value, number, rejected in zip(values, numbers, invalid):
+        if not rejected:
+            assert number == validators.validate_biometric.__wrapped__(None, Field('Field', value), _biometric)
+
+
+def test_empty_columns():
+    assert validators.validate_name_column([])[1].size == 0
+    assert validators.validate_biometric_column([], 'weight')[1].size == 0
@@ -0,0 +1,39 @@
+import pytest
+from functions import _import_profiles
+
+
+@pytest.fixture
+def users(migrated, monkeypatch):
+    monkeypatch.setattr(_import_profiles, 'dbDev', migrated)
+    with migrated.transaction() as tx:
+        tx.save_many(
+            'INSERT INTO users (username, email, password) VALUES (%s, %s, %s);',
+            [(f'user{n}', f'user{n}@example.com', 'x') for n in range(0, 3000, 7)]
+        )
+    return migrated
+
+
+def rows(numbers) -> list[list]:
+    return [['Name', None, f'user{n}', f'other{n}@example.com', 'secret'] for n in numbers] + \
+        [['Name', None, f'other{n}', f'user{n}@example.com', 'secret'] for n in numbers]
+
+
+def test_lookups_stay_under_the_parameter_limit(users, monkeypatch):
+    monkeypatch.setattr(users, 'max_parameters', 10)
+    executed, fetch = [], users.fetch
+
+    def counting(query, data=None, **kwargs):
+        executed.append(len(data))
+        return fetch(query, data, **kwargs)
+
+    monkeypatch.setattr(users, 'fetch', counting)
+    taken = _import_profiles._registered(rows(range(35)))
+    assert max(executed) <= 10
+    assert sorted(taken) == sorted(
+        [(f'user{n}', f'user{n}@example.com') for n in range(0, 35, 7)]
+    )
+
+
+def test_chunks_larger_than_the_sqlite_limit(users):
+    taken = _import_profiles._registered(rows(range(1500)))
+    assert len(taken) == len(range(0, 1500, 7))
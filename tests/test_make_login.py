@@ -0,0 +1,36 @@
+import asyncio
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from functions import _make_login
+
+
+def failing(*args):
+    raise RuntimeError('database is locked')
+
+
+def test_failed_rehash_is_logged(caplog):
+    with caplog.at_level(logging.WARNING, 'functions.login'):
+        with ThreadPoolExecutor(1) as executor:
+            executor.submit(failing).add_done_callback(_make_login._rehashed)
+    assert 'database is locked' in caplog.text
+
+
+def test_failed_async_rehash_is_logged(caplog):
+    async def rehash():
+        failing()
+
+    async def login():
+        task = asyncio.create_task(rehash())
+        task.add_done_callback(_make_login._rehashed)
+        await asyncio.wait([task])
+
+    with caplog.at_level(logging.WARNING, 'functions.login'):
+        asyncio.run(login())
+    assert 'database is locked' in caplog.text
+
+
+def test_successful_rehash_logs_nothing(caplog):
+    with caplog.at_level(logging.WARNING, 'functions.login'):
+        with ThreadPoolExecutor(1) as executor:
+            executor.submit(lambda: None).add_done_callback(_make_login._rehashed)
+    assert caplog.text == ''
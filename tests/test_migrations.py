@@ -0,0 +1,44 @@
+from database import Migrator
+from database._migrations import statements
+
+
+def test_migrations_apply_in_order(connector):
+    migrator = Migrator(connector)
+    applied = migrator.migrate()
+    assert [version for version, _ in applied] == [version for version, _, _ in migrator.migrations()]
+    assert migrator.current == applied[-1][0]
+    assert migrator.pending() == []
+
+
+def test_second_run_is_a_no_op(connector):
+    migrator = Migrator(connector)
+    migrator.migrate()
+    tables = connector.fetch("SELECT name FROM sqlite_master WHERE type = 'table' ORDER BY name;")
+    assert migrator.migrate() == []
+    assert connector.fetch("SELECT name FROM sqlite_master WHERE type = 'table' ORDER BY name;") == tables
+
+
+def test_target_stops_at_a_version(connector):
+    migrator = Migrator(connector)
+    assert [version for version, _ in migrator.migrate(target=2)] == [1, 2]
+    assert [version for version, _, _ in migrator.pending()][0] == 3
+
+
+def test_rollup_migration_can_run_again(migrated):
+    migrated.save('INSERT INTO users (username, email, password) VALUES (%s, %s, %s);', ('ana', 'a@b.co', 'x'))
+    migrated.save(
+        'INSERT INTO profiles (id_user, name, birth, gender, weight, height) VALUES (%s, %s, %s, %s, %s, %s);',
+        (1, 'Ana', '1990-01-01', 'F', 60, 1.6)
+    )
+    migrated.save('INSERT INTO weighing (id_profile, weight, created) VALUES (%s, %s, %s);',
+                  (1, 61, '2024-01-02 10:00:00'))
+    query = 'SELECT * FROM weighing_rollups ORDER BY granularity, period_start;'
+    before = migrated.fetch(query)
+    # the profile trigger logs a weighing today as well, so both have a day, week and month rollup
+    assert len(before) == 6
+    migrator = Migrator(migrated)
+    path = next(path for version, _, path in migrator.migrations() if version == 4)
+    with migrated.transaction() as tx:
+        for statement in statements(path.read_text(encoding='utf-8')):
+            tx.create(statement)
+    assert migrated.fetch(query) == before
@@ -0,0 +1,62 @@
+import threading
+import pytest
+from database import Database
+from database._pool import PoolTimeoutError
+
+
+@pytest.fixture
+def small(tmp_path):
+    db = Database('sqlite', database=str(tmp_path / 'pool.db'), min_size=0, max_size=2, slow_query=None)
+    db.pool.timeout = 0.1
+    yield db
+    db.close()
+
+
+def test_connections_are_reused(small):
+    first = small.pool.acquire()
+    small.pool.release(first)
+    assert small.pool.acquire() is first
+    assert small.pool.size == 1
+
+
+def test_exhausted_pool_times_out(small):
+    held = [small.pool.acquire(), small.pool.acquire()]
+    with pytest.raises(PoolTimeoutError):
+        small.pool.acquire()
+    assert small.pool.size == 2
+    for connection in held:
+        small.pool.release(connection)
+
+
+def test_released_connection_wakes_a_waiting_checkout(small):
+    small.pool.timeout = 5
+    held = [small.pool.acquire(), small.pool.acquire()]
+    got = []
+    waiter = threading.Thread(target=lambda: got.append(small.pool.acquire()))
+    waiter.start()
+    small.pool.release(held[0])
+    waiter.join(5)
+    assert got == [held[0]]
+
+
+def test_broken_connection_is_replaced(small):
+    connection = small.pool.acquire()
+    connection.close()
+    small.pool.release(connection)
+    fresh = small.pool.acquire()
+    assert fresh is not connection
+    assert small.pool.size == 1
+    small.pool.release(fresh)
+    assert small.fetch('SELECT 1;') == [(1,)]
+
+
+def test_failed_statement_gives_its_connection_back(small):
+    with pytest.raises(Exception):
+        small.fetch('SELECT * FROM missing;')
+    assert small.fetch('SELECT 1;') == [(1,)]
+    assert small.pool.size <= 2
+
+
+def test_invalid_sizes_are_rejected(tmp_path):
+    with pytest.raises(ValueError):
+        Database('sqlite', database=str(tmp_path / 'x.db'), min_size=3, max_size=2)
@@ -0,0 +1,69 @@
+import time
+import pytest
+from database import Database, parse_replicas
+
+
+@pytest.fixture
+def replicated(tmp_path):
+    db = Database(
+        'sqlite', database=str(tmp_path / 'primary.db'), cache_size=64, cache_ttl=60, slow_query=None,
+        replicas=[{'database': str(tmp_path / 'replica.db')}]
+    )
+    for connector in (db.primary, *db.replicas):
+        connector.create('CREATE TABLE items (name text);')
+    db.replicas[0].save('INSERT INTO items (name) VALUES (%s);', ('replica',))
+    db.primary.save('INSERT INTO items (name) VALUES (%s);', ('primary',))
+    db.max_lag = 0.2
+    yield db
+    db.close()
+
+
+def test_reads_go_to_the_replica_and_writes_to_the_primary(replicated):
+    assert replicated.fetch('SELECT name FROM items;', cached=False) == [('replica',)]
+    assert replicated.fetch('SELECT name FROM items;', primary=True) == [('primary',)]
+    replicated.save('INSERT INTO items (name) VALUES (%s);', ('new',))
+    assert replicated.primary.fetch('SELECT count(*) FROM items;') == [(2,)]
+
+
+def test_replica_reads_are_not_cached_right_after_a_write(replicated):
+    replicated.fetch('SELECT name FROM items;')
+    replicated.fetch('SELECT name FROM items;')
+    assert replicated.cache.hits == 0
+
+
+def test_replica_reads_are_cached_for_at_most_the_tolerated_lag(replicated):
+    time.sleep(0.2)
+    replicated.fetch('SELECT name FROM items;')
+    replicated.fetch('SELECT name FROM items;')
+    assert replicated.cache.hits == 1
+    time.sleep(0.2)
+    replicated.fetch('SELECT name FROM items;')
+    assert replicated.cache.hits == 1
+
+
+def test_cache_hits_do_not_count_as_replica_latency(replicated):
+    time.sleep(0.2)
+    replicated.fetch('SELECT name FROM items;')
+    latency = replicated.stats()[0]['latency_ms']
+    for _ in range(5):
+        replicated.fetch('SELECT name FROM items;')
+    assert replicated.stats()[0]['latency_ms'] == latency
+
+
+def test_failed_replica_falls_back_to_the_primary(replicated):
+    replicated.replicas[0].create('DROP TABLE items;')
+    assert replicated.fetch('SELECT name FROM items;', cached=False) == [('primary',)]
+    assert not replicated.stats()[0]['available']
+
+
+def test_sqlite_replicas_must_name_their_file(tmp_path):
+    with pytest.raises(ValueError):
+        Database('sqlite', database=str(tmp_path / 'primary.db'), replicas=[{'host': 'replica1'}])
+
+
+def test_replicas_are_read_from_hosts_or_json():
+    assert parse_replicas(None) == parse_replicas(' ') == []
+    assert parse_replicas('replica1, replica2,') == [{'host': 'replica1'}, {'host': 'replica2'}]
+    assert parse_replicas('[{"host": "replica1", "port": 3307}]') == [{'host': 'replica1', 'port': 3307}]
+    with pytest.raises(ValueError):
+        parse_replicas('["replica1"]')
@@ -0,0 +1,47 @@
+import pytest
+from database import Migrator, WeighingRollups
+from database._migrations import statements
+
+
+INSERT_WEIGHING = 'INSERT INTO weighing (id_profile, weight, created) VALUES (%s, %s, %s);'
+
+LAST = "SELECT last_weight FROM weighing_rollups WHERE id_profile = 1 AND granularity = 'day' " \
+       "AND period_start = '2024-01-02';"
+
+
+@pytest.fixture
+def profile(migrated):
+    migrated.save('INSERT INTO users (username, email, password) VALUES (%s, %s, %s);', ('ana', 'a@b.co', 'x'))
+    migrated.save(
+        'INSERT INTO profiles (id_user, name, birth, gender, weight, height) VALUES (%s, %s, %s, %s, %s, %s);',
+        (1, 'Ana', '1990-01-01', 'F', 60, 1.6)
+    )
+    # two weighings in the same second: the one inserted last is the last weight of the day
+    migrated.save(INSERT_WEIGHING, (1, 80, '2024-01-02 10:00:00'))
+    migrated.save(INSERT_WEIGHING, (1, 81, '2024-01-02 10:00:00'))
+    migrated.save(INSERT_WEIGHING, (1, 79, '2024-01-02 09:00:00'))
+    return migrated
+
+
+def test_trigger_keeps_the_last_inserted_of_a_tie(profile):
+    assert profile.fetch(LAST) == [(81,)]
+
+
+def test_backfill_breaks_ties_like_the_trigger(profile):
+    path = next(path for version, _, path in Migrator(profile).migrations() if version == 4)
+    with profile.transaction() as tx:
+        for statement in statements(path.read_text(encoding='utf-8')):
+            tx.create(statement)
+    assert profile.fetch(LAST) == [(81,)]
+
+
+def test_rebuild_breaks_ties_like_the_trigger(profile):
+    WeighingRollups(profile).rebuild()
+    assert profile.fetch(LAST) == [(81,)]
+
+
+def test_history_reads_the_rollups(profile):
+    day = WeighingRollups(profile).history(1, 'day')
+    assert [(row[0], row[1], row[2], row[4], row[5]) for row in day if row[0] == '2024-01-02'] == [
+        ('2024-01-02', 79, 81, 81, 3)
+    ]
@@ -0,0 +1,31 @@
+import pytest
+from benchmarks._stubs import Page
+from views import LoginView, ProfilesView
+from views._router import show
+
+
+@pytest.fixture
+def page():
+    page = Page()
+    page.run_task = lambda function: None
+    return page
+
+
+@pytest.mark.parametrize('user, view', [
+    (None, LoginView),
+    ((1, 'Ana', '1990-01-01', 'ana', 'ana@example.com', 0), LoginView),
+    ((1, 'Ana', '1990-01-01', 'ana', 'ana@example.com', 1), ProfilesView),
+])
+def test_profiles_are_only_shown_to_admins(page, user, view):
+    if user is not None:
+        page.session.set('user', user)
+    show(page, '/profiles')
+    assert type(page.views[0]) is view
+
+
+def test_login_offers_the_profiles_only_to_admins(page):
+    show(page, '/login')
+    assert not page.views[0].profiles.visible
+    page.session.set('user', (1, 'Ana', '1990-01-01', 'ana', 'ana@example.com', 1))
+    show(page, '/login')
+    assert page.views[0].profiles.visible
@@ -0,0 +1,37 @@
+from datetime import date, datetime
+import numpy as np
+import pytest
+from analytics import WeightSeries
+
+
+INSERT_WEIGHING = 'INSERT INTO weighing (id_profile, weight, created) VALUES (%s, %s, %s);'
+
+
+@pytest.fixture
+def profile(migrated):
+    migrated.save('INSERT INTO users (username, email, password) VALUES (%s, %s, %s);', ('ana', 'a@b.co', 'x'))
+    migrated.save(
+        'INSERT INTO profiles (id_user, name, birth, gender, weight, height) VALUES (%s, %s, %s, %s, %s, %s);',
+        (1, 'Ana', migrated.adapt(date(1990, 1, 1)), 'F', None, 1.6)
+    )
+    for day, weight in ((1, 70), (8, 69.5), (15, 69)):
+        migrated.save(INSERT_WEIGHING, (1, weight, migrated.adapt(datetime(2024, 1, day, 8, 30))))
+    return migrated
+
+
+def test_sqlite_binds_dates_as_iso_strings(connector):
+    assert connector.adapt(date(2024, 1, 2)) == '2024-01-02'
+    assert connector.adapt(datetime(2024, 1, 2, 8, 30)) == '2024-01-02 08:30:00'
+    assert connector.adapt(70.5) == 70.5
+
+
+def test_load_since_a_date(profile):
+    series = WeightSeries.load(profile, 1, since=date(2024, 1, 8))
+    assert series.weights.tolist() == [69.5, 69]
+    assert series.times[0] == np.datetime64('2024-01-08T08:30:00')
+    assert series.height == 1.6
+
+
+def test_load_skips_weighings_without_weight(profile):
+    # the profile trigger logs its empty weight, which is not part of the series
+    assert WeightSeries.load(profile, 1).weights.tolist() == [70, 69.5, 69]
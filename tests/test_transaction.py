@@ -0,0 +1,49 @@
+import pytest
+
+
+@pytest.fixture
+def table(connector):
+    connector.create('CREATE TABLE items (name text unique);')
+    return connector
+
+
+def names(connector) -> list[str]:
+    return [row[0] for row in connector.fetch('SELECT name FROM items ORDER BY name;')]
+
+
+def test_transaction_commits_once(table):
+    with table.transaction() as tx:
+        tx.save('INSERT INTO items (name) VALUES (%s);', ('a',))
+        tx.save_many('INSERT INTO items (name) VALUES (%s);', [('b',), ('c',)])
+        assert tx.fetch('SELECT count(*) FROM items;') == [(3,)]
+    assert names(table) == ['a', 'b', 'c']
+
+
+def test_transaction_rolls_back_on_error(table):
+    with pytest.raises(RuntimeError):
+        with table.transaction() as tx:
+            tx.save('INSERT INTO items (name) VALUES (%s);', ('a',))
+            raise RuntimeError
+    assert names(table) == []
+
+
+def test_savepoint_undoes_only_its_statements(table):
+    with table.transaction() as tx:
+        tx.save('INSERT INTO items (name) VALUES (%s);', ('a',))
+        with pytest.raises(Exception):
+            with tx.savepoint():
+                tx.save('INSERT INTO items (name) VALUES (%s);', ('b',))
+                tx.save('INSERT INTO items (name) VALUES (%s);', ('a',))
+        tx.save('INSERT INTO items (name) VALUES (%s);', ('c',))
+    assert names(table) == ['a', 'c']
+
+
+def test_nested_savepoints(table):
+    with table.transaction() as tx:
+        with tx.savepoint():
+            tx.save('INSERT INTO items (name) VALUES (%s);', ('a',))
+            with pytest.raises(ValueError):
+                with tx.savepoint():
+                    tx.save('INSERT INTO items (name) VALUES (%s);', ('b',))
+                    raise ValueError
+    assert names(table) == ['a']
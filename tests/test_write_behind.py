@@ -0,0 +1,63 @@
+import json
+import pytest
+from database import WriteBehind
+
+
+INSERT = 'INSERT INTO items (name) VALUES (%s);'
+
+
+@pytest.fixture
+def table(connector):
+    connector.create('CREATE TABLE items (id integer primary key, name text unique);')
+    return connector
+
+
+def names(connector) -> list[str]:
+    return [row[0] for row in connector.fetch('SELECT name FROM items ORDER BY id;', cached=False)]
+
+
+def test_writes_are_committed_in_order(table, tmp_path):
+    writes = WriteBehind(table, journal=tmp_path / 'writes.jsonl', linger=0)
+    futures = [writes.save(INSERT, (str(n),)) for n in range(20)]
+    futures.append(writes.submit([(INSERT, ('x',)), ("UPDATE items SET name = 'y' WHERE name = 'x';", None)]))
+    for future in futures:
+        assert future.result(5) is None
+    writes.close()
+    assert names(table) == [*(str(n) for n in range(20)), 'y']
+    assert (tmp_path / 'writes.jsonl').read_text() == ''
+
+
+def test_journal_is_replayed_after_a_crash(table, tmp_path):
+    journal = tmp_path / 'writes.jsonl'
+    journal.write_text(''.join(
+        json.dumps({'seq': seq, 'statements': [[INSERT, [name]]]}) + '\n'
+        for seq, name in ((1, 'committed'), (2, 'lost'), (3, 'also lost'))
+    ) + '{"seq": 4, "statem')
+    (tmp_path / 'writes.jsonl.checkpoint').write_text('1')
+    writes = WriteBehind(table, journal=journal, linger=0)
+    writes.save(INSERT, ('new',)).result(5)
+    writes.close()
+    assert names(table) == ['lost', 'also lost', 'new']
+    assert (tmp_path / 'writes.jsonl.checkpoint').read_text() == '4'
+
+
+def test_failed_write_is_dead_lettered(table, tmp_path):
+    writes = WriteBehind(table, journal=tmp_path / 'writes.jsonl', linger=0.2)
+    good = writes.save(INSERT, ('a',))
+    bad = writes.save(INSERT, ('a',))
+    other = writes.save(INSERT, ('b',))
+    assert good.result(5) is None and other.result(5) is None
+    with pytest.raises(Exception):
+        bad.result(5)
+    writes.close()
+    assert names(table) == ['a', 'b']
+    assert writes.failed == 1
+    failed = [json.loads(line) for line in (tmp_path / 'writes.jsonl.failed').read_text().splitlines()]
+    assert [record['statements'] for record in failed] == [[[INSERT, ['a']]]]
+
+
+def test_closed_queue_rejects_writes(table):
+    writes = WriteBehind(table)
+    writes.close()
+    with pytest.raises(RuntimeError):
+        writes.save(INSERT, ('a',))
@@ -1,8 +1,26 @@
 from ._fields import validate_fields
 from ._name import validate_name
-from ._username import validate_username
-from ._email import validate_email
-from ._password import validate_password
+from ._username import validate_username, validate_username_async
+from ._email import validate_email, validate_email_async
+from ._password import validate_password, validate_password_async
 from ._date import validate_date
 from ._biometric import validate_biometric
 from ._gender import validate_gender
+from ._profile import validate_profile, validate_profile_async
+
+
+_COLUMNS = (
+    'validate_name_column',
+    'validate_date_column',
+    'validate_email_column',
+    'validate_gender_column',
+    'validate_biometric_column',
+)
+
+
+def __getattr__(name: str):
+    # the column validators need NumPy, which is only imported the first time one of them is used
+    if name in _COLUMNS:
+        from . import _columns
+        return getattr(_columns, name)
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
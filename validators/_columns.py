@@ -0,0 +1,187 @@
+import re
+import numpy as np
+from typing import Iterable, Literal
+
+
+EMAIL = re.compile(r'^[a-z0-9_.+-]+@([a-z0-9-]+\.)+[a-z]{2,}$')
+
+DATE = re.compile(r'^([0-9]{2,4})[/-]?([0-9]{2})[/-]?([0-9]{2,4})$')
+
+LIMITS = {'weight': 350, 'height': 3}
+
+
+def _strings(values: Iterable) -> np.ndarray:
+    """
+    Converts a column to a NumPy array of strings, with missing values as empty strings.
+    """
+    array = np.array(values, dtype=object)
+    array[array == None] = ''  # noqa: E711, element-wise comparison
+    return array.astype(str)
+
+
+def _number_groups(strings: np.ndarray, widths: tuple[int, int, int]) -> tuple[np.ndarray, ...]:
+    """
+    Reads three digit groups of fixed widths, separated by '/' or '-', directly from the code points of the
+    strings, without a regex per row.
+
+    Returns:
+        tuple[np.ndarray, ...]: The three groups as integers and a mask of the rows that have this layout.
+    """
+    length = sum(widths) + 2
+    codes = strings.astype(f'U{length}').view(np.uint32).reshape(-1, length)
+    digits = (codes >= ord('0')) & (codes <= ord('9'))
+    separators = (codes == ord('/')) | (codes == ord('-'))
+    first, second = widths[0], widths[0] + 1 + widths[1]
+    layout = np.char.str_len(strings) == length
+    layout &= separators[:, first] & separators[:, second]
+    layout &= np.delete(digits, [first, second], axis=1).all(axis=1)
+    values = np.where(digits, codes - ord('0'), 0).astype(np.int64)
+    groups, start = [], 0
+    for width in widths:
+        group = np.zeros(len(strings), dtype=np.int64)
+        for column in range(start, start + width):
+            group = group * 10 + values[:, column]
+        groups.append(group)
+        start += width + 1
+    return *groups, layout
+
+
+def validate_name_column(values: Iterable[str]) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Column-wise version of `validate_name`: a name must be alphabetic, spaces apart.
+
+    Args:
+        values (Iterable[str]): The names, as a list or NumPy array.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: The names as a string array and a mask that is True on invalid rows.
+    """
+    names = _strings(values)
+    if not names.size:
+        return names, np.zeros(0, dtype=bool)
+    return names, ~np.char.isalpha(np.char.replace(names, ' ', ''))
+
+
+def validate_date_column(
+        values: Iterable[str],
+        _format: Literal['UK', 'US', 'ISO'] = 'UK'
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Column-wise version of `validate_date`, accepting the same layouts and formats.
+
+    The usual layouts (DD/MM/YYYY and YYYY-MM-DD, with either separator) are parsed from the code points of
+    the whole column at once; only the remaining rows go through the regex of the single-field validator.
+
+    Args:
+        values (Iterable[str]): The dates, as a list or NumPy array.
+        _format (Literal['UK', 'US', 'ISO'], optional): The date format to use for parsing. Defaults to 'UK'.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: The dates as a `datetime64[D]` array, NaT on invalid rows, and a mask
+            that is True on invalid rows.
+
+    Raises:
+        ValueError: If the format is not supported.
+    """
+    if _format not in ('UK', 'US', 'ISO'):
+        raise ValueError('Invalid date format')
+    strings = _strings(values)
+    groups = np.zeros((3, len(strings)), dtype=np.int64)
+    matched = np.zeros(len(strings), dtype=bool)
+    for widths in ((2, 2, 4), (4, 2, 2)):
+        *found, layout = _number_groups(strings, widths)
+        layout &= ~matched
+        groups[:, layout] = np.array(found)[:, layout]
+        matched |= layout
+    for row in np.flatnonzero(~matched):
+        if match := DATE.search(strings[row]):
+            groups[:, row] = [int(group) for group in match.groups()]
+            matched[row] = True
+    day, month, year = {
+        'UK': (groups[0], groups[1], groups[2]),
+        'US': (groups[1], groups[0], groups[2]),
+        'ISO': (groups[2], groups[1], groups[0]),
+    }[_format]
+    valid = matched & (year >= 1) & (year <= 9999) & (month >= 1) & (month <= 12) & (day >= 1)
+    months = np.where(valid, (year - 1970) * 12 + month - 1, 0).astype('datetime64[M]')
+    month_days = ((months + 1).astype('datetime64[D]') - months.astype('datetime64[D]')).astype(np.int64)
+    valid &= day <= month_days
+    dates = months.astype('datetime64[D]') + np.where(valid, day - 1, 0)
+    return np.where(valid, dates, np.datetime64('NaT')), ~valid
+
+
+def validate_email_column(values: Iterable[str]) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Column-wise version of the format check of `validate_email`. Uniqueness is not checked.
+
+    Rows without exactly one '@' are rejected for the whole column at once; the rest go through the regex
+    of the single-field validator.
+
+    Args:
+        values (Iterable[str]): The emails, as a list or NumPy array.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: The emails as a string array and a mask that is True on invalid rows.
+    """
+    emails = _strings(values)
+    invalid = np.char.count(emails, '@') != 1
+    for row in np.flatnonzero(~invalid):
+        invalid[row] = EMAIL.search(emails[row]) is None
+    return emails, invalid
+
+
+def validate_gender_column(values: Iterable[str]) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Column-wise version of `validate_gender`: the value must be part of 'FM', and empty values are rejected
+    as the form rejects them.
+
+    Args:
+        values (Iterable[str]): The genders, as a list or NumPy array.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: The genders as a string array and a mask that is True on invalid rows.
+    """
+    genders = _strings(values)
+    return genders, (np.char.find('FM', genders) < 0) | (genders == '')
+
+
+def validate_biometric_column(
+        values: Iterable[str],
+        _biometric: Literal['weight', 'height']
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Column-wise version of `validate_biometric`: commas are accepted as decimal separators, weights must be
+    between 0 and 350 kg and heights between 0 and 3 meters.
+
+    The column is converted to floats in a single NumPy call; rows are parsed one by one only when the column
+    contains values that are not numbers.
+
+    Args:
+        values (Iterable[str]): The weights or heights, as a list or NumPy array.
+        _biometric (Literal['weight', 'height']): Which biometric data the column holds.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: The values rounded to two decimal places, NaN on invalid rows, and a mask
+            that is True on invalid rows.
+
+    Raises:
+        ValueError: If the biometric type is not supported.
+    """
+    if _biometric not in LIMITS:
+        raise ValueError(f'Invalid value for {_biometric}')
+    strings = _strings(values)
+    if not strings.size:
+        return np.zeros(0), np.zeros(0, dtype=bool)
+    strings = np.char.replace(strings, ',', '.')
+    invalid = np.zeros(len(strings), dtype=bool)
+    try:
+        numbers = strings.astype(np.float64)
+    except ValueError:
+        numbers = np.full(len(strings), np.nan)
+        for row, string in enumerate(strings):
+            try:
+                numbers[row] = float(string)
+            except ValueError:
+                invalid[row] = True
+    invalid |= (numbers < 0) | (numbers > LIMITS[_biometric])
+    return np.where(invalid, np.nan, np.round(numbers, 2)), invalid
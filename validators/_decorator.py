@@ -1,10 +1,16 @@
+import inspect
+import functools
 from typing import Callable
 from components import snack_bar, Page
+from profiling import tracer
 
 
 def decorator_validators(function: Callable) -> Callable:
     """
     A decorator that wraps a function to catch and handle exceptions during input validation.
+    Coroutine functions are wrapped by a coroutine, so asynchronous validators can be awaited as usual.
+    The undecorated function stays available as `__wrapped__`, for callers that collect the errors themselves.
+    When profiling is enabled, every call is recorded as a 'validation' stage.
 
     Args:
         function (Callable): The function to be decorated.
@@ -12,6 +18,19 @@ def decorator_validators(function: Callable) -> Callable:
     Returns:
         Callable: A wrapped version of the input function that handles exceptions using a snack bar.
     """
+    function = tracer.trace('validation')(function)
+    if inspect.iscoroutinefunction(function):
+        @functools.wraps(function)
+        async def _async_wrapper(page: Page, *args, **kwargs):
+            try:
+                _input = await function(page, *args, **kwargs)
+            except Exception as e:
+                snack_bar(page, f'{e}.', function)
+            else:
+                return _input
+        return _async_wrapper
+
+    @functools.wraps(function)
     def _wrapper(page: Page, *args, **kwargs):
         try:
             _input = function(page, *args, **kwargs)
@@ -1,13 +1,38 @@
 import re
-from database import dbDev
+from database import dbDev, dbDevAsync, usersIndex
 from components import  Page, TextField
 from ._decorator import decorator_validators
 
 
+QUERY = 'SELECT id FROM users WHERE email = %s;'
+
+
+def _match_email(value: str) -> str:
+    """
+    Checks the email format.
+
+    Args:
+        value (str): The email to be checked.
+
+    Returns:
+        str: The email, if its format is valid.
+
+    Raises:
+        Exception: If the email format is invalid.
+    """
+    try:
+        return re.search(r'^[a-z0-9_.+-]+@([a-z0-9-]+\.)+[a-z]{2,}$', value).string
+    except (TypeError, AttributeError) as error:
+        if isinstance(error, AttributeError):
+            raise Exception('Value is not valid for a email')
+        raise error
+
+
 @decorator_validators
 def validate_email(page: Page, _email: TextField) -> str | None:
     """
-    Validates the email format and checks for uniqueness in the database.
+    Validates the email format and checks for uniqueness in the database. The database is only queried when
+    the email may be present in the in-memory index.
 
     Args:
         page (Page): The page on which the validation occurs.
@@ -20,13 +45,31 @@ def validate_email(page: Page, _email: TextField) -> str | None:
         ValueError: If the email is already registered.
         Exception: If the email format is invalid.
     """
-    try:
-        email = re.search(r'^[a-z0-9_.+-]+@([a-z0-9-]+\.)+[a-z]{2,}$', _email.value).string
-        if dbDev.fetch('SELECT id FROM users WHERE email = %s;', (email,)):
+    email = _match_email(_email.value)
+    if usersIndex.might_contain('email', email):
+        if dbDev.fetch(QUERY, (email,), primary=True):
             raise ValueError('Email already registered!')
-    except (TypeError, ValueError, AttributeError) as error:
-        if isinstance(error, AttributeError):
-            error = Exception('Value is not valid for a email')
-        raise error
-    else:
-        return email
+    return email
+
+
+@decorator_validators
+async def validate_email_async(page: Page, _email: TextField) -> str | None:
+    """
+    Asynchronous version of `validate_email`, for use in async event handlers.
+
+    Args:
+        page (Page): The page on which the validation occurs.
+        _email (TextField): The TextField containing the email to be validated.
+
+    Returns:
+        str | None: Returns the email if valid, raises a ValueError if invalid or already registered.
+
+    Raises:
+        ValueError: If the email is already registered.
+        Exception: If the email format is invalid.
+    """
+    email = _match_email(_email.value)
+    if usersIndex.might_contain('email', email):
+        if await dbDevAsync.fetch(QUERY, (email,), primary=True):
+            raise ValueError('Email already registered!')
+    return email
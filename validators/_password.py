@@ -1,8 +1,20 @@
-from passlib.hash import pbkdf2_sha256 as pbk
+from hashing import hasher
 from components import  Page, TextField
 from ._decorator import decorator_validators
 
 
+def _check_password(_password: TextField, _confirm: TextField) -> None:
+    """
+    Checks the password length and its confirmation.
+
+    Raises:
+        ValueError: If the password is less than 6 characters or does not match the confirmation.
+    """
+    if len(_password.value) < 6:
+        raise ValueError('Password must be at least 6 characters')
+    elif _password.value != _confirm.value:
+        raise ValueError('Confirm password must equal password')
+
 
 @decorator_validators
 def validate_password(page: Page, _password: TextField, _confirm: TextField) -> str | None:
@@ -20,9 +32,25 @@ def validate_password(page: Page, _password: TextField, _confirm: TextField) ->
     Raises:
         ValueError: If the password is less than 6 characters or does not match the confirmation.
     """
-    if len(_password.value) < 6:
-        raise ValueError('Password must be at least 6 characters')
-    elif _password.value != _confirm.value:
-        raise ValueError('Confirm password must equal password')
-    else:
-        return pbk.hash(_password.value)
+    _check_password(_password, _confirm)
+    return hasher.hash(_password.value)
+
+
+@decorator_validators
+async def validate_password_async(page: Page, _password: TextField, _confirm: TextField) -> str | None:
+    """
+    Asynchronous version of `validate_password`, for use in async event handlers.
+
+    Args:
+        page (Page): The page on which the validation occurs.
+        _password (TextField): The TextField containing the password.
+        _confirm (TextField): The TextField containing the password confirmation.
+
+    Returns:
+        str | None: Returns the hashed password if valid, raises a ValueError if invalid.
+
+    Raises:
+        ValueError: If the password is less than 6 characters or does not match the confirmation.
+    """
+    _check_password(_password, _confirm)
+    return await hasher.hash_async(_password.value)
@@ -0,0 +1,147 @@
+import asyncio
+from hashing import hasher
+from database import dbDev, dbDevAsync, usersIndex
+from components import Page, TextField, Dropdown
+from ._decorator import decorator_validators
+from ._name import validate_name
+from ._date import validate_date
+from ._email import _match_email
+from ._password import _check_password
+from ._gender import validate_gender
+from ._biometric import validate_biometric
+
+
+QUERY = 'SELECT username, email FROM users WHERE username = %s OR email = %s;'
+
+
+def _check_fields(page: Page, fields: tuple) -> tuple[list, list[str]]:
+    """
+    Runs every validator that does not need the database over the registration fields, collecting the errors
+    instead of stopping at the first one.
+
+    Args:
+        page (Page): The page on which the validation occurs.
+        fields (tuple): The name, birth date, username, email, password, confirmation, gender, weight and
+            height fields, in this order.
+
+    Returns:
+        tuple[list, list[str]]: The validated values, with None where a field failed, and the error messages.
+    """
+    _name, _birth, _username, _email, _password, _confirm, _gender, _weight, _height = fields
+    empty = [field for field in fields if field.value is None or field.value == '']
+    errors = [f'Field "{field.label}" cannot be null' for field in empty]
+    checks = [
+        ((_name,), lambda: validate_name.__wrapped__(page, _name)),
+        ((_birth,), lambda: validate_date.__wrapped__(page, _birth)),
+        ((_username,), lambda: _username.value),
+        ((_email,), lambda: _match_email(_email.value)),
+        ((_password, _confirm), lambda: _check_password(_password, _confirm) or _password.value),
+        ((_gender,), lambda: validate_gender.__wrapped__(page, _gender)),
+        ((_weight,), lambda: validate_biometric.__wrapped__(page, _weight, 'weight')),
+        ((_height,), lambda: validate_biometric.__wrapped__(page, _height, 'height')),
+    ]
+    values = []
+    for depends, check in checks:
+        value = None
+        if not any(field.value is None or field.value == '' for field in depends):
+            try:
+                value = check()
+            except Exception as error:
+                errors.append(f'{depends[0].label}: {error}')
+        values.append(value)
+    return values, errors
+
+
+def _might_exist(username: str | None, email: str | None) -> bool:
+    """
+    Checks the in-memory index to decide whether the uniqueness query is needed at all.
+    """
+    return bool(username and email) and (
+        usersIndex.might_contain('username', username) or usersIndex.might_contain('email', email)
+    )
+
+
+def _check_unique(users: list[tuple] | None, username: str, email: str) -> list[str]:
+    """
+    Reports which of the username and email are already registered, given the users that matched either.
+
+    Args:
+        users (list[tuple] | None): The (username, email) rows returned by the uniqueness query.
+        username (str): The username being registered.
+        email (str): The email being registered.
+
+    Returns:
+        list[str]: The error messages.
+    """
+    errors = []
+    if any(row[0].casefold() == username.casefold() for row in users or []):
+        errors.append('Username already exists')
+    if any(row[1].casefold() == email.casefold() for row in users or []):
+        errors.append('Email already registered!')
+    return errors
+
+
+@decorator_validators
+def validate_profile(page: Page, *fields: TextField | Dropdown) -> tuple | None:
+    """
+    Validates the whole registration form at once and reports every error in a single snack bar.
+
+    The validators that do not need the database run in one pass, the username and email are checked for
+    uniqueness with a single query, skipped when the in-memory index shows both are new, and the password is
+    only hashed when everything else is valid.
+
+    Args:
+        page (Page): The page on which the validation occurs.
+        *fields (TextField | Dropdown): The name, birth date, username, email, password, confirmation, gender,
+            weight and height fields, in this order.
+
+    Returns:
+        tuple | None: The name, birth date, username, email, hashed password, gender, weight and height, ready
+            for `save_profile`, or None if any field is invalid.
+
+    Raises:
+        ValueError: With every error message found, one per line.
+    """
+    values, errors = _check_fields(page, fields)
+    username, email = values[2], values[3]
+    if _might_exist(username, email):
+        errors += _check_unique(dbDev.fetch(QUERY, (username, email), primary=True), username, email)
+    if errors:
+        raise ValueError('\n'.join(errors))
+    values[4] = hasher.hash(values[4])
+    return tuple(values)
+
+
+@decorator_validators
+async def validate_profile_async(page: Page, *fields: TextField | Dropdown) -> tuple | None:
+    """
+    Asynchronous version of `validate_profile`, for use in async event handlers. When the form is otherwise
+    valid, the password is hashed while the uniqueness query runs.
+
+    Args:
+        page (Page): The page on which the validation occurs.
+        *fields (TextField | Dropdown): The name, birth date, username, email, password, confirmation, gender,
+            weight and height fields, in this order.
+
+    Returns:
+        tuple | None: The name, birth date, username, email, hashed password, gender, weight and height, ready
+            for `save_profile_async`, or None if any field is invalid.
+
+    Raises:
+        ValueError: With every error message found, one per line.
+    """
+    values, errors = _check_fields(page, fields)
+    username, email = values[2], values[3]
+    if errors:
+        if _might_exist(username, email):
+            errors += _check_unique(await dbDevAsync.fetch(QUERY, (username, email), primary=True), username, email)
+        raise ValueError('\n'.join(errors))
+    if not _might_exist(username, email):
+        values[4] = await hasher.hash_async(values[4])
+        return tuple(values)
+    users, values[4] = await asyncio.gather(
+        dbDevAsync.fetch(QUERY, (username, email), primary=True), hasher.hash_async(values[4])
+    )
+    if errors := _check_unique(users, username, email):
+        raise ValueError('\n'.join(errors))
+    return tuple(values)
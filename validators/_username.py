@@ -1,12 +1,37 @@
-from database import dbDev
+from database import dbDev, dbDevAsync, usersIndex
 from components import  Page, TextField
 from ._decorator import decorator_validators
 
 
+QUERY = 'SELECT id FROM users WHERE username = %s;'
+
+
 @decorator_validators
 def validate_username(page: Page, _username: TextField) -> str | None:
     """
-    Validates the uniqueness of the username in the database.
+    Validates the uniqueness of the username in the database. The database is only queried when the username
+    may be present in the in-memory index.
+
+    Args:
+        page (Page): The page on which the validation occurs.
+        _username (TextField): The TextField containing the username to be validated.
+
+    Returns:
+        str | None: Returns the username if valid, raises a ValueError if it already exists.
+
+    Raises:
+        ValueError: If the username already exists in the database.
+    """
+    if usersIndex.might_contain('username', _username.value):
+        if dbDev.fetch(QUERY, (_username.value,), primary=True):
+            raise ValueError('Username already exists')
+    return _username.value
+
+
+@decorator_validators
+async def validate_username_async(page: Page, _username: TextField) -> str | None:
+    """
+    Asynchronous version of `validate_username`, for use in async event handlers.
 
     Args:
         page (Page): The page on which the validation occurs.
@@ -18,6 +43,7 @@ def validate_username(page: Page, _username: TextField) -> str | None:
     Raises:
         ValueError: If the username already exists in the database.
     """
-    if dbDev.fetch('SELECT id FROM users WHERE username = %s;', (_username.value,)):
-        raise ValueError('Username already exists')
+    if usersIndex.might_contain('username', _username.value):
+        if await dbDevAsync.fetch(QUERY, (_username.value,), primary=True):
+            raise ValueError('Username already exists')
     return _username.value
@@ -1,2 +1,4 @@
-from ._view_new_profile import view_new_profile
-from ._view_login import view_login
\ No newline at end of file
+from ._router import navigate, route_change
+from ._view_new_profile import NewProfileView
+from ._view_login import LoginView
+from ._view_profiles import ProfilesView
@@ -0,0 +1,58 @@
+import flet as ft
+from components import app_window, batch_updates, refresh
+
+
+HOME = '/register'
+
+LOGIN = '/login'
+
+ROUTES: dict[str, tuple[type[ft.View], int, int]] = {}
+
+# routes that only users flagged as admins in the database reach once logged in
+ADMIN_ROUTES: set[str] = set()
+
+
+def route(path: str, width: int, height: int, admin: bool = False):
+    def decorator(view: type[ft.View]) -> type[ft.View]:
+        ROUTES[path] = (view, width, height)
+        if admin:
+            ADMIN_ROUTES.add(path)
+        return view
+    return decorator
+
+
+def is_admin(page: ft.Page) -> bool:
+    # the login view keeps the logged in user in the session, as (id, name, birth, username, email, is_admin)
+    return (user := page.session.get('user')) is not None and bool(user[5])
+
+
+def get_view(page: ft.Page, path: str) -> ft.View:
+    # built once per session and reused on every navigation
+    if (view := page.session.get(f'view:{path}')) is None:
+        view = ROUTES[path][0](page)
+        page.session.set(f'view:{path}', view)
+    return view
+
+
+def show(page: ft.Page, path: str) -> None:
+    path = path if path in ROUTES else HOME
+    if path in ADMIN_ROUTES and not is_admin(page):
+        path = LOGIN
+    view = get_view(page, path)
+    view.reset()
+    page.views.clear()
+    page.views.append(view)
+    app_window(page, *ROUTES[path][1:])
+
+
+def navigate(page: ft.Page, path: str) -> None:
+    with batch_updates(page):
+        page.route = path
+        show(page, path)
+        refresh(page)
+
+
+def route_change(event: ft.RouteChangeEvent) -> None:
+    with batch_updates(event.page):
+        show(event.page, event.route)
+        refresh(event.page)
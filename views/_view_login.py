@@ -1,59 +1,85 @@
 import flet as ft
-from typing import Callable
-from components import app_window, app_page, top_heading, text_field
+from components import heading, text_field, batch_updates, refresh
 from validators import validate_fields
-from functions import make_login
+from functions import make_login_async
+from profiling import tracer
+from ._router import route, navigate, is_admin
 
 
-def view_login(page: ft.Page, view_new_profile: Callable = None) -> None:
-    def register_user(event):
-        view_new_profile(page, view_login)
+@route('/login', 450, 550)
+class LoginView(ft.View):
+    def __init__(self, page: ft.Page):
+        self.__page = page
+        self.fields = [
+            text_field('Username', width=420),
+            text_field('Password', width=420, password=True),
+        ]
+        # the profile directory is only offered to admins, once they log in
+        self.profiles = ft.TextButton(
+            text='Profiles',
+            on_click=self.show_profiles,
+            visible=False,
+            width=200,
+            height=40,
+            style=ft.ButtonStyle(color=ft.colors.BLACK)
+        )
+        super().__init__(
+            route='/login',
+            horizontal_alignment=ft.CrossAxisAlignment.CENTER,
+            vertical_alignment=ft.MainAxisAlignment.CENTER,
+            bgcolor=ft.colors.BLUE_GREY_50,
+            controls=[
+                heading('Login'),
+                ft.Container(
+                    ft.Row(controls=self.fields, wrap=True),
+                    padding=ft.padding.only(top=25)
+                ),
+                ft.Container(
+                    ft.Column(
+                        controls=[
+                            ft.ElevatedButton(
+                                text='Login',
+                                on_click=self.login,
+                                width=250,
+                                height=50,
+                                bgcolor=ft.colors.INDIGO,
+                                color=ft.colors.WHITE
+                            ),
+                            ft.TextButton(
+                                text='New User',
+                                on_click=self.register_user,
+                                width=200,
+                                height=40,
+                                style=ft.ButtonStyle(color=ft.colors.BLACK)
+                            ),
+                            self.profiles,
+                        ],
+                        horizontal_alignment=ft.CrossAxisAlignment.CENTER,
+                        spacing=15
+                    ),
+                    padding=ft.padding.only(top=25),
+                )
+            ],
+        )
 
-    def login(event):
-        if not validate_fields(page, *_fields): return
-        else:
-            user = make_login(page, *_fields)
-            print(user)
+    def reset(self) -> None:
+        for field in self.fields:
+            field.value = None
+        self.profiles.visible = is_admin(self.__page)
 
+    def register_user(self, event):
+        navigate(self.__page, '/register')
 
-    page.controls.clear()
-    app_window(page, 450, 550)
-    app_page(page)
-    top_heading(page, 'Login')
-    page.horizontal_alignment = ft.CrossAxisAlignment.CENTER
-    page.vertical_alignment = ft.MainAxisAlignment.CENTER
-    _fields = [
-        text_field('Username', width=420),
-        text_field('Password', width=420, password=True),
-    ]
-    page.add(
-        ft.Container(
-            ft.Row(controls=_fields, wrap=True),
-            padding=ft.padding.only(top=25)
-        ),
-        ft.Container(
-            ft.Column(
-                controls=[
-                    ft.ElevatedButton(
-                        text='Login',
-                        on_click=login,
-                        width=250,
-                        height=50,
-                        bgcolor=ft.colors.INDIGO,
-                        color=ft.colors.WHITE
-                    ),
-                    ft.TextButton(
-                        text='New User',
-                        on_click=register_user,
-                        width=200,
-                        height=40,
-                        style=ft.ButtonStyle(color=ft.colors.BLACK)
-                    ),
-                ],
-                horizontal_alignment=ft.CrossAxisAlignment.CENTER,
-                spacing=15
-            ),
-            padding=ft.padding.only(top=25),
-        )
-    )
-    page.update()
\ No newline at end of file
+    def show_profiles(self, event):
+        navigate(self.__page, '/profiles')
+
+    @tracer.handler('login')
+    async def login(self, event):
+        with batch_updates(self.__page):
+            if not validate_fields(self.__page, *self.fields): return
+            else:
+                user = await make_login_async(self.__page, *self.fields)
+                if user is not None:
+                    self.__page.session.set('user', user)
+                    self.profiles.visible = is_admin(self.__page)
+                    refresh(self.__page)
@@ -1,51 +1,50 @@
 import flet as ft
-from typing import Callable
-from components import app_window, app_page, top_heading, text_field, dropdown_field
+from components import heading, text_field, dropdown_field, batch_updates
 from validators import *
-from functions import clear_fields, save_profile
+from functions import save_profile_async
+from profiling import tracer
+from ._router import route, navigate
 
 
-def view_new_profile(page: ft.Page, view_login: Callable = None) -> None:
+@route('/register', 700, 560)
+class NewProfileView(ft.View):
+    def __init__(self, page: ft.Page):
+        self.__page = page
+        self.fields = [
+            text_field('Name', width=440, tooltip='Alphabetic characters only.'),
+            text_field('Birth Date', width=200, hint_text='DD/MM/YYYY'),
+            text_field('Username', width=200),
+            text_field('Email', width=440, hint_text='example@email.com'),
+            text_field('Password', width=318, password=True, tooltip='Minimum of 6 characters.'),
+            text_field('Confirm Password', width=318, password=True),
+            dropdown_field('Gender', ['M', 'F']),
+            text_field('Weight', width=160, suffix_text='kilograms', tooltip='Use a comma (,) to separate decimal places.'),
+            text_field('Height', width=160, suffix_text='meters', tooltip='Use a comma (,) to separate decimal places.'),
+        ]
+        btn = ft.ElevatedButton('click', on_click=self.save, width=200, height=40, bgcolor=ft.colors.INDIGO, color=ft.colors.WHITE)
+        super().__init__(
+            route='/register',
+            horizontal_alignment=ft.CrossAxisAlignment.CENTER,
+            vertical_alignment=ft.MainAxisAlignment.CENTER,
+            bgcolor=ft.colors.BLUE_GREY_50,
+            controls=[
+                heading('Register a new user'),
+                ft.Row(controls=self.fields[:2], alignment=ft.MainAxisAlignment.CENTER),
+                ft.Row(controls=self.fields[2:4], alignment=ft.MainAxisAlignment.CENTER),
+                ft.Row(controls=self.fields[4:6], alignment=ft.MainAxisAlignment.CENTER),
+                ft.Container(ft.Row(controls=self.fields[6:]), padding=ft.padding.only(left=10, bottom=25)),
+                ft.Row(controls=[btn], alignment=ft.MainAxisAlignment.CENTER)
+            ],
+        )
 
-    def save(event):
-        if not validate_fields(page, *_fields): return
-        elif not (_name := validate_name(page, _fields[0])): return
-        elif not (_birth := validate_date(page, _fields[1])): return
-        elif not (_username := validate_username(page, _fields[2])): return
-        elif not (_email := validate_email(page, _fields[3])): return
-        elif not (_password := validate_password(page, _fields[4], _fields[5])): return
-        elif not (_gender := validate_gender(page, _fields[6])): return
-        elif not (_weight := validate_biometric(page, _fields[7], 'weight')): return
-        elif not (_height := validate_biometric(page, _fields[8], 'height')): return
-        else:
-            save_profile(page, _name, _birth, _username, _email, _password, _gender, _weight, _height)
-            view_login(page, view_new_profile)
-        clear_fields(page, *_fields)
-
-    page.controls.clear()
-    app_window(page, 700, 560)
-    app_page(page)
-    top_heading(page, 'Register a new user')
-    page.horizontal_alignment = ft.CrossAxisAlignment.CENTER
-    page.vertical_alignment = ft.MainAxisAlignment.CENTER
-    _fields = [
-        text_field('Name', width=440, tooltip='Alphabetic characters only.'),
-        text_field('Birth Date', width=200, hint_text='DD/MM/YYYY'),
-        text_field('Username', width=200),
-        text_field('Email', width=440, hint_text='example@email.com'),
-        text_field('Password', width=318, password=True, tooltip='Minimum of 6 characters.'),
-        text_field('Confirm Password', width=318, password=True),
-        dropdown_field('Gender', ['M', 'F']),
-        text_field('Weight', width=160, suffix_text='kilograms', tooltip='Use a comma (,) to separate decimal places.'),
-        text_field('Height', width=160, suffix_text='meters', tooltip='Use a comma (,) to separate decimal places.'),
-    ]
-    btn = ft.ElevatedButton('click', on_click=save, width=200, height=40, bgcolor=ft.colors.INDIGO, color=ft.colors.WHITE)
-    page.add(
-        ft.Row(controls=_fields[:2], alignment=ft.MainAxisAlignment.CENTER),
-        ft.Row(controls=_fields[2:4], alignment=ft.MainAxisAlignment.CENTER),
-        ft.Row(controls=_fields[4:6], alignment=ft.MainAxisAlignment.CENTER),
-        ft.Container(ft.Row(controls=_fields[6:]), padding=ft.padding.only(left=10, bottom=25)),
-        ft.Row(controls=[btn], alignment=ft.MainAxisAlignment.CENTER)
-    )
-    page.update()
+    def reset(self) -> None:
+        for field in self.fields:
+            field.value = None
 
+    @tracer.handler('save_profile')
+    async def save(self, event):
+        with batch_updates(self.__page):
+            if not (_profile := await validate_profile_async(self.__page, *self.fields)): return
+            else:
+                await save_profile_async(self.__page, *_profile)
+                navigate(self.__page, '/login')
@@ -0,0 +1,156 @@
+import asyncio
+from collections import deque
+import flet as ft
+from components import heading, batch_updates, refresh
+from functions import list_profiles_async
+from ._router import route, navigate
+
+
+PAGE_SIZE = 50
+
+ROW_HEIGHT = 48
+
+# pages of rows kept in the list; pages scrolled far out of view are dropped and read again on the way back
+MAX_PAGES = 4
+
+
+def profile_row(profile: tuple) -> ft.Container:
+    _, name, username, email, birth, gender, weight, height = profile
+    return ft.Container(
+        ft.Row(
+            controls=[
+                ft.Text(name, width=220, weight=ft.FontWeight.BOLD, no_wrap=True),
+                ft.Text(username, width=140, no_wrap=True),
+                ft.Text(email, width=240, no_wrap=True),
+                ft.Text(gender or '', width=30),
+                ft.Text(f'{weight} kg' if weight is not None else '', width=80),
+                ft.Text(f'{height} m' if height is not None else '', width=60),
+            ],
+        ),
+        height=ROW_HEIGHT,
+        padding=ft.padding.symmetric(horizontal=15),
+        border=ft.border.only(bottom=ft.BorderSide(1, ft.colors.BLUE_GREY_100)),
+    )
+
+
+@route('/profiles', 900, 700, admin=True)
+class ProfilesView(ft.View):
+    def __init__(self, page: ft.Page):
+        self.__page = page
+        self.__after = 0
+        self.__exhausted = False
+        self.__prefetch: asyncio.Task | None = None
+        self.__generation = 0
+        self.__lock = asyncio.Lock()
+        # the keyset cursor and row count of each page in the list, and the cursors of the pages dropped above it
+        self.__window: deque[tuple[int, int]] = deque()
+        self.__above: list[int] = []
+        # every row has the same height, so the list can lay out and build only the rows in view
+        self.rows = ft.ListView(
+            expand=True,
+            item_extent=ROW_HEIGHT,
+            on_scroll=self.scrolled,
+            on_scroll_interval=100,
+        )
+        super().__init__(
+            route='/profiles',
+            bgcolor=ft.colors.BLUE_GREY_50,
+            controls=[
+                heading('Profiles'),
+                ft.Container(self.rows, expand=True, bgcolor=ft.colors.WHITE),
+                ft.Row(
+                    controls=[
+                        ft.TextButton(
+                            text='Back',
+                            on_click=self.back,
+                            width=200,
+                            height=40,
+                            style=ft.ButtonStyle(color=ft.colors.BLACK)
+                        ),
+                    ],
+                    alignment=ft.MainAxisAlignment.CENTER
+                ),
+            ],
+        )
+
+    def reset(self) -> None:
+        if self.__prefetch is not None:
+            self.__prefetch.cancel()
+        self.__generation += 1
+        self.__after, self.__exhausted, self.__prefetch = 0, False, None
+        self.__window.clear()
+        self.__above.clear()
+        self.rows.controls.clear()
+        self.__page.run_task(self.more)
+
+    def back(self, event):
+        navigate(self.__page, '/login')
+
+    async def more(self) -> None:
+        async with self.__lock:
+            if self.__exhausted:
+                return
+            generation, after = self.__generation, self.__after
+            task = self.__prefetch or asyncio.create_task(list_profiles_async(after, PAGE_SIZE))
+            self.__prefetch = None
+            try:
+                profiles = await task
+            except asyncio.CancelledError:
+                # the view was reset while the page was being read
+                if generation != self.__generation:
+                    return
+                raise
+            if generation != self.__generation:
+                return
+            if len(profiles) < PAGE_SIZE:
+                self.__exhausted = True
+            if profiles:
+                self.__after = profiles[-1][0]
+            if not self.__exhausted:
+                # the next page is read while this one is shown, so scrolling rarely waits for the database
+                self.__prefetch = asyncio.create_task(list_profiles_async(self.__after, PAGE_SIZE))
+            if not profiles:
+                return
+            with batch_updates(self.__page):
+                self.rows.controls.extend(profile_row(profile) for profile in profiles)
+                self.__window.append((after, len(profiles)))
+                if len(self.__window) > MAX_PAGES:
+                    start, count = self.__window.popleft()
+                    self.__above.append(start)
+                    del self.rows.controls[:count]
+                    # the rows above the viewport are gone, so the list moves up by their height to stay in place
+                    self.rows.scroll_to(delta=-count * ROW_HEIGHT, duration=0)
+                refresh(self.__page)
+
+    async def earlier(self) -> None:
+        async with self.__lock:
+            if not self.__above:
+                return
+            generation, after = self.__generation, self.__above[-1]
+            profiles = await list_profiles_async(after, PAGE_SIZE)
+            if generation != self.__generation:
+                return
+            self.__above.pop()
+            with batch_updates(self.__page):
+                self.rows.controls[:0] = [profile_row(profile) for profile in profiles]
+                self.__window.appendleft((after, len(profiles)))
+                self.rows.scroll_to(delta=len(profiles) * ROW_HEIGHT, duration=0)
+                if len(self.__window) > MAX_PAGES:
+                    start, count = self.__window.pop()
+                    del self.rows.controls[-count:]
+                    # the bottom page is read again by its cursor when the list is scrolled down to it
+                    if self.__prefetch is not None:
+                        self.__prefetch.cancel()
+                    self.__after, self.__exhausted, self.__prefetch = start, False, None
+                refresh(self.__page)
+
+    async def scrolled(self, event: ft.OnScrollEvent):
+        # loads the next page when less than half a page of rows is left below the viewport, or the dropped page
+        # above it when as little is left above; scroll events that arrive while a page is loading are dropped
+        # instead of queueing more pages
+        if self.__lock.locked():
+            return
+        if event.max_scroll_extent - event.pixels < PAGE_SIZE * ROW_HEIGHT / 2:
+            await self.more()
+        elif self.__above and event.pixels < PAGE_SIZE * ROW_HEIGHT / 2:
+            await self.earlier()